@@ -0,0 +1,61 @@
+"""Сравнение последовательной и параллельной загрузки страниц hh_API.
+
+Запуск: python -m benchmarks.bench_hh_api
+"""
+import asyncio
+import time
+
+from src.async_hh_api import AsyncHhAPI
+from src.hh_api import RequestScheduler, hh_API
+from tests.stub_server import StubHHServer
+
+
+def measure(api, keyword, amount):
+    """Время загрузки amount вакансий"""
+    start = time.perf_counter()
+    vacancies = api.get_vacancies(keyword, amount)
+    return time.perf_counter() - start, len(vacancies)
+
+
+def main(amount=2000, delay=0.05, workers=(1, 4, 8, 16)):
+    with StubHHServer(found=amount, delay=delay) as server:
+        print(f"Вакансий: {amount}, задержка сервера: {delay * 1000:.0f} мс на страницу")
+        baseline = None
+        for max_workers in workers:
+            # Лимиты планировщика сняты, чтобы измерять только параллельность
+            scheduler = RequestScheduler(rate=1000, max_in_flight=max_workers)
+            api = hh_API(max_workers=max_workers, base_url=server.url, scheduler=scheduler)
+            elapsed, count = measure(api, 'python', amount)
+            baseline = baseline or elapsed
+            print(f"max_workers={max_workers:>2}: {elapsed:.3f} с, получено {count}, "
+                  f"ускорение x{baseline / elapsed:.1f}")
+
+
+def main_many(keywords=20, amount=500, delay=0.05):
+    """Много ключевых слов: последовательный клиент против AsyncHhAPI"""
+    words = [f'keyword {i}' for i in range(keywords)]
+    with StubHHServer(found=amount, delay=delay) as server:
+        print(f"\nКлючевых слов: {keywords}, вакансий на слово: {amount}")
+
+        api = hh_API(base_url=server.url, scheduler=RequestScheduler(rate=1000))
+        start = time.perf_counter()
+        for word in words:
+            api.get_vacancies(word, amount)
+        sequential = time.perf_counter() - start
+        print(f"hh_API последовательно: {sequential:.3f} с")
+
+        async def run(async_api):
+            try:
+                return await async_api.search_many(words, amount)
+            finally:
+                await async_api.close()
+
+        start = time.perf_counter()
+        asyncio.run(run(AsyncHhAPI(base_url=server.url, limit_per_host=32, rate=1000)))
+        elapsed = time.perf_counter() - start
+        print(f"AsyncHhAPI.search_many: {elapsed:.3f} с, ускорение x{sequential / elapsed:.1f}")
+
+
+if __name__ == '__main__':
+    main()
+    main_many()
@@ -0,0 +1,60 @@
+"""Размер файла и время записи и чтения вакансий в разных форматах.
+
+Запуск: python -m benchmarks.bench_serializers
+"""
+import os
+import tempfile
+import time
+
+from src.serializers import get_serializer, loads, zstandard
+from src.vacancy import Vacancy
+
+
+def make_data(count):
+    """Данные файла вакансий из count записей"""
+    return {'items': [
+        Vacancy(
+            name=f'Python разработчик {i}',
+            city=f'Город {i % 50}',
+            url=f'https://hh.ru/vacancy/{i}',
+            salary={
+                'from': 50000 + i % 1000 * 100,
+                'to': 150000 + i % 1000 * 100,
+                'currency': 'RUR',
+                'gross': i % 2 == 0
+            },
+            vacancy_id=str(i)
+        ).to_dict()
+        for i in range(count)
+    ]}
+
+
+def main(count=100_000):
+    formats = ['json', 'json-compact', 'marshal', 'json-compact+gzip', 'marshal+gzip']
+    if zstandard is not None:
+        formats += ['json-compact+zstd', 'marshal+zstd']
+
+    data = make_data(count)
+    print(f"Вакансий: {count}")
+    with tempfile.TemporaryDirectory() as directory:
+        for name in formats:
+            filename = os.path.join(directory, 'vacancies')
+            serializer = get_serializer(name)
+
+            start = time.perf_counter()
+            with open(filename, 'wb') as f:
+                f.write(serializer.dumps(data))
+            write_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            with open(filename, 'rb') as f:
+                loaded = loads(f.read())
+            load_time = time.perf_counter() - start
+            assert len(loaded['items']) == count
+
+            size = os.path.getsize(filename)
+            print(f"{name:<18} {size / 1024 / 1024:7.2f} МБ  запись {write_time:6.3f} с  чтение {load_time:6.3f} с")
+
+
+if __name__ == '__main__':
+    main()
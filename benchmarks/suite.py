@@ -0,0 +1,329 @@
+"""Набор бенчмарков хранилищ, клиента HH API и постраничного просмотра.
+
+Каждый бенчмарк запускается на синтетических данных заданного размера,
+результат содержит процентили времени операции и пиковую память.
+Результаты сравниваются с сохраненной базовой линией.
+
+Базовая линия зависит от машины, поэтому в репозиторий не входит. Перед
+первым сравнением ее нужно сохранить на той же машине, где запускаются
+последующие замеры; без нее сравнение пропускается:
+    python -m benchmarks.suite --save-baseline
+
+Запуск:
+    python -m benchmarks.suite --sizes 1000,10000 --output results.json
+    python -m benchmarks.suite --sizes 1000000 --filter sqlite.
+"""
+import argparse
+from contextlib import ExitStack
+import itertools
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+from src.file_handler import FileHandlerJSON, FileHandlerJSONL, FileHandlerSQLite
+from src.hh_api import RequestScheduler, hh_API
+from src.query import In, Query, Range
+from src.vacancy import Vacancy
+from tests.stub_server import StubHHServer
+
+BASELINE_FILE = os.path.join(os.path.dirname(__file__), 'baseline.json')
+DEFAULT_SIZES = (1000, 10000)
+# Допустимое ухудшение медианы времени и пиковой памяти относительно базовой линии
+DEFAULT_THRESHOLD = 0.25
+
+CITIES = ['Москва', 'Санкт-Петербург', 'Казань', 'Новосибирск', 'Екатеринбург', 'Алматы', 'Минск']
+TITLES = ['Python разработчик', 'Java developer', 'Аналитик данных', 'DevOps инженер', 'Тестировщик']
+CURRENCIES = ['RUR'] * 8 + ['USD', 'EUR']
+
+
+def make_vacancy(index, rng):
+    """Синтетическая вакансия; примерно у пятой части зарплата не указана"""
+    salary = None
+    if rng.random() > 0.2:
+        salary_from = rng.randrange(30, 400) * 1000
+        salary = {
+            'from': salary_from,
+            'to': salary_from + rng.randrange(0, 150) * 1000 if rng.random() > 0.3 else None,
+            'currency': rng.choice(CURRENCIES),
+            'gross': rng.random() > 0.5
+        }
+    return Vacancy(
+        name=f'{rng.choice(TITLES)} {index}',
+        city=rng.choice(CITIES),
+        url=f'https://hh.ru/vacancy/{index}',
+        salary=salary,
+        vacancy_id=str(index)
+    )
+
+
+def make_vacancies(count, seed=0, start=0):
+    """Воспроизводимый список из count синтетических вакансий с ID от start"""
+    rng = random.Random(seed + start)
+    return [make_vacancy(index, rng) for index in range(start, start + count)]
+
+
+BACKENDS = {
+    'json': lambda directory: FileHandlerJSON(os.path.join(directory, 'vacancies.json')),
+    'jsonl': lambda directory: FileHandlerJSONL(os.path.join(directory, 'vacancies.jsonl')),
+    'sqlite': lambda directory: FileHandlerSQLite(os.path.join(directory, 'vacancies.db')),
+}
+
+BENCHMARKS = {}
+
+
+def benchmark(name, repeat=5, backends=None):
+    """Регистрация бенчмарка.
+
+    Функция получает размер данных, рабочий каталог и ExitStack для
+    освобождения ресурсов (или заполненное хранилище, если указаны backends)
+    и число запусков операции, выполняет подготовку, включая создание
+    входных данных для каждого запуска, и возвращает измеряемую операцию.
+    """
+    def decorator(func):
+        if backends is None:
+            BENCHMARKS[name] = (func, repeat)
+        else:
+            for backend in backends:
+                BENCHMARKS[f'{backend}.{name}'] = (_with_backend(func, backend), repeat)
+        return func
+    return decorator
+
+
+def _with_backend(func, backend):
+    def setup(size, directory, stack, runs):
+        handler = BACKENDS[backend](directory)
+        if hasattr(handler, 'close'):
+            stack.callback(handler.close)
+        handler.add_vacancies(make_vacancies(size))
+        return func(handler, size, runs)
+    return setup
+
+
+def _reopen(handler):
+    """Новый экземпляр того же хранилища без кэша в памяти"""
+    if isinstance(handler, FileHandlerSQLite):
+        return handler
+    return type(handler)(handler._FileHandler__filename)
+
+
+@benchmark('add_vacancy', backends=BACKENDS)
+def bench_add_vacancy(handler, size, runs):
+    """Добавление одной новой вакансии"""
+    vacancies = iter(make_vacancies(runs, start=size))
+    return lambda: handler.add_vacancy(next(vacancies))
+
+
+@benchmark('add_vacancies', backends=BACKENDS)
+def bench_add_vacancies(handler, size, runs):
+    """Добавление пачки из 1000 новых вакансий"""
+    batches = iter([make_vacancies(1000, start=size + run * 1000) for run in range(runs)])
+    return lambda: handler.add_vacancies(next(batches))
+
+
+@benchmark('get_vacancies_criteria', backends=BACKENDS)
+def bench_get_vacancies_criteria(handler, size, runs):
+    """Фильтрация по подстроке в названии и городе с чтением файла"""
+    return lambda: _reopen(handler).get_vacancies(name='python', city='моск')
+
+
+@benchmark('get_vacancies_cached', backends=BACKENDS)
+def bench_get_vacancies_cached(handler, size, runs):
+    """Фильтрация по подстроке повторным вызовом того же хранилища"""
+    handler.get_vacancies()
+    return lambda: handler.get_vacancies(name='python', city='моск')
+
+
+@benchmark('select', backends=BACKENDS)
+def bench_select(handler, size, runs):
+    """Структурированный запрос с диапазоном, списком городов и сортировкой"""
+    query = (Query(In('city', ['Москва', 'Казань']) & Range('salary_from', 100000))
+             .order_by('salary_from', descending=True).limit(20))
+    handler.get_vacancies()
+    return lambda: handler.select(query)
+
+
+@benchmark('delete_vacancy', backends=BACKENDS)
+def bench_delete_vacancy(handler, size, runs):
+    """Удаление одной вакансии по ID"""
+    ids = itertools.count()
+    return lambda: handler.delete_vacancy(str(next(ids) * 7 % size))
+
+
+@benchmark('top_by_salary', backends=BACKENDS)
+def bench_top_by_salary(handler, size, runs):
+    """Топ-10 вакансий по зарплате"""
+    handler.get_vacancies()
+    return lambda: handler.top_by_salary(10)
+
+
+@benchmark('get_page', backends=BACKENDS)
+def bench_get_page(handler, size, runs):
+    """Первые пять страниц по 20 вакансий, как при просмотре файла в интерфейсе"""
+    def run():
+        reopened = _reopen(handler)
+        cursor = None
+        for _ in range(5):
+            _, cursor = reopened.get_page(cursor, 20)
+            if cursor is None:
+                break
+    return run
+
+
+def _bench_hh_api(size, stack, max_workers):
+    # HH API отдает не больше 2000 вакансий на запрос
+    amount = min(size, 2000)
+    server = stack.enter_context(StubHHServer(found=amount))
+    # Лимиты планировщика сняты, чтобы измерять только клиент и разбор ответов
+    api = hh_API(max_workers=max_workers, base_url=server.url, scheduler=RequestScheduler(rate=10000))
+    return lambda: api.get_vacancies('python', amount)
+
+
+@benchmark('hh_api.get_vacancies', repeat=3)
+def bench_hh_api(size, directory, stack, runs):
+    """Загрузка до 2000 вакансий страницами по 100 с локального сервера"""
+    return _bench_hh_api(size, stack, 1)
+
+
+@benchmark('hh_api.get_vacancies_parallel', repeat=3)
+def bench_hh_api_parallel(size, directory, stack, runs):
+    """Параллельная загрузка страниц в 8 потоков"""
+    return _bench_hh_api(size, stack, 8)
+
+
+def percentile(values, q):
+    """Процентиль q (0..100) отсортированного списка с линейной интерполяцией"""
+    if not values:
+        return None
+    position = (len(values) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+def measure(operation, repeat):
+    """Время каждого из repeat запусков и пиковая память отдельного запуска под tracemalloc.
+
+    Операция выполняется repeat + 1 раз.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        operation()
+        timings.append(time.perf_counter() - start)
+
+    # tracemalloc замедляет выполнение, поэтому память измеряется отдельным запуском
+    tracemalloc.start()
+    try:
+        operation()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    timings.sort()
+    return {
+        'repeat': repeat,
+        'min': timings[0],
+        'p50': percentile(timings, 50),
+        'p90': percentile(timings, 90),
+        'p99': percentile(timings, 99),
+        'max': timings[-1],
+        'mean': sum(timings) / len(timings),
+        'peak_memory': peak
+    }
+
+
+def run(sizes=DEFAULT_SIZES, name_filter=None, repeat=None, progress=print):
+    """Запуск выбранных бенчмарков на каждом размере данных"""
+    results = {}
+    for name, (setup, default_repeat) in BENCHMARKS.items():
+        if name_filter and name_filter not in name:
+            continue
+        for size in sizes:
+            runs = repeat or default_repeat
+            with tempfile.TemporaryDirectory() as directory, ExitStack() as stack:
+                # Данные готовятся для всех запусков, включая отдельный запуск для замера памяти
+                result = measure(setup(size, directory, stack, runs + 1), runs)
+            result['size'] = size
+            key = f'{name}[{size}]'
+            results[key] = result
+            if progress:
+                progress(f"{key:<45} p50 {result['p50'] * 1000:10.2f} мс  "
+                         f"p90 {result['p90'] * 1000:10.2f} мс  память {result['peak_memory'] / 1024:10.1f} КБ")
+    return {
+        'meta': {
+            'created': datetime.now(timezone.utc).isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform()
+        },
+        'results': results
+    }
+
+
+def compare(report, baseline, threshold=DEFAULT_THRESHOLD):
+    """Список ухудшений медианы времени и пиковой памяти больше чем на threshold"""
+    regressions = []
+    for key, result in report['results'].items():
+        base = baseline.get('results', {}).get(key)
+        if base is None:
+            continue
+        for metric in ('p50', 'peak_memory'):
+            if base[metric] and result[metric] > base[metric] * (1 + threshold):
+                regressions.append({
+                    'benchmark': key,
+                    'metric': metric,
+                    'baseline': base[metric],
+                    'current': result[metric],
+                    'change': result[metric] / base[metric] - 1
+                })
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Бенчмарки хранилищ вакансий и клиента HH API")
+    parser.add_argument('--sizes', default=','.join(map(str, DEFAULT_SIZES)),
+                        help="размеры данных через запятую, например 1000,10000,100000,1000000")
+    parser.add_argument('--filter', default=None, help="подстрока имени бенчмарка, например json.")
+    parser.add_argument('--repeat', type=int, default=None, help="число запусков каждой операции")
+    parser.add_argument('--output', default=None, help="файл для результатов в JSON")
+    parser.add_argument('--baseline', default=BASELINE_FILE, help="файл базовой линии")
+    parser.add_argument('--save-baseline', action='store_true', help="сохранить результаты как базовую линию")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help="допустимое ухудшение, доля от базовой линии")
+    args = parser.parse_args(argv)
+
+    sizes = [int(size) for size in args.sizes.split(',')]
+    report = run(sizes, args.filter, args.repeat)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"Базовая линия сохранена: {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("Базовая линия не найдена, сравнение пропущено. "
+              "Сохраните ее командой: python -m benchmarks.suite --save-baseline")
+        return 0
+    with open(args.baseline, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+
+    regressions = compare(report, baseline, args.threshold)
+    for regression in regressions:
+        print(f"Ухудшение {regression['benchmark']} {regression['metric']}: "
+              f"{regression['baseline']:.6g} -> {regression['current']:.6g} ({regression['change']:+.0%})")
+    if not regressions:
+        print("Ухудшений относительно базовой линии нет.")
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,10 +1,35 @@
+import argparse
+import sys
+
+from src import metrics
+from src.hh_api import hh_API
+from src.http_cache import ResponseCache
 from src.user_interface import UserInterface
 
-def main():
+
+def parse_args(argv):
+    """Разбор флагов командной строки"""
+    parser = argparse.ArgumentParser(description="Поиск вакансий на hh.ru")
+    parser.add_argument('--metrics', action='store_true', help="вывести метрики времени при выходе")
+    parser.add_argument('--profile', action='store_true', help="дополнительно запустить cProfile")
+    parser.add_argument('--trace-memory', action='store_true', help="дополнительно запустить tracemalloc")
+    parser.add_argument('--metrics-output', default=None, help="файл для метрик в JSON")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
     """Главная функция программы"""
+    args = parse_args(argv or [])
+    # Метрики включаются флагами или переменной окружения VACANCIES_METRICS
+    if args.metrics or args.profile or args.trace_memory or args.metrics_output:
+        metrics.enable(profile=args.profile, memory=args.trace_memory, output=args.metrics_output)
+    else:
+        metrics.enable_from_env()
+
     print("Добро пожаловать в систему поиска вакансий!")
-    ui = UserInterface()
+    # Повторные поиски в течение TTL обслуживаются из кэша на диске
+    ui = UserInterface(hh_api=hh_API(cache=ResponseCache()))
     ui.show_menu()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main(sys.argv[1:])
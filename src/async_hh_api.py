@@ -0,0 +1,314 @@
+import asyncio
+import json
+import ssl
+import time
+from urllib.parse import urlencode, urlsplit
+
+from requests.structures import CaseInsensitiveDict
+from src.hh_api import JobAPI, RequestScheduler, hh_API
+
+USER_AGENT = 'course-work-2/0.1'
+# Сетевые ошибки, после которых запрос можно повторить
+NETWORK_ERRORS = (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError)
+
+
+class AsyncResponse:
+    """Ответ HTTP, прочитанный асинхронным транспортом"""
+
+    def __init__(self, status_code, headers, body):
+        self.status_code = status_code
+        self.headers = headers
+        self.body = body
+
+    def json(self):
+        return json.loads(self.body)
+
+
+async def read_response(reader):
+    """Чтение ответа HTTP/1.1, возвращает ответ и признак keep-alive"""
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionResetError("Соединение закрыто сервером")
+    version, status, _ = status_line.decode('latin-1').split(' ', 2)
+    status_code = int(status)
+
+    headers = CaseInsensitiveDict()
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip()] = value.strip()
+
+    keep_alive = version == 'HTTP/1.1' and headers.get('Connection', '').lower() != 'close'
+    if headers.get('Transfer-Encoding', '').lower() == 'chunked':
+        body = bytearray()
+        while True:
+            size = int((await reader.readline()).split(b';')[0], 16)
+            if size == 0:
+                # Пропускаем трейлеры до пустой строки
+                while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+                    pass
+                break
+            body += await reader.readexactly(size)
+            await reader.readexactly(2)
+        body = bytes(body)
+    elif 'Content-Length' in headers:
+        body = await reader.readexactly(int(headers['Content-Length']))
+    elif status_code in (204, 304) or 100 <= status_code < 200:
+        body = b''
+    else:
+        body = await reader.read()
+        keep_alive = False
+
+    return AsyncResponse(status_code, headers, body), keep_alive
+
+
+class AsyncConnectionPool:
+    """Пул keep-alive соединений HTTP/1.1 с общим лимитом и лимитом на хост"""
+
+    def __init__(self, limit=100, limit_per_host=10, timeout=10):
+        self.limit_per_host = limit_per_host
+        self.timeout = timeout
+        self.connections_opened = 0
+        self._total = asyncio.Semaphore(limit)
+        self._per_host = {}
+        self._idle = {}
+        self._ssl_context = ssl.create_default_context()
+
+    async def _acquire(self, key):
+        """Свободное соединение из пула или новое; второй элемент - признак повторного использования"""
+        idle = self._idle.setdefault(key, [])
+        while idle:
+            reader, writer = idle.pop()
+            if not reader.at_eof() and not writer.is_closing():
+                return (reader, writer), True
+            writer.close()
+
+        scheme, host, port = key
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(host, port, ssl=self._ssl_context if scheme == 'https' else None),
+            self.timeout
+        )
+        self.connections_opened += 1
+        return (reader, writer), False
+
+    async def request(self, url, params=None, headers=None):
+        """GET-запрос через соединение из пула"""
+        parts = urlsplit(url)
+        port = parts.port or (443 if parts.scheme == 'https' else 80)
+        key = (parts.scheme, parts.hostname, port)
+        path = parts.path or '/'
+        query = urlencode(params or {})
+        if query:
+            path += '?' + query
+
+        lines = [f'GET {path} HTTP/1.1', f'Host: {parts.netloc}', f'User-Agent: {USER_AGENT}',
+                 'Accept: application/json', 'Connection: keep-alive']
+        lines += [f'{name}: {value}' for name, value in (headers or {}).items()]
+        request_bytes = ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1')
+
+        per_host = self._per_host.setdefault(key, asyncio.Semaphore(self.limit_per_host))
+        async with self._total, per_host:
+            while True:
+                (reader, writer), reused = await self._acquire(key)
+                try:
+                    writer.write(request_bytes)
+                    await writer.drain()
+                    response, keep_alive = await asyncio.wait_for(read_response(reader), self.timeout)
+                except NETWORK_ERRORS:
+                    writer.close()
+                    # Сервер мог закрыть простаивающее соединение, пробуем новое
+                    if reused:
+                        continue
+                    raise
+                except BaseException:
+                    # Отмена задачи или ошибка разбора ответа: соединение в неизвестном состоянии
+                    writer.close()
+                    raise
+
+                if keep_alive:
+                    self._idle[key].append((reader, writer))
+                else:
+                    writer.close()
+                return response
+
+    async def close(self):
+        """Закрытие всех простаивающих соединений"""
+        for idle in self._idle.values():
+            for _, writer in idle:
+                writer.close()
+                try:
+                    await writer.wait_closed()
+                except NETWORK_ERRORS:
+                    pass
+        self._idle.clear()
+
+
+class AsyncTokenBucket:
+    """Ограничитель частоты запросов для asyncio"""
+
+    def __init__(self, rate, capacity=None):
+        self.rate = rate
+        self.capacity = capacity or rate
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+
+    async def acquire(self):
+        """Ожидание свободного токена"""
+        while True:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class AsyncHhAPI(JobAPI):
+    """Асинхронный клиент HH API для множества одновременных поисков"""
+
+    BASE_URL = hh_API.BASE_URL
+
+    def __init__(self, base_url: str = None, pool_size: int = 100, limit_per_host: int = 10,
+                 rate: float = 20, max_retries: int = 5, timeout: float = 10):
+        self.base_url = base_url or self.BASE_URL
+        self.pool_size = pool_size
+        self.limit_per_host = limit_per_host
+        self.rate = rate
+        self.timeout = timeout
+        # Политика повторов и задержек общая с синхронным клиентом
+        self.retry_policy = RequestScheduler(rate=rate, max_retries=max_retries)
+        self._pool = None
+        self._bucket = None
+        self._loop = None
+
+    def _transport(self):
+        """Пул соединений и ограничитель, привязанные к текущему циклу событий"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._pool = AsyncConnectionPool(self.pool_size, self.limit_per_host, self.timeout)
+            self._bucket = AsyncTokenBucket(self.rate)
+            self._loop = loop
+        return self._pool, self._bucket
+
+    async def _get_json(self, params: dict):
+        """GET-запрос к API с повторами при 429, 5xx и сетевых ошибках"""
+        pool, bucket = self._transport()
+        policy = self.retry_policy
+        attempt = 0
+        while True:
+            await bucket.acquire()
+            try:
+                response = await pool.request(self.base_url, params)
+            except NETWORK_ERRORS:
+                if attempt >= policy.max_retries:
+                    raise
+                delay = policy.backoff(attempt)
+            else:
+                if response.status_code not in policy.RETRY_STATUSES or attempt >= policy.max_retries:
+                    break
+                delay = policy.retry_after(response)
+                if delay is None:
+                    delay = policy.backoff(attempt)
+
+            policy.retries += 1
+            attempt += 1
+            await asyncio.sleep(delay)
+
+        if response.status_code >= 400:
+            raise ConnectionError(f"HTTP {response.status_code}")
+        return response.json()
+
+    async def _fetch_page(self, keyword: str, page: int, per_page: int):
+        """Загрузка страницы, возвращает вакансии и общее число страниц"""
+        params = hh_API._page_params(keyword, page, per_page)
+        try:
+            data = await self._get_json(params)
+            return hh_API._parse_vacancies(data), data.get('pages')
+        except NETWORK_ERRORS as e:
+            print(f"Ошибка запроса: {e}")
+            return [], 0
+        except (KeyError, ValueError) as e:
+            print(f"Ошибка обработки данных: {e}")
+            return [], 0
+
+    async def get_vacancies(self, keyword: str, amount: int):
+        """Получение вакансий: первая страница, затем остальные одновременно"""
+        per_page = min(100, amount)
+        vacancies, total_pages = await self._fetch_page(keyword, 0, per_page)
+        if len(vacancies) < per_page:
+            return vacancies[:amount]
+
+        pages_needed = -(-amount // per_page)
+        last_page = min(total_pages or pages_needed, pages_needed)
+        pages = await asyncio.gather(
+            *(self._fetch_page(keyword, page, per_page) for page in range(1, last_page))
+        )
+        for page_vacancies, _ in pages:
+            if not page_vacancies:
+                break
+            vacancies.extend(page_vacancies)
+
+        return vacancies[:amount]
+
+    async def aiter_vacancies(self, keyword: str, amount: int):
+        """Асинхронный генератор вакансий с фоновой загрузкой следующей страницы.
+
+        Назван отдельно от iter_vacancies, чтобы не подменять синхронный генератор JobAPI.
+        """
+        per_page = min(100, amount)
+        remaining = amount
+        page = 0
+        task = asyncio.ensure_future(self._fetch_page(keyword, page, per_page))
+        try:
+            while task is not None:
+                page_vacancies, total_pages = await task
+                page += 1
+
+                task = None
+                if (len(page_vacancies) == per_page and len(page_vacancies) < remaining
+                        and (total_pages is None or page < total_pages)):
+                    task = asyncio.ensure_future(self._fetch_page(keyword, page, per_page))
+
+                for vacancy in page_vacancies[:remaining]:
+                    yield vacancy
+                remaining -= min(len(page_vacancies), remaining)
+        finally:
+            if task is not None:
+                task.cancel()
+
+    async def search_many(self, keywords, amount: int):
+        """Одновременный поиск по нескольким ключевым словам"""
+        results = await asyncio.gather(*(self.get_vacancies(keyword, amount) for keyword in keywords))
+        return dict(zip(keywords, results))
+
+    async def close(self):
+        """Закрытие соединений пула"""
+        if self._pool is not None:
+            await self._pool.close()
+        self._pool = None
+        self._loop = None
+
+
+class SyncHhAPI(JobAPI):
+    """Синхронная обертка над AsyncHhAPI для UserInterface"""
+
+    def __init__(self, async_api: AsyncHhAPI = None):
+        self.async_api = async_api or AsyncHhAPI()
+
+    def _run(self, coroutine):
+        """Выполнение корутины в отдельном цикле событий с закрытием соединений"""
+        async def run():
+            try:
+                return await coroutine
+            finally:
+                await self.async_api.close()
+        return asyncio.run(run())
+
+    def get_vacancies(self, keyword: str, amount: int):
+        return self._run(self.async_api.get_vacancies(keyword, amount))
+
+    def search_many(self, keywords, amount: int):
+        return self._run(self.async_api.search_many(keywords, amount))
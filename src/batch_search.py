@@ -0,0 +1,130 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from src.hh_api import hh_API
+
+
+class QuerySpec:
+    """Запрос пакетного поиска: ключевое слово, регион и дополнительные фильтры HH API"""
+
+    def __init__(self, keyword, area=None, filters=None):
+        self.keyword = keyword
+        self.area = area
+        self.filters = filters or {}
+
+    def params(self):
+        """Фильтры запроса вместе с регионом"""
+        params = dict(self.filters)
+        if self.area is not None:
+            params['area'] = self.area
+        return params
+
+    def __repr__(self):
+        return f"QuerySpec({self.keyword!r}, area={self.area!r}, filters={self.filters!r})"
+
+
+class QueryStats:
+    """Статистика одного запроса пакетного поиска"""
+
+    def __init__(self, spec):
+        self.spec = spec
+        self.pages = 0
+        self.items = 0
+        self.duplicates = 0
+        self.latency = 0.0
+        self.error = None
+
+    @property
+    def unique(self):
+        """Вакансии, впервые найденные этим запросом"""
+        return self.items - self.duplicates
+
+    def __str__(self):
+        area = f", регион {self.spec.area}" if self.spec.area is not None else ''
+        line = (f"'{self.spec.keyword}'{area}: страниц {self.pages}, вакансий {self.items}, "
+                f"дубликатов {self.duplicates}, {self.latency:.2f} с")
+        if self.error:
+            line += f", ошибка: {self.error}"
+        return line
+
+
+class BatchResult:
+    """Уникальные вакансии пакетного поиска и статистика по запросам"""
+
+    def __init__(self, vacancies, stats):
+        self.vacancies = vacancies
+        self.stats = stats
+
+    @property
+    def duplicates(self):
+        return sum(query_stats.duplicates for query_stats in self.stats)
+
+
+class BatchSearch:
+    """Одновременное выполнение множества запросов с общим лимитом частоты.
+
+    Запросы выполняются в пуле потоков через один hh_API, поэтому все они
+    проходят через его RequestScheduler. ID вакансий резервируются в общем
+    множестве до разбора ответа: вакансия, уже найденная другим запросом,
+    не разбирается и не попадает в результат повторно.
+    """
+
+    def __init__(self, hh_api=None, max_workers=8):
+        self.max_workers = max(1, max_workers)
+        # Пул соединений клиента должен вмещать все одновременные запросы
+        self.hh_api = hh_api or hh_API(max_workers=self.max_workers)
+
+    def run(self, specs, amount):
+        """Выполнение запросов, не больше amount вакансий на запрос"""
+        specs = [spec if isinstance(spec, QuerySpec) else QuerySpec(*spec) for spec in specs]
+        seen_ids = set()
+        lock = threading.Lock()
+
+        def claim(vacancy_id):
+            """Резервирование ID; False если вакансию уже нашел другой запрос"""
+            with lock:
+                if vacancy_id in seen_ids:
+                    return False
+                seen_ids.add(vacancy_id)
+                return True
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = list(executor.map(lambda spec: self._run_query(spec, amount, claim), specs))
+
+        vacancies = [vacancy for query_vacancies, _ in results for vacancy in query_vacancies]
+        return BatchResult(vacancies, [query_stats for _, query_stats in results])
+
+    def _run_query(self, spec, amount, claim):
+        """Последовательная загрузка страниц одного запроса"""
+        stats = QueryStats(spec)
+        vacancies = []
+        per_page = min(100, amount)
+        filters = spec.params()
+        start = time.perf_counter()
+
+        page = 0
+        while stats.items < amount:
+            params = hh_API._page_params(spec.keyword, page, per_page, filters)
+            try:
+                data = self.hh_api._get_json(params)
+                items = data.get('items', [])[:amount - stats.items]
+                for item in items:
+                    if claim(item['id']):
+                        vacancies.append(hh_API._parse_vacancy(item))
+                    else:
+                        stats.duplicates += 1
+            except (requests.RequestException, KeyError, ValueError) as e:
+                stats.error = str(e)
+                break
+
+            stats.pages += 1
+            stats.items += len(items)
+            page += 1
+            total_pages = data.get('pages')
+            if len(items) < per_page or (total_pages is not None and page >= total_pages):
+                break
+
+        stats.latency = time.perf_counter() - start
+        return vacancies, stats
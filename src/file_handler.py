@@ -1,6 +1,18 @@
+import heapq
+from itertools import islice
 import json
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 import os
+import sqlite3
+import threading
+from src.file_lock import FileLock, fsync_directory
+from src.id_index import IdIndex
+from src.json_stream import iter_items
+from src.metrics import measure
+from src.query import criteria_condition
+from src.search_index import SearchIndex
+from src.serializers import SerializationError, get_serializer, is_plain_json, loads
 from src.vacancy import Vacancy
 
 
@@ -13,98 +25,1206 @@ class FileHandler(ABC):
         pass
 
     @abstractmethod
-    def get_vacancies(self, **criteria):
+    def get_vacancies(self, limit=None, offset=0, **criteria):
         pass
 
     @abstractmethod
     def delete_vacancy(self, vacancy_id):
         pass
 
+    def upsert_vacancies(self, vacancies):
+        """Добавление новых и замена сохраненных вакансий, возвращает число добавленных и обновленных"""
+        inserted = updated = 0
+        for vacancy in vacancies:
+            if self.delete_vacancy(vacancy.id):
+                updated += 1
+            else:
+                inserted += 1
+            self.add_vacancy(vacancy)
+        return {'inserted': inserted, 'updated': updated}
+
+    def get_by_id(self, vacancy_id):
+        """Вакансия по ID или None"""
+        return next((vacancy for vacancy in self.iter_vacancies() if vacancy.id == vacancy_id), None)
+
+    def exists(self, vacancy_id):
+        """Проверка наличия вакансии с таким ID"""
+        return self.get_by_id(vacancy_id) is not None
+
+    def delete_vacancies(self, vacancy_ids):
+        """Удаление вакансий по списку ID, возвращает число удаленных"""
+        removed = sum(1 for vacancy_id in set(vacancy_ids) if self.delete_vacancy(vacancy_id))
+        return {'removed': removed}
+
+    def retain(self, predicate):
+        """Удаление всех вакансий, для которых predicate(vacancy) ложно"""
+        stale_ids = [vacancy.id for vacancy in self.iter_vacancies() if not predicate(vacancy)]
+        return self.delete_vacancies(stale_ids)
+
+    def search(self, query, mode='and'):
+        """Поиск вакансий по словам из названия и города"""
+        vacancies = self.get_vacancies()
+        ids = SearchIndex.build(vacancies).search(query, mode)
+        return [vacancy for vacancy in vacancies if vacancy.id in ids]
+
+    def top_by_salary(self, n, currency=None, field='from', normalizer=None):
+        """Топ-N вакансий по зарплате через ограниченную кучу за O(M log N).
+
+        С normalizer зарплаты сравниваются в базовой валюте.
+        """
+        vacancies = self.get_vacancies()
+        if normalizer is not None:
+            normalizer.normalize_all(vacancies)
+        return self._top_by_salary(vacancies, n, currency, field, normalizer is not None)
+
+    @classmethod
+    def _top_by_salary(cls, vacancies, n, currency, field, normalized=False):
+        """Выбор N вакансий с наибольшей зарплатой без полной сортировки.
+
+        При normalized вакансии без курса валюты не отбрасываются, а идут
+        после пересчитанных в порядке исходной зарплаты.
+        """
+        if field not in Vacancy.SALARY_FIELDS:
+            raise ValueError(f"Неизвестное поле зарплаты: {field}")
+
+        def candidates():
+            for vacancy in vacancies:
+                if currency is not None and vacancy.currency != currency:
+                    continue
+                value = vacancy.salary_value(field, normalized)
+                if value is not None:
+                    yield (True, value), vacancy
+                elif normalized and (value := vacancy.salary_value(field)) is not None:
+                    yield (False, value), vacancy
+
+        top = [vacancy for rank, vacancy in heapq.nlargest(n, candidates(), key=lambda pair: pair[0])]
+        if normalized:
+            cls._warn_unconverted(top)
+        return top
+
+    @staticmethod
+    def _warn_unconverted(vacancies):
+        """Предупреждение о вакансиях, зарплату которых не удалось пересчитать в базовую валюту"""
+        currencies = sorted({str(vacancy.currency) for vacancy in vacancies if vacancy.salary_base is None})
+        if currencies:
+            print(f"Нет курса для валют: {', '.join(currencies)}; "
+                  "такие вакансии показаны после пересчитанных по исходной зарплате")
+
+    def iter_vacancies(self, **criteria):
+        """Генератор вакансий с фильтрацией"""
+        yield from self.get_vacancies(**criteria)
+
+    def count_vacancies(self, **criteria):
+        """Число вакансий, подходящих под критерии"""
+        return sum(1 for _ in self.iter_vacancies(**criteria))
+
+    def get_page(self, cursor=None, limit=20, **criteria):
+        """Страница из limit вакансий и курсор следующей страницы (None на последней).
+
+        Курсор непрозрачен и действителен для тех же критериев; None - первая страница.
+        """
+        offset = cursor or 0
+        # Лишняя вакансия показывает, есть ли следующая страница
+        vacancies = self.get_vacancies(limit=limit + 1, offset=offset, **criteria)
+        next_cursor = offset + limit if len(vacancies) > limit else None
+        return vacancies[:limit], next_cursor
+
+    @staticmethod
+    def _slice(vacancies, limit, offset):
+        """Часть списка вакансий по limit и offset"""
+        if limit is None and not offset:
+            return vacancies
+        return list(islice(vacancies, offset, None if limit is None else offset + limit))
+
+    @staticmethod
+    def _item_to_vacancy(item):
+        """Создание вакансии из записи файла, в том числе в исходном формате HH API"""
+        area = item.get('area')
+        if isinstance(area, dict):
+            item = {
+                'name': item.get('name'),
+                'city': area.get('name'),
+                'url': item.get('url'),
+                'salary': item.get('salary'),
+                'id': item.get('id')
+            }
+        return Vacancy.from_dict(item)
+
+    def select(self, query):
+        """Выполнение структурированного запроса src.query.Query за один проход по вакансиям"""
+        return query.run(self.iter_vacancies())
+
+    @staticmethod
+    def _filter_vacancies(vacancies, criteria):
+        """Фильтрация вакансий по подстроке без учета регистра"""
+        condition = criteria_condition(criteria)
+        if condition is None:
+            return vacancies
+        # Критерии компилируются в предикат один раз на весь список
+        return list(filter(condition.compile(), vacancies))
+
 
 class FileHandlerJSON(FileHandler):
-    def __init__(self, filename='./data/vacancies.json'):
+    def __init__(self, filename='./data/vacancies.json', use_stemming=False, serializer='json-compact'):
         super().__init__(filename)
         # Создаем директорию, если она не существует
         os.makedirs(os.path.dirname(filename), exist_ok=True)
+        # Формат записи; при чтении формат определяется по содержимому файла
+        self.serializer = get_serializer(serializer)
+        # Кэш разобранного файла; сбрасывается при изменении mtime или размера
+        self._cache_stat = None
+        self._cache_data = None
+        self._cache_vacancies = None
+        self._cache_positions = None
+        # Поисковый индекс хранится рядом с файлом данных и загружается при первом поиске
+        self.use_stemming = use_stemming
+        self._index_filename = os.path.splitext(filename)[0] + '.index.json'
+        self._index = None
+        # Изменения сначала пишутся в журнал, затем файл заменяется целиком;
+        # одновременные записи из разных процессов разделяются блокировкой
+        self._journal_filename = filename + '.journal'
+        self._lock = FileLock(filename + '.lock')
+        # Индекс ID со смещениями записей, открывается через mmap при первом поиске по ID
+        self._id_index_filename = filename + '.idx'
+        self._id_index = None
+        self._recover()
+
+    def _file_stat(self):
+        """Отпечаток файла для проверки актуальности кэша"""
+        try:
+            stat = os.stat(self._FileHandler__filename)
+        except FileNotFoundError:
+            return None
+        # Номер inode меняется при каждой атомарной замене файла
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size
 
     def _read_file(self):
         """Чтение данных из файла"""
         if not os.path.exists(self._FileHandler__filename):
             return {'items': []}
 
+        # Ошибка чтения (OSError) не перехватывается: файл, который не удалось прочитать, нельзя перезаписывать
+        with measure('file_json.read') as m, open(self._FileHandler__filename, 'rb') as f:
+            raw = f.read()
+            m.bytes = len(raw)
         try:
-            with open(self._FileHandler__filename, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError):
+            with measure('file_json.parse') as m:
+                m.bytes = len(raw)
+                return loads(raw)
+        except SerializationError:
+            # Поврежденный файл откладывается в сторону, чтобы следующая запись не уничтожила данные
+            self._quarantine()
             return {'items': []}
 
-    def _write_file(self, data):
-        """Запись данных в файл"""
-        with open(self._FileHandler__filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+    def _quarantine(self):
+        """Перенос поврежденного файла данных в свободное имя *.corrupt"""
+        filename = self._FileHandler__filename
+        target = filename + '.corrupt'
+        number = 0
+        while os.path.exists(target):
+            number += 1
+            target = f'{filename}.corrupt.{number}'
+        os.replace(filename, target)
+        print(f"Файл {filename} поврежден и сохранен как {target}")
+
+    def _is_plain_json(self):
+        """Проверка, что файл записан несжатым JSON и его можно читать потоково"""
+        try:
+            with open(self._FileHandler__filename, 'rb') as f:
+                return is_plain_json(f.read(8))
+        except FileNotFoundError:
+            return False
+
+    def _load(self):
+        """Данные файла из кэша, файл перечитывается только после внешнего изменения"""
+        stat = self._file_stat()
+        if self._cache_data is None or stat != self._cache_stat:
+            self._cache_data = self._read_file()
+            self._cache_vacancies = None
+            self._cache_positions = None
+            self._cache_stat = stat
+            # Файл изменен извне, индекс нужно сверить заново
+            self._index = None
+        return self._cache_data
+
+    def _write_file(self, data, vacancies=None):
+        """Атомарная запись: временный файл, fsync и замена файла данных с обновлением кэша"""
+        filename = self._FileHandler__filename
+        tmp_filename = f'{filename}.{os.getpid()}.tmp'
+        try:
+            with measure('file_json.serialize') as m:
+                raw = self.serializer.dumps(data)
+                m.bytes = len(raw)
+            with measure('file_json.write') as m:
+                m.bytes = len(raw)
+                with open(tmp_filename, 'wb') as f:
+                    f.write(raw)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_filename, filename)
+                fsync_directory(os.path.dirname(filename))
+        except Exception:
+            self._cache_data = None
+            if os.path.exists(tmp_filename):
+                os.remove(tmp_filename)
+            raise
+
+        # Файл данных содержит все изменения, журнал больше не нужен
+        self._clear_journal()
+        self._cache_data = data
+        self._cache_vacancies = vacancies
+        self._cache_positions = None
+        self._cache_stat = self._file_stat()
+
+    @contextmanager
+    def _write_lock(self):
+        """Блокировка файла на время изменения с повтором незавершенных операций других процессов"""
+        with self._lock:
+            self._recover()
+            yield
+
+    def _commit(self, operation, payload, data, vacancies=None):
+        """Запись операции в журнал, затем атомарная перезапись файла"""
+        self._append_journal(operation, payload)
+        try:
+            self._write_file(data, vacancies)
+        except Exception:
+            # Вызывающий код получит ошибку, поэтому операция не должна примениться позже
+            self._clear_journal()
+            raise
+
+    def _append_journal(self, operation, payload):
+        """Дописывание операции в журнал с fsync до изменения файла данных"""
+        with open(self._journal_filename, 'a', encoding='utf-8') as f:
+            f.write(json.dumps({'op': operation, 'data': payload}, ensure_ascii=False) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _clear_journal(self):
+        """Удаление журнала после успешной записи файла"""
+        if os.path.exists(self._journal_filename):
+            os.remove(self._journal_filename)
+
+    def _read_journal(self):
+        """Полные записи журнала; оборванная последняя строка пропускается"""
+        records = []
+        with open(self._journal_filename, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # Операция не была подтверждена, файл данных не менялся
+                    break
+        return records
+
+    @staticmethod
+    def _apply_journal(items, operation, payload):
+        """Повтор операции журнала над записями файла; повторный вызов не меняет результат"""
+        if operation == 'clear':
+            items.clear()
+        elif operation == 'delete':
+            removed_ids = set(payload)
+            items[:] = [item for item in items if item.get('id') not in removed_ids]
+        elif operation in ('add', 'upsert'):
+            positions = {item.get('id'): position for position, item in enumerate(items)}
+            for item in payload:
+                position = positions.get(item.get('id'))
+                if position is None:
+                    positions[item.get('id')] = len(items)
+                    items.append(item)
+                elif operation == 'upsert':
+                    items[position] = item
+
+    def _recover(self):
+        """Восстановление операций из журнала после аварийного завершения"""
+        if not os.path.exists(self._journal_filename):
+            return
+
+        with self._lock:
+            if not os.path.exists(self._journal_filename):
+                return
+            # Журнал остался от процесса, завершившегося между записью журнала и заменой файла
+            records = self._read_journal()
+            if not records:
+                self._clear_journal()
+                return
+
+            data = self._read_file()
+            for record in records:
+                self._apply_journal(data['items'], record.get('op'), record.get('data'))
+            self._write_file(data)
+            # Загруженный индекс не знает о восстановленных изменениях
+            self._index = None
 
     def add_vacancy(self, vacancy):
         """Добавление вакансии в файл с проверкой на дубликаты"""
-        data = self._read_file()
+        with self._write_lock():
+            # Пока файл не загружен, дубликат определяется по готовому индексу без разбора всего файла;
+            # строить индекс здесь незачем, файл все равно читается целиком для записи.
+            # Индекс сравнивает только хэши, поэтому найденная запись сверяется по ID в get_by_id
+            if self._cache_data is None:
+                index = self._open_id_index(build=False)
+                if index is not None and index.lookup(vacancy.id) is not None and self.get_by_id(vacancy.id):
+                    return False
+            data = self._load()
 
-        # Проверяем, существует ли вакансия с таким ID
-        existing_ids = {item.get('id') for item in data['items']}
-        if vacancy.id in existing_ids:
-            return False  # Вакансия уже существует
+            # Проверяем, существует ли вакансия с таким ID
+            existing_ids = {item.get('id') for item in data['items']}
+            if vacancy.id in existing_ids:
+                return False  # Вакансия уже существует
 
-        # Добавляем новую вакансию
-        data['items'].append(vacancy.to_dict())
-        self._write_file(data)
-        return True
+            # Добавляем новую вакансию
+            item = vacancy.to_dict()
+            data['items'].append(item)
+            self._commit('add', [item], data, self._extend_cached([item]))
+            self._update_index(added=[vacancy])
+            return True
 
     def add_vacancies(self, vacancies):
         """Добавление списка вакансий"""
-        data = self._read_file()
-        existing_ids = {item.get('id') for item in data['items']}
+        with self._write_lock():
+            data = self._load()
+            existing_ids = {item.get('id') for item in data['items']}
+
+            new_items = []
+            added = []
+            for vacancy in vacancies:
+                if vacancy.id not in existing_ids:
+                    new_items.append(vacancy.to_dict())
+                    added.append(vacancy)
+                    existing_ids.add(vacancy.id)
+
+            data['items'].extend(new_items)
+            self._commit('add', new_items, data, self._extend_cached(new_items))
+            self._update_index(added=added)
+            return len(new_items)
+
+    def upsert_vacancies(self, vacancies):
+        """Добавление новых и обновление измененных вакансий одной записью в файл"""
+        with self._write_lock():
+            data = self._load()
+            items = data['items']
+            positions = {item.get('id'): position for position, item in enumerate(items)}
+
+            inserted = []
+            replaced = {}
+            for vacancy in vacancies:
+                item = vacancy.to_dict()
+                position = positions.get(vacancy.id)
+                if position is None:
+                    positions[vacancy.id] = len(items)
+                    items.append(item)
+                    inserted.append(vacancy)
+                elif items[position] != item:
+                    items[position] = item
+                    replaced[position] = vacancy
+
+            if not inserted and not replaced:
+                return {'inserted': 0, 'updated': 0}
+
+            cached = self._cache_vacancies
+            if cached is not None:
+                cached = list(cached)
+                # Новые записи дописаны в конец, поэтому позиции кэша и файла совпадают
+                for position in range(len(cached), len(items)):
+                    cached.append(self._item_to_vacancy(items[position]))
+                for position in replaced:
+                    cached[position] = self._item_to_vacancy(items[position])
+            changed_items = [vacancy.to_dict() for vacancy in inserted + list(replaced.values())]
+            self._commit('upsert', changed_items, data, cached)
+
+            updated_ids = [vacancy.id for vacancy in replaced.values()]
+            self._update_index(added=inserted + list(replaced.values()), removed=updated_ids)
+            return {'inserted': len(inserted), 'updated': len(replaced)}
+
+    def _extend_cached(self, items):
+        """Кэшированные объекты Vacancy с добавленными записями"""
+        if self._cache_vacancies is None:
+            return None
+        return self._cache_vacancies + [self._item_to_vacancy(item) for item in items]
+
+    def _cached_vacancies(self):
+        """Кэшированный список объектов Vacancy"""
+        data = self._load()
+        if self._cache_vacancies is None:
+            self._cache_vacancies = [self._item_to_vacancy(item) for item in data['items']]
+        return self._cache_vacancies
+
+    def _fresh_positions(self):
+        """Позиции вакансий в кэше по ID, None если кэш не загружен или устарел"""
+        if self._cache_vacancies is None or self._file_stat() != self._cache_stat:
+            return None
+        if self._cache_positions is None:
+            self._cache_positions = {vacancy.id: position for position, vacancy in enumerate(self._cache_vacancies)}
+        return self._cache_positions
+
+    def _open_id_index(self, build=True):
+        """Индекс ID для текущего файла; перестраивается, если не соответствует файлу данных и build"""
+        stat = self._file_stat()
+        if stat is None:
+            return None
+        if self._id_index is not None:
+            if self._id_index.source_stat == stat:
+                return self._id_index
+            self._id_index.close()
+            self._id_index = None
+
+        index = IdIndex.open(self._id_index_filename, stat)
+        if index is None:
+            # Смещения записей есть только у несжатого JSON
+            if not build or not self._is_plain_json():
+                return None
+            try:
+                spans = ((item.get('id'), offset, length)
+                         for item, offset, length in iter_items(self._FileHandler__filename, spans=True))
+                IdIndex.build(self._id_index_filename, spans, stat)
+            except (ValueError, OSError):
+                return None
+            index = IdIndex.open(self._id_index_filename, stat)
+        self._id_index = index
+        return index
+
+    def _read_span(self, f, offset, length):
+        """Запись файла данных по смещению и длине из индекса ID"""
+        f.seek(offset)
+        return json.loads(f.read(length))
+
+    def get_by_id(self, vacancy_id):
+        """Вакансия по ID: из кэша или чтением одной записи по смещению из индекса"""
+        positions = self._fresh_positions()
+        if positions is None:
+            index = self._open_id_index()
+            if index is not None:
+                span = index.lookup(vacancy_id)
+                if span is None:
+                    return None
+                with open(self._FileHandler__filename, 'rb') as f:
+                    item = self._read_span(f, *span)
+                # Совпадение 64-битных хэшей разных ID проверяется по самой записи
+                if item.get('id') == vacancy_id:
+                    return self._item_to_vacancy(item)
+
+            self._cached_vacancies()
+            positions = self._fresh_positions()
+
+        position = positions.get(vacancy_id)
+        return None if position is None else self._cache_vacancies[position]
+
+    def exists(self, vacancy_id):
+        """Проверка наличия вакансии по кэшу или по индексу ID без чтения файла данных"""
+        positions = self._fresh_positions()
+        if positions is not None:
+            return vacancy_id in positions
+        index = self._open_id_index()
+        # Отсутствие в индексе доказывает отсутствие ID, а совпадение хэша проверяется по записи
+        if index is not None and index.lookup(vacancy_id) is None:
+            return False
+        return self.get_by_id(vacancy_id) is not None
+
+    def _vacancies_by_ids(self, ids):
+        """Вакансии с указанными ID в порядке файла, None если выборку по ID сделать нельзя"""
+        positions = self._fresh_positions()
+        if positions is not None:
+            found = sorted(positions[vacancy_id] for vacancy_id in ids if vacancy_id in positions)
+            return [self._cache_vacancies[position] for position in found]
+
+        index = self._open_id_index()
+        if index is None:
+            return None
+        spans = sorted(span for span in map(index.lookup, ids) if span is not None)
+        vacancies = []
+        with open(self._FileHandler__filename, 'rb') as f:
+            for offset, length in spans:
+                item = self._read_span(f, offset, length)
+                if item.get('id') not in ids:
+                    # Совпадение хэшей: выборка по ID откладывается до полного обхода
+                    return None
+                vacancies.append(self._item_to_vacancy(item))
+        return vacancies
+
+    def select(self, query):
+        """Выполнение запроса; условие на ID читает только нужные записи через кэш или индекс ID"""
+        ids = query.planned_ids()
+        if ids is not None:
+            vacancies = self._vacancies_by_ids(ids)
+            if vacancies is not None:
+                return query.run(vacancies)
+        return query.run(self.iter_vacancies())
+
+    def _cache_is_fresh(self):
+        """Проверка, что кэш вакансий загружен и соответствует файлу"""
+        return self._cache_vacancies is not None and self._file_stat() == self._cache_stat
+
+    def get_vacancies(self, limit=None, offset=0, **criteria):
+        """Получение вакансий из файла с фильтрацией и выбором части по limit и offset"""
+        if limit is not None and not self._cache_is_fresh() and self._is_plain_json():
+            # Часть файла читается потоково без загрузки остальных вакансий в кэш
+            return self._slice(self.iter_vacancies(**criteria), limit, offset)
+        # Копия списка, чтобы вызывающий код не мог изменить кэш
+        vacancies = self._filter_vacancies(list(self._cached_vacancies()), criteria)
+        return self._slice(vacancies, limit, offset)
+
+    def count_vacancies(self, **criteria):
+        """Число вакансий; без критериев записи файла считаются без создания объектов Vacancy"""
+        if criteria or self._cache_is_fresh() or not self._is_plain_json():
+            return len(self.get_vacancies(**criteria))
+        try:
+            return sum(1 for _ in iter_items(self._FileHandler__filename))
+        except (ValueError, FileNotFoundError):
+            return 0
+
+    def get_page(self, cursor=None, limit=20, **criteria):
+        """Страница вакансий; курсор хранит смещение в файле, и следующая страница
+        читается с этой позиции без разбора предыдущих записей"""
+        stat = self._file_stat()
+        offset = cursor[2] if isinstance(cursor, tuple) else cursor or 0
+        if criteria or self._cache_is_fresh() or not self._is_plain_json():
+            return super().get_page(offset, limit, **criteria)
+
+        # Смещение в байтах действительно, только если файл не изменился
+        start = cursor[1] if isinstance(cursor, tuple) and cursor[0] == stat else None
+        vacancies = []
+        end = None
+        try:
+            items = iter_items(self._FileHandler__filename, spans=True, start=start)
+            if start is None:
+                items = islice(items, offset, None)
+            for item, item_offset, length in items:
+                if len(vacancies) == limit:
+                    return vacancies, (stat, end, offset + limit)
+                vacancies.append(self._item_to_vacancy(item))
+                end = item_offset + length
+        except (ValueError, FileNotFoundError):
+            pass
+        return vacancies, None
+
+    def iter_vacancies(self, **criteria):
+        """Потоковое чтение вакансий с фильтрацией без загрузки всего файла"""
+        if self._cache_is_fresh():
+            vacancies = iter(list(self._cache_vacancies))
+        elif self._is_plain_json():
+            vacancies = self._stream_vacancies()
+        elif os.path.exists(self._FileHandler__filename):
+            # Двоичный или сжатый файл разбирается целиком
+            vacancies = iter(list(self._cached_vacancies()))
+        else:
+            return
+
+        condition = criteria_condition(criteria)
+        if condition is None:
+            yield from vacancies
+        else:
+            yield from filter(condition.compile(), vacancies)
+
+    def _stream_vacancies(self):
+        """Вакансии, разбираемые из файла по одной"""
+        try:
+            for item in iter_items(self._FileHandler__filename):
+                yield self._item_to_vacancy(item)
+        except (ValueError, FileNotFoundError):
+            # Поврежденный файл обрабатывается как в _read_file
+            return
+
+    def _search_index(self):
+        """Поисковый индекс, соответствующий текущему содержимому файла"""
+        vacancies = self._cached_vacancies()
+        if self._index is not None:
+            return self._index
+
+        index = SearchIndex.load(self._index_filename)
+        if index is None or index.source_stat != self._cache_stat or index.use_stemming != self.use_stemming:
+            index = SearchIndex.build(vacancies, self.use_stemming)
+            index.source_stat = self._cache_stat
+            if self._cache_stat is not None:
+                index.save(self._index_filename)
+        self._index = index
+        return index
+
+    def _update_index(self, added=(), removed=()):
+        """Инкрементальное обновление загруженного индекса после записи"""
+        if self._index is None:
+            return
+
+        for vacancy_id in removed:
+            self._index.remove(vacancy_id)
+        for vacancy in added:
+            self._index.add(vacancy)
+        self._index.source_stat = self._cache_stat
+        self._index.save(self._index_filename)
+
+    def search(self, query, mode='and'):
+        """Поиск вакансий по словам из названия и города через инвертированный индекс"""
+        ids = self._search_index().search(query, mode)
+        vacancies = self._cached_vacancies()
+        if self._cache_positions is None:
+            self._cache_positions = {vacancy.id: position for position, vacancy in enumerate(vacancies)}
+
+        positions = sorted(
+            self._cache_positions[vacancy_id] for vacancy_id in ids if vacancy_id in self._cache_positions
+        )
+        return [vacancies[position] for position in positions]
 
-        added_count = 0
+    def delete_vacancy(self, vacancy_id):
+        """Удаление вакансии по ID"""
+        return self.delete_vacancies([vacancy_id])['removed'] > 0
+
+    def delete_vacancies(self, vacancy_ids):
+        """Удаление вакансий по списку ID одной перезаписью файла"""
+        vacancy_ids = set(vacancy_ids)
+        with self._write_lock():
+            data = self._load()
+            return self._keep_items(data, [item.get('id') not in vacancy_ids for item in data['items']])
+
+    def retain(self, predicate):
+        """Удаление вакансий, для которых predicate(vacancy) ложно, одной перезаписью файла"""
+        with self._write_lock():
+            vacancies = self._cached_vacancies()
+            data = self._load()
+            return self._keep_items(data, [bool(predicate(vacancy)) for vacancy in vacancies])
+
+    def _keep_items(self, data, keep):
+        """Запись только отмеченных записей с обновлением кэша и индекса"""
+        removed_ids = [item.get('id') for item, kept in zip(data['items'], keep) if not kept]
+        if not removed_ids:
+            return {'removed': 0}
+
+        data['items'] = [item for item, kept in zip(data['items'], keep) if kept]
+        vacancies = self._cache_vacancies
+        if vacancies is not None:
+            vacancies = [vacancy for vacancy, kept in zip(vacancies, keep) if kept]
+        self._commit('delete', removed_ids, data, vacancies)
+        self._update_index(removed=removed_ids)
+        return {'removed': len(removed_ids)}
+
+    def clear_all(self):
+        """Очистка всех вакансий"""
+        with self._write_lock():
+            self._commit('clear', None, {'items': []}, [])
+            if self._index is not None:
+                self._index.clear()
+                self._update_index()
+
+
+class FileHandlerJSONL(FileHandler):
+    """Хранилище вакансий в виде журнала JSON Lines, в который только дописываются строки"""
+
+    def __init__(self, filename='./data/vacancies.jsonl', compact_min_garbage=1000):
+        super().__init__(filename)
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        self.compact_min_garbage = compact_min_garbage
+        self._ids = set()
+        self._garbage = 0
+        self._load_ids()
+
+    def _iter_records(self):
+        """Построчное чтение записей журнала"""
+        if not os.path.exists(self._FileHandler__filename):
+            return
+
+        with open(self._FileHandler__filename, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    # Оборванная последняя строка после аварийной записи
+                    continue
+
+    def _load_ids(self):
+        """Построение множества ID и подсчет устаревших строк при открытии файла"""
+        self._ids.clear()
+        self._garbage = 0
+        for record in self._iter_records():
+            vacancy_id = record.get('id')
+            if record.get('deleted'):
+                self._ids.discard(vacancy_id)
+                # Удаляется и сама запись, и надгробие
+                self._garbage += 2
+            elif vacancy_id in self._ids:
+                self._garbage += 1
+            else:
+                self._ids.add(vacancy_id)
+
+    def _append(self, records):
+        """Дописывание записей в конец журнала"""
+        lines = ''.join(json.dumps(record, ensure_ascii=False) + '\n' for record in records)
+        with open(self._FileHandler__filename, 'a', encoding='utf-8') as f:
+            f.write(lines)
+
+    def _live_items(self):
+        """Актуальные записи журнала с учетом надгробий"""
+        items = {}
+        for record in self._iter_records():
+            if record.get('deleted'):
+                items.pop(record.get('id'), None)
+            else:
+                items[record.get('id')] = record
+        return list(items.values())
+
+    def add_vacancy(self, vacancy):
+        """Добавление вакансии одной строкой в конец журнала"""
+        if vacancy.id in self._ids:
+            return False
+
+        self._append([vacancy.to_dict()])
+        self._ids.add(vacancy.id)
+        return True
+
+    def add_vacancies(self, vacancies):
+        """Добавление списка вакансий одной записью в журнал"""
+        records = []
         for vacancy in vacancies:
-            if vacancy.id not in existing_ids:
-                data['items'].append(vacancy.to_dict())
-                existing_ids.add(vacancy.id)
-                added_count += 1
+            if vacancy.id not in self._ids:
+                records.append(vacancy.to_dict())
+                self._ids.add(vacancy.id)
 
-        self._write_file(data)
-        return added_count
+        if records:
+            self._append(records)
+        return len(records)
 
-    def get_vacancies(self, **criteria):
-        """Получение вакансий из файла с фильтрацией"""
-        data = self._read_file()
-        vacancies = [Vacancy.from_dict(item) for item in data['items']]
+    def upsert_vacancies(self, vacancies):
+        """Дописывание новых и измененных вакансий; при чтении действует последняя запись"""
+        vacancies = list(vacancies)
+        current = {}
+        # Текущие записи читаются, только если среди вакансий есть уже сохраненные
+        if any(vacancy.id in self._ids for vacancy in vacancies):
+            current = {item.get('id'): item for item in self._live_items()}
 
+        records = []
+        inserted = updated = 0
+        for vacancy in vacancies:
+            record = vacancy.to_dict()
+            if vacancy.id in self._ids:
+                # Неизмененная вакансия не дописывается, чтобы журнал не рос от повторной синхронизации
+                if current.get(vacancy.id) == record:
+                    continue
+                updated += 1
+                self._garbage += 1
+            else:
+                inserted += 1
+                self._ids.add(vacancy.id)
+            current[vacancy.id] = record
+            records.append(record)
+
+        if records:
+            self._append(records)
+            self._maybe_compact()
+        return {'inserted': inserted, 'updated': updated}
+
+    def exists(self, vacancy_id):
+        """Проверка наличия вакансии по множеству ID журнала"""
+        return vacancy_id in self._ids
+
+    def get_vacancies(self, limit=None, offset=0, **criteria):
+        """Получение вакансий из журнала с фильтрацией и выбором части по limit и offset"""
+        items = self._live_items()
         if not criteria:
-            return vacancies
+            # Объекты Vacancy создаются только для выбранной части
+            return [Vacancy.from_dict(item) for item in self._slice(items, limit, offset)]
+        vacancies = [Vacancy.from_dict(item) for item in items]
+        return self._slice(self._filter_vacancies(vacancies, criteria), limit, offset)
 
-        filtered_vacancies = []
-        for vacancy in vacancies:
-            match = True
-            for key, value in criteria.items():
-                vacancy_value = getattr(vacancy, key, None)
-                if vacancy_value is None or str(value).lower() not in str(vacancy_value).lower():
-                    match = False
-                    break
-            if match:
-                filtered_vacancies.append(vacancy)
+    def count_vacancies(self, **criteria):
+        """Число вакансий; без критериев берется из множества ID"""
+        if criteria:
+            return super().count_vacancies(**criteria)
+        return len(self._ids)
+
+    def delete_vacancy(self, vacancy_id):
+        """Удаление вакансии записью надгробия"""
+        if vacancy_id not in self._ids:
+            return False
+
+        self._append([{'id': vacancy_id, 'deleted': True}])
+        self._ids.discard(vacancy_id)
+        self._garbage += 2
+        self._maybe_compact()
+        return True
+
+    def delete_vacancies(self, vacancy_ids):
+        """Удаление вакансий записью надгробий одним дописыванием в журнал"""
+        removed = [vacancy_id for vacancy_id in set(vacancy_ids) if vacancy_id in self._ids]
+        if removed:
+            self._append([{'id': vacancy_id, 'deleted': True} for vacancy_id in removed])
+            self._ids.difference_update(removed)
+            self._garbage += 2 * len(removed)
+            self._maybe_compact()
+        return {'removed': len(removed)}
+
+    def _maybe_compact(self):
+        """Сжатие журнала, когда устаревших строк больше, чем актуальных"""
+        if self._garbage >= self.compact_min_garbage and self._garbage > len(self._ids):
+            self.compact()
+
+    def compact(self):
+        """Перезапись журнала только актуальными записями"""
+        items = self._live_items()
+        tmp_filename = self._FileHandler__filename + '.tmp'
+        with open(tmp_filename, 'w', encoding='utf-8') as f:
+            for item in items:
+                f.write(json.dumps(item, ensure_ascii=False) + '\n')
+        os.replace(tmp_filename, self._FileHandler__filename)
+        self._garbage = 0
+
+    def clear_all(self):
+        """Очистка всех вакансий"""
+        open(self._FileHandler__filename, 'w', encoding='utf-8').close()
+        self._ids.clear()
+        self._garbage = 0
+
+
+class FileHandlerSQLite(FileHandler):
+    """Хранилище вакансий в базе SQLite с индексами по городу и зарплате"""
+
+    # Поля, фильтрация по которым выполняется средствами SQL
+    SQL_FIELDS = {'id': 'lower(id)', 'name': 'name_lc', 'city': 'city_lc', 'url': 'lower(url)'}
+    # Выражения зарплаты, совпадающие с индексированными
+    SALARY_COLUMNS = {
+        'from': 'salary_from',
+        'to': 'salary_to',
+        'mid': '((coalesce(salary_from, salary_to) + coalesce(salary_to, salary_from)) / 2.0)'
+    }
+    # Выражения зарплаты в базовой валюте, совпадающие с индексированными
+    BASE_COLUMNS = {
+        'from': 'base_from',
+        'to': 'base_to',
+        'mid': '((coalesce(base_from, base_to) + coalesce(base_to, base_from)) / 2.0)'
+    }
+    COLUMNS = 'id, name, name_lc, city, city_lc, url, salary, salary_from, salary_to, currency'
+    # Столбцы и выражения для полей структурированных запросов
+    QUERY_COLUMNS = {
+        'id': 'id',
+        'name': 'name',
+        'city': 'city',
+        'url': 'url',
+        'currency': 'currency',
+        'salary_from': SALARY_COLUMNS['from'],
+        'salary_to': SALARY_COLUMNS['to'],
+        'salary_mid': SALARY_COLUMNS['mid']
+    }
+
+    def __init__(self, filename='./data/vacancies.db'):
+        super().__init__(filename)
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        # Хранилище используется и из потока записи IngestPipeline, поэтому
+        # соединение разрешено для любых потоков, а обращения к нему идут под блокировкой
+        self._lock = threading.RLock()
+        self._connection = sqlite3.connect(filename, check_same_thread=False)
+        self._create_schema()
+
+    def _create_schema(self):
+        """Создание таблицы и индексов"""
+        with self._lock, self._connection:
+            self._connection.executescript("""
+                CREATE TABLE IF NOT EXISTS vacancies (
+                    id TEXT PRIMARY KEY,
+                    name TEXT,
+                    name_lc TEXT,
+                    city TEXT,
+                    city_lc TEXT,
+                    url TEXT,
+                    salary TEXT,
+                    salary_from INTEGER,
+                    salary_to INTEGER,
+                    currency TEXT,
+                    base_from INTEGER,
+                    base_to INTEGER,
+                    base_version INTEGER
+                );
+                CREATE TABLE IF NOT EXISTS meta (
+                    key TEXT PRIMARY KEY,
+                    value TEXT
+                );
+            """)
+            # Базы, созданные до появления зарплат в базовой валюте, дополняются столбцами
+            columns = {row[1] for row in self._connection.execute('PRAGMA table_info(vacancies)')}
+            for column in ('base_from', 'base_to', 'base_version'):
+                if column not in columns:
+                    self._connection.execute(f'ALTER TABLE vacancies ADD COLUMN {column} INTEGER')
+            self._connection.executescript("""
+                CREATE INDEX IF NOT EXISTS idx_vacancies_city ON vacancies (city_lc);
+                CREATE INDEX IF NOT EXISTS idx_vacancies_salary_from ON vacancies (salary_from);
+                CREATE INDEX IF NOT EXISTS idx_vacancies_salary_to ON vacancies (salary_to);
+                CREATE INDEX IF NOT EXISTS idx_vacancies_salary_mid ON vacancies (
+                    (coalesce(salary_from, salary_to) + coalesce(salary_to, salary_from)) / 2.0
+                );
+                CREATE INDEX IF NOT EXISTS idx_vacancies_base_from ON vacancies (base_from);
+                CREATE INDEX IF NOT EXISTS idx_vacancies_base_to ON vacancies (base_to);
+                CREATE INDEX IF NOT EXISTS idx_vacancies_base_mid ON vacancies (
+                    (coalesce(base_from, base_to) + coalesce(base_to, base_from)) / 2.0
+                );
+                CREATE INDEX IF NOT EXISTS idx_vacancies_base_version ON vacancies (base_version);
+            """)
+
+    @staticmethod
+    def _to_row(vacancy):
+        """Преобразование вакансии в строку таблицы"""
+        salary = vacancy.salary
+        return (
+            vacancy.id,
+            vacancy.name,
+            (vacancy.name or '').lower(),
+            vacancy.city,
+            (vacancy.city or '').lower(),
+            vacancy.url,
+            json.dumps(salary, ensure_ascii=False) if salary is not None else None,
+            vacancy.salary_from,
+            vacancy.salary_to,
+            vacancy.currency
+        )
+
+    @staticmethod
+    def _from_row(row):
+        """Создание вакансии из строки таблицы"""
+        vacancy_id, name, city, url, salary = row
+        return Vacancy(
+            name=name,
+            city=city,
+            url=url,
+            salary=json.loads(salary) if salary is not None else None,
+            vacancy_id=vacancy_id
+        )
+
+    def _insert(self, vacancies):
+        """Вставка вакансий в одной транзакции, возвращает число добавленных"""
+        rows = [self._to_row(vacancy) for vacancy in vacancies]
+        with self._lock:
+            before = self._connection.total_changes
+            with self._connection:
+                self._connection.executemany(
+                    f'INSERT OR IGNORE INTO vacancies ({self.COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', rows
+                )
+            return self._connection.total_changes - before
+
+    def add_vacancy(self, vacancy):
+        """Добавление вакансии с проверкой на дубликаты"""
+        return self._insert([vacancy]) == 1
+
+    def add_vacancies(self, vacancies):
+        """Добавление списка вакансий"""
+        return self._insert(vacancies)
+
+    def upsert_vacancies(self, vacancies):
+        """Добавление новых и обновление измененных вакансий в одной транзакции"""
+        inserted = updated = 0
+        with self._lock, self._connection:
+            for vacancy in vacancies:
+                row = self._to_row(vacancy)
+                # Строка обновляется, только если данные вакансии изменились
+                cursor = self._connection.execute(
+                    'UPDATE vacancies SET name = ?, name_lc = ?, city = ?, city_lc = ?, url = ?, salary = ?, '
+                    'salary_from = ?, salary_to = ?, currency = ?, base_version = NULL '
+                    'WHERE id = ? AND (name IS NOT ? OR city IS NOT ? OR url IS NOT ? OR salary IS NOT ?)',
+                    row[1:] + (row[0], row[1], row[3], row[5], row[6])
+                )
+                if cursor.rowcount:
+                    updated += 1
+                    continue
+                cursor = self._connection.execute(
+                    f'INSERT OR IGNORE INTO vacancies ({self.COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', row
+                )
+                inserted += cursor.rowcount
+        return {'inserted': inserted, 'updated': updated}
+
+    def _criteria_sql(self, criteria):
+        """Условия SQL для критериев и критерии, проверяемые в Python"""
+        conditions = []
+        params = []
+        rest = {}
+        for key, value in criteria.items():
+            column = self.SQL_FIELDS.get(key)
+            if column is None:
+                rest[key] = value
+                continue
+            # Поиск подстроки не использует индекс; по индексу города выполняется Prefix('city', ...) в select
+            conditions.append(f'instr({column}, ?) > 0')
+            params.append(str(value).lower())
+        return conditions, params, rest
+
+    def get_vacancies(self, limit=None, offset=0, **criteria):
+        """Получение вакансий с фильтрацией и выбором части на стороне SQL"""
+        return list(self._query_vacancies(criteria, limit, offset))
+
+    def iter_vacancies(self, **criteria):
+        """Генератор вакансий, читаемых из курсора по мере обхода"""
+        return self._query_vacancies(criteria)
 
-        return filtered_vacancies
+    def _query_vacancies(self, criteria, limit=None, offset=0):
+        """Вакансии из курсора; limit и offset передаются в SQL, если все критерии выражены в SQL"""
+        conditions, params, rest = self._criteria_sql(criteria)
+
+        query = 'SELECT id, name, city, url, salary FROM vacancies'
+        if conditions:
+            query += ' WHERE ' + ' AND '.join(conditions)
+        query += ' ORDER BY rowid'
+        if not rest and (limit is not None or offset):
+            query += ' LIMIT ? OFFSET ?'
+            params.extend([-1 if limit is None else limit, offset])
+
+        vacancies = (self._from_row(row) for row in self._fetch_rows(query, params))
+        condition = criteria_condition(rest)
+        if condition is None:
+            yield from vacancies
+        else:
+            yield from islice(filter(condition.compile(), vacancies), offset,
+                              None if limit is None else offset + limit)
+
+    def _fetch_rows(self, query, params, batch_size=500):
+        """Строки результата пачками; блокировка не удерживается, пока вызывающий код обрабатывает пачку"""
+        with self._lock:
+            cursor = self._connection.execute(query, params)
+            rows = cursor.fetchmany(batch_size)
+        while rows:
+            yield from rows
+            with self._lock:
+                rows = cursor.fetchmany(batch_size)
+
+    def _fetch_all(self, query, params=()):
+        """Все строки результата под блокировкой соединения"""
+        with self._lock:
+            return self._connection.execute(query, params).fetchall()
+
+    def count_vacancies(self, **criteria):
+        """Число вакансий через COUNT(*)"""
+        conditions, params, rest = self._criteria_sql(criteria)
+        if rest:
+            return super().count_vacancies(**criteria)
+        query = 'SELECT COUNT(*) FROM vacancies'
+        if conditions:
+            query += ' WHERE ' + ' AND '.join(conditions)
+        return self._fetch_all(query, params)[0][0]
+
+    def get_page(self, cursor=None, limit=20, **criteria):
+        """Страница вакансий по курсору rowid: чтение продолжается по первичному ключу без OFFSET"""
+        conditions, params, rest = self._criteria_sql(criteria)
+        if rest:
+            return super().get_page(cursor, limit, **criteria)
+
+        conditions.append('rowid > ?')
+        params.extend([cursor or 0, limit + 1])
+        rows = self._fetch_all(
+            'SELECT rowid, id, name, city, url, salary FROM vacancies '
+            f"WHERE {' AND '.join(conditions)} ORDER BY rowid LIMIT ?", params
+        )
+        next_cursor = rows[limit - 1][0] if len(rows) > limit else None
+        return [self._from_row(row[1:]) for row in rows[:limit]], next_cursor
+
+    def select(self, query):
+        """Выполнение запроса одним SQL-запросом; индексы выбирает планировщик SQLite"""
+        compiled = query.to_sql(self.QUERY_COLUMNS, self.SQL_FIELDS)
+        if compiled is None:
+            # Условие по полю без столбца (например gross) проверяется в Python
+            return super().select(query)
+        sql, params = compiled
+        rows = self._fetch_all(f'SELECT id, name, city, url, salary FROM vacancies WHERE {sql}', params)
+        return [self._from_row(row) for row in rows]
+
+    def get_by_id(self, vacancy_id):
+        """Вакансия по первичному ключу"""
+        rows = self._fetch_all('SELECT id, name, city, url, salary FROM vacancies WHERE id = ?', (vacancy_id,))
+        return self._from_row(rows[0]) if rows else None
+
+    def exists(self, vacancy_id):
+        """Проверка наличия вакансии по первичному ключу"""
+        return bool(self._fetch_all('SELECT 1 FROM vacancies WHERE id = ?', (vacancy_id,)))
+
+    def top_by_salary(self, n, currency=None, field='from', normalizer=None):
+        """Топ-N вакансий по зарплате, читаемый по индексу в порядке убывания.
+
+        С normalizer сравниваются зарплаты в базовой валюте из столбцов base_from
+        и base_to; вакансии без курса валюты идут после пересчитанных.
+        """
+        column = self.SALARY_COLUMNS.get(field)
+        if column is None:
+            raise ValueError(f"Неизвестное поле зарплаты: {field}")
+        if normalizer is None:
+            return [self._from_row(row[:5]) for row in self._top_rows(n, currency, f'{column} IS NOT NULL', column)]
+
+        base_column = self.BASE_COLUMNS[field]
+        key = self._update_base_salaries(normalizer)
+        rows = self._top_rows(n, currency, f'{base_column} IS NOT NULL', base_column)
+        if len(rows) < n:
+            rows += self._top_rows(n - len(rows), currency,
+                                   f'{base_column} IS NULL AND {column} IS NOT NULL', column)
+
+        top = []
+        for row in rows:
+            vacancy = self._from_row(row[:5])
+            if row[5] is not None or row[6] is not None:
+                vacancy.salary_base = row[5], row[6]
+            vacancy.salary_base_key = key
+            top.append(vacancy)
+        self._warn_unconverted(top)
+        return top
+
+    def _top_rows(self, n, currency, condition, column):
+        """Строки с наибольшим значением column среди удовлетворяющих condition"""
+        query = f'SELECT id, name, city, url, salary, base_from, base_to FROM vacancies WHERE {condition}'
+        params = []
+        if currency is not None:
+            query += ' AND currency = ?'
+            params.append(currency)
+        query += f' ORDER BY {column} DESC, rowid LIMIT ?'
+        params.append(n)
+        return self._fetch_all(query, params)
+
+    def _update_base_salaries(self, normalizer):
+        """Пересчет base_from и base_to у новых вакансий и у всех при смене курсов, возвращает ключ курсов"""
+        key, factor = normalizer.conversion()
+        with self._lock, self._connection:
+            meta = dict(self._connection.execute(
+                "SELECT key, value FROM meta WHERE key IN ('base_key', 'base_version')"
+            ))
+            version = int(meta.get('base_version', 0))
+            if meta.get('base_key') != key:
+                version += 1
+                self._connection.executemany(
+                    'INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)',
+                    [('base_key', key), ('base_version', str(version))]
+                )
+            # По индексу base_version выбираются только вакансии, пересчитанные по старым курсам или еще ни разу
+            rows = self._connection.execute(
+                "SELECT rowid, salary_from, salary_to, currency, json_extract(salary, '$.gross') FROM vacancies "
+                'WHERE base_version IS NULL OR base_version < ?', (version,)
+            ).fetchall()
+            updates = []
+            for rowid, salary_from, salary_to, currency, gross in rows:
+                rate = None if salary_from is None and salary_to is None else factor(currency, gross)
+                updates.append((
+                    None if rate is None or salary_from is None else round(salary_from * rate),
+                    None if rate is None or salary_to is None else round(salary_to * rate),
+                    version,
+                    rowid
+                ))
+            self._connection.executemany(
+                'UPDATE vacancies SET base_from = ?, base_to = ?, base_version = ? WHERE rowid = ?', updates
+            )
+        return key
 
     def delete_vacancy(self, vacancy_id):
         """Удаление вакансии по ID"""
-        data = self._read_file()
-        initial_count = len(data['items'])
+        with self._lock, self._connection:
+            cursor = self._connection.execute('DELETE FROM vacancies WHERE id = ?', (vacancy_id,))
+        return cursor.rowcount > 0
 
-        data['items'] = [item for item in data['items'] if item.get('id') != vacancy_id]
-
-        if len(data['items']) < initial_count:
-            self._write_file(data)
-            return True
-        return False
+    def delete_vacancies(self, vacancy_ids):
+        """Удаление вакансий по списку ID в одной транзакции"""
+        with self._lock:
+            before = self._connection.total_changes
+            with self._connection:
+                self._connection.executemany(
+                    'DELETE FROM vacancies WHERE id = ?', ((vacancy_id,) for vacancy_id in set(vacancy_ids))
+                )
+            return {'removed': self._connection.total_changes - before}
 
     def clear_all(self):
         """Очистка всех вакансий"""
-        self._write_file({'items': []})
\ No newline at end of file
+        with self._lock, self._connection:
+            self._connection.execute('DELETE FROM vacancies')
+
+    def close(self):
+        """Закрытие соединения с базой"""
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,78 @@
+import os
+import threading
+
+try:
+    import fcntl
+except ImportError:
+    # Windows: блокировка первого байта файла через msvcrt
+    fcntl = None
+    import msvcrt
+
+
+class FileLock:
+    """Межпроцессная блокировка на отдельном файле .lock.
+
+    Блокировка повторно входимая внутри одного объекта, поэтому методы,
+    вызывающие друг друга, не блокируют сами себя. Потоки одного процесса
+    с разными объектами FileLock тоже исключают друг друга, так как каждый
+    объект открывает собственный дескриптор.
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+        self._depth = 0
+        self._file = None
+        self._thread_lock = threading.RLock()
+
+    def acquire(self):
+        """Ожидание монопольного доступа к файлу"""
+        self._thread_lock.acquire()
+        if self._depth == 0:
+            lock_file = None
+            try:
+                lock_file = open(self.filename, 'a+')
+                if fcntl is not None:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                else:
+                    lock_file.seek(0)
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+            except Exception:
+                if lock_file is not None:
+                    lock_file.close()
+                self._thread_lock.release()
+                raise
+            self._file = lock_file
+        self._depth += 1
+
+    def release(self):
+        """Освобождение блокировки"""
+        self._depth -= 1
+        if self._depth == 0:
+            try:
+                if fcntl is not None:
+                    fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+                else:
+                    self._file.seek(0)
+                    msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)
+            finally:
+                self._file.close()
+                self._file = None
+        self._thread_lock.release()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+
+
+def fsync_directory(path):
+    """Сброс на диск записи каталога после переименования файла"""
+    if os.name != 'posix':
+        return
+    fd = os.open(path or '.', os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
@@ -1,5 +1,13 @@
-import requests
+import random
+import threading
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+
+import requests
+from requests.adapters import HTTPAdapter
+from src.metrics import measure
 from src.vacancy import Vacancy
 
 
@@ -8,15 +16,145 @@ class JobAPI(ABC):
     def get_vacancies(self, keyword: str, amount: int):
         pass
 
+    def iter_pages(self, keyword: str, amount: int):
+        """Генератор страниц вакансий; по умолчанию одна страница с результатом get_vacancies"""
+        vacancies = self.get_vacancies(keyword, amount)
+        if vacancies:
+            yield vacancies
+
+    def iter_vacancies(self, keyword: str, amount: int):
+        """Генератор вакансий по мере загрузки страниц"""
+        for page_vacancies in self.iter_pages(keyword, amount):
+            yield from page_vacancies
+
+
+class TokenBucket:
+    """Ограничитель частоты запросов по алгоритму token bucket"""
+
+    def __init__(self, rate: float, capacity: float = None, clock=time.monotonic, sleep=time.sleep):
+        self.rate = rate
+        self.capacity = capacity or rate
+        self._tokens = self.capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Ожидание свободного токена"""
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            self._sleep(wait)
+
+
+class RequestScheduler:
+    """Планировщик запросов: лимит частоты, лимит одновременных запросов и повторы с задержкой.
+
+    При ответе 429 частота снижается вдвое и затем плавно восстанавливается
+    после успешных ответов, так что поток запросов держится у предела API.
+    """
+
+    RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+    def __init__(self, rate: float = 20, burst: float = None, max_in_flight: int = 8, max_retries: int = 5,
+                 backoff_base: float = 0.5, backoff_max: float = 30, clock=time.monotonic, sleep=time.sleep):
+        self.max_rate = rate
+        self.min_rate = rate / 16
+        self.bucket = TokenBucket(rate, burst, clock=clock, sleep=sleep)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retries = 0
+        self.throttled = 0
+        self._sleep = sleep
+        self._semaphore = threading.BoundedSemaphore(max_in_flight)
+        self._lock = threading.Lock()
+
+    def backoff(self, attempt: int):
+        """Экспоненциальная задержка с полным случайным разбросом"""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    @staticmethod
+    def retry_after(response):
+        """Задержка из заголовка Retry-After в секундах или None"""
+        value = response.headers.get('Retry-After') if response.headers else None
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+    def _adjust_rate(self, throttled: bool):
+        """Снижение частоты при 429 и постепенное восстановление после успеха"""
+        with self._lock:
+            if throttled:
+                self.throttled += 1
+                self.bucket.rate = max(self.min_rate, self.bucket.rate / 2)
+            elif self.bucket.rate < self.max_rate:
+                self.bucket.rate = min(self.max_rate, self.bucket.rate + self.max_rate / 20)
+
+    def request(self, send):
+        """Выполнение запроса send() с повторами; возвращает последний ответ"""
+        attempt = 0
+        while True:
+            self.bucket.acquire()
+            with self._semaphore:
+                try:
+                    response = send()
+                except (requests.ConnectionError, requests.Timeout):
+                    if attempt >= self.max_retries:
+                        raise
+                    delay = self.backoff(attempt)
+                else:
+                    throttled = response.status_code == 429
+                    self._adjust_rate(throttled)
+                    if response.status_code not in self.RETRY_STATUSES or attempt >= self.max_retries:
+                        return response
+                    delay = self.retry_after(response)
+                    if delay is None:
+                        delay = self.backoff(attempt)
+
+            with self._lock:
+                self.retries += 1
+            attempt += 1
+            self._sleep(delay)
+
 
 class hh_API(JobAPI):
     BASE_URL = 'https://api.hh.ru/vacancies'
 
-    def __init__(self):
+    def __init__(self, max_workers: int = 1, base_url: str = None, cache=None, scheduler=None):
         self.session = requests.Session()
+        self.max_workers = max(1, max_workers)
+        self.base_url = base_url or self.BASE_URL
+        # Необязательный ResponseCache для повторных запросов
+        self.cache = cache
+        # Планировщик можно разделить между несколькими клиентами ради общего лимита
+        self.scheduler = scheduler or RequestScheduler()
+
+        # Пул соединений должен вмещать все параллельные запросы
+        if self.max_workers > 1:
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_workers)
+            self.session.mount('http://', adapter)
+            self.session.mount('https://', adapter)
 
     def get_vacancies(self, keyword: str, amount: int):
         """Получение вакансий по ключевому слову"""
+        if self.max_workers > 1:
+            return self._get_vacancies_parallel(keyword, amount)
+
         vacancies = []
         page = 0
         per_page = min(100, amount)
@@ -40,34 +178,152 @@ class hh_API(JobAPI):
 
         return vacancies[:amount]
 
+    def iter_pages(self, keyword: str, amount: int, prefetch: bool = True, filters: dict = None):
+        """Генератор страниц вакансий, отдающий каждую страницу сразу после загрузки.
+
+        При prefetch следующая страница запрашивается в фоне, пока
+        вызывающий код обрабатывает текущую. filters добавляются к параметрам
+        запроса, например date_from и order_by.
+        """
+        per_page = min(100, amount)
+        remaining = amount
+        page = 0
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(self._fetch_page, keyword, page, per_page, filters)
+            while future is not None:
+                page_vacancies, total_pages = future.result()
+                page += 1
+
+                has_next = (
+                    len(page_vacancies) == per_page
+                    and len(page_vacancies) < remaining
+                    and (total_pages is None or page < total_pages)
+                )
+                future = None
+                if has_next and prefetch:
+                    future = executor.submit(self._fetch_page, keyword, page, per_page, filters)
+
+                if page_vacancies:
+                    yield page_vacancies[:remaining]
+                remaining -= min(len(page_vacancies), remaining)
+
+                if has_next and not prefetch:
+                    future = executor.submit(self._fetch_page, keyword, page, per_page, filters)
+
+    def iter_vacancies(self, keyword: str, amount: int, prefetch: bool = True, filters: dict = None):
+        """Генератор вакансий, отдающий каждую страницу сразу после загрузки"""
+        for page_vacancies in self.iter_pages(keyword, amount, prefetch, filters):
+            yield from page_vacancies
+
+    def _get_vacancies_parallel(self, keyword: str, amount: int):
+        """Параллельная загрузка страниц после первой"""
+        per_page = min(100, amount)
+        vacancies, total_pages = self._fetch_page(keyword, 0, per_page)
+        if len(vacancies) < per_page:
+            return vacancies[:amount]
+
+        pages_needed = -(-amount // per_page)
+        last_page = min(total_pages or pages_needed, pages_needed)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            # map сохраняет порядок страниц независимо от порядка ответов
+            results = executor.map(
+                lambda page: self._load_page(keyword, page, per_page),
+                range(1, last_page)
+            )
+            for page_vacancies in results:
+                if not page_vacancies:
+                    break
+                vacancies.extend(page_vacancies)
+
+        return vacancies[:amount]
+
     def _load_page(self, keyword: str, page: int, per_page: int):
         """Загрузка одной страницы вакансий"""
+        return self._fetch_page(keyword, page, per_page)[0]
+
+    def _get_json(self, params: dict):
+        """GET-запрос к API с учетом кэша ответов"""
+        if self.cache is None:
+            response = self.scheduler.request(
+                lambda: self.session.get(self.base_url, params=params, timeout=10)
+            )
+            response.raise_for_status()
+            return self._decode(response)
+
+        key = self.cache.make_key(self.base_url, params)
+        entry = self.cache.get(key)
+        if entry is not None and entry.fresh:
+            return entry.data
+
+        # Устаревший ответ подтверждаем условным запросом
+        headers = {}
+        if entry is not None and entry.etag:
+            headers['If-None-Match'] = entry.etag
+        if entry is not None and entry.last_modified:
+            headers['If-Modified-Since'] = entry.last_modified
+
+        response = self.scheduler.request(
+            lambda: self.session.get(self.base_url, params=params, headers=headers, timeout=10)
+        )
+        if entry is not None and response.status_code == 304:
+            self.cache.refresh(key)
+            return entry.data
+
+        response.raise_for_status()
+        data = self._decode(response)
+        self.cache.put(key, data, response.headers.get('ETag'), response.headers.get('Last-Modified'))
+        return data
+
+    @staticmethod
+    def _decode(response):
+        """Разбор JSON-ответа с замером времени и размера тела"""
+        with measure('hh_api.parse') as m:
+            if m:
+                m.bytes = len(response.content)
+            return response.json()
+
+    @staticmethod
+    def _page_params(keyword: str, page: int, per_page: int, filters: dict = None):
+        """Параметры запроса страницы вакансий"""
         params = {
             'text': keyword,
             'per_page': per_page,
             'page': page,
             'only_with_salary': True
         }
+        if filters:
+            params.update(filters)
+        return params
+
+    @staticmethod
+    def _parse_vacancy(item: dict):
+        """Создание вакансии из элемента ответа API"""
+        return Vacancy(
+            name=item['name'],
+            city=item['area']['name'],
+            url=item['url'],
+            salary=item['salary'],
+            vacancy_id=item['id']
+        )
+
+    @classmethod
+    def _parse_vacancies(cls, data: dict):
+        """Создание вакансий из ответа API"""
+        return [cls._parse_vacancy(item) for item in data.get('items', [])]
+
+    def _fetch_page(self, keyword: str, page: int, per_page: int, filters: dict = None):
+        """Загрузка страницы, возвращает вакансии и общее число страниц"""
+        params = self._page_params(keyword, page, per_page, filters)
 
         try:
-            response = self.session.get(self.BASE_URL, params=params, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-
-            return [
-                Vacancy(
-                    name=vacancy['name'],
-                    city=vacancy['area']['name'],
-                    url=vacancy['url'],
-                    salary=vacancy['salary'],
-                    vacancy_id=vacancy['id']
-                )
-                for vacancy in data.get('items', [])
-            ]
+            data = self._get_json(params)
+            return self._parse_vacancies(data), data.get('pages')
 
         except requests.RequestException as e:
             print(f"Ошибка запроса: {e}")
-            return []
+            return [], 0
         except KeyError as e:
             print(f"Ошибка обработки данных: {e}")
-            return []
\ No newline at end of file
+            return [], 0
@@ -0,0 +1,117 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+
+class CacheEntry:
+    """Сохраненный ответ API"""
+
+    def __init__(self, data, etag, last_modified, fresh):
+        self.data = data
+        self.etag = etag
+        self.last_modified = last_modified
+        self.fresh = fresh
+
+
+class ResponseCache:
+    """Дисковый кэш ответов HTTP с TTL, вытеснением LRU и поддержкой условных запросов"""
+
+    def __init__(self, filename='./data/hh_cache.db', ttl=300, max_entries=1000):
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self._lock = threading.Lock()
+        # Кэш используется из потоков параллельной загрузки страниц
+        self._connection = sqlite3.connect(filename, check_same_thread=False)
+        with self._connection:
+            self._connection.execute("""
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    body TEXT,
+                    etag TEXT,
+                    last_modified TEXT,
+                    stored_at REAL,
+                    accessed_at REAL
+                )
+            """)
+            self._connection.execute(
+                'CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses (accessed_at)'
+            )
+
+    @staticmethod
+    def make_key(url, params):
+        """Ключ кэша по адресу и параметрам запроса (текст, страница, фильтры)"""
+        raw = json.dumps([url, sorted((str(k), str(v)) for k, v in params.items())], ensure_ascii=False)
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def get(self, key):
+        """Сохраненный ответ или None; устаревший ответ возвращается для условного запроса"""
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT body, etag, last_modified, stored_at FROM responses WHERE key = ?', (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+
+            body, etag, last_modified, stored_at = row
+            fresh = now - stored_at < self.ttl
+            if fresh:
+                self.hits += 1
+                with self._connection:
+                    self._connection.execute('UPDATE responses SET accessed_at = ? WHERE key = ?', (now, key))
+            else:
+                self.misses += 1
+        return CacheEntry(json.loads(body), etag, last_modified, fresh)
+
+    def put(self, key, data, etag=None, last_modified=None):
+        """Сохранение ответа с вытеснением давно не использованных записей"""
+        now = time.time()
+        with self._lock, self._connection:
+            self._connection.execute(
+                'INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)',
+                (key, json.dumps(data, ensure_ascii=False), etag, last_modified, now, now)
+            )
+            self._connection.execute(
+                'DELETE FROM responses WHERE key IN ('
+                'SELECT key FROM responses ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)',
+                (self.max_entries,)
+            )
+
+    def refresh(self, key):
+        """Продление срока жизни ответа после 304 Not Modified"""
+        now = time.time()
+        with self._lock, self._connection:
+            self.revalidated += 1
+            self._connection.execute(
+                'UPDATE responses SET stored_at = ?, accessed_at = ? WHERE key = ?', (now, now, key)
+            )
+
+    def __len__(self):
+        with self._lock:
+            return self._connection.execute('SELECT COUNT(*) FROM responses').fetchone()[0]
+
+    def stats(self):
+        """Счетчики попаданий, промахов и подтвержденных сервером ответов"""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'revalidated': self.revalidated,
+            'entries': len(self)
+        }
+
+    def clear(self):
+        """Удаление всех сохраненных ответов"""
+        with self._lock, self._connection:
+            self._connection.execute('DELETE FROM responses')
+
+    def close(self):
+        """Закрытие файла кэша"""
+        self._connection.close()
@@ -0,0 +1,118 @@
+import hashlib
+import mmap
+import os
+import struct
+
+# Заголовок: сигнатура, версия, число слотов, число записей и отпечаток файла данных
+HEADER = struct.Struct('<4sIQQQQQ')
+# Слот хэш-таблицы: хэш ID, смещение и длина записи в файле данных
+RECORD = struct.Struct('<QQI')
+MAGIC = b'VIDX'
+VERSION = 1
+
+
+def id_hash(vacancy_id):
+    """64-битный хэш ID; ноль зарезервирован для пустого слота"""
+    digest = hashlib.blake2b(str(vacancy_id).encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'little') or 1
+
+
+class IdIndex:
+    """Индекс ID вакансий в файле из записей фиксированного размера, открываемом через mmap.
+
+    Записи образуют хэш-таблицу с открытой адресацией, поэтому поиск ID читает
+    из отображенного файла один или несколько соседних слотов и не требует
+    загрузки индекса в память. В заголовке хранится отпечаток файла данных,
+    по которому устаревший индекс отбрасывается при открытии.
+    """
+
+    def __init__(self, file, buffer, capacity, count, source_stat):
+        self._file = file
+        self._buffer = buffer
+        self._mask = capacity - 1
+        self.capacity = capacity
+        self.count = count
+        self.source_stat = source_stat
+
+    @staticmethod
+    def build(filename, spans, source_stat):
+        """Запись индекса по тройкам (ID, смещение, длина) через временный файл"""
+        spans = list(spans)
+        capacity = 8
+        while capacity < len(spans) * 2:
+            capacity *= 2
+        mask = capacity - 1
+
+        table = bytearray(capacity * RECORD.size)
+        count = 0
+        for vacancy_id, offset, length in spans:
+            key = id_hash(vacancy_id)
+            slot = key & mask
+            while True:
+                stored = RECORD.unpack_from(table, slot * RECORD.size)[0]
+                if stored == 0:
+                    RECORD.pack_into(table, slot * RECORD.size, key, offset, length)
+                    count += 1
+                    break
+                if stored == key:
+                    # Повторный ID: остается первая запись
+                    break
+                slot = (slot + 1) & mask
+
+        tmp_filename = filename + '.tmp'
+        try:
+            with open(tmp_filename, 'wb') as f:
+                f.write(HEADER.pack(MAGIC, VERSION, capacity, count, *source_stat))
+                f.write(table)
+            os.replace(tmp_filename, filename)
+        except OSError:
+            if os.path.exists(tmp_filename):
+                os.remove(tmp_filename)
+            raise
+
+    @classmethod
+    def open(cls, filename, source_stat):
+        """Отображение индекса в память; None если индекса нет или он не соответствует файлу данных"""
+        try:
+            f = open(filename, 'rb')
+        except FileNotFoundError:
+            return None
+
+        try:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            f.close()
+            return None
+
+        if len(buffer) >= HEADER.size:
+            magic, version, capacity, count, *stat = HEADER.unpack_from(buffer, 0)
+            if (magic == MAGIC and version == VERSION and tuple(stat) == tuple(source_stat)
+                    and len(buffer) == HEADER.size + capacity * RECORD.size):
+                return cls(f, buffer, capacity, count, tuple(stat))
+
+        buffer.close()
+        f.close()
+        return None
+
+    def lookup(self, vacancy_id):
+        """Смещение и длина записи в файле данных или None"""
+        key = id_hash(vacancy_id)
+        slot = key & self._mask
+        while True:
+            stored, offset, length = RECORD.unpack_from(self._buffer, HEADER.size + slot * RECORD.size)
+            if stored == 0:
+                return None
+            if stored == key:
+                return offset, length
+            slot = (slot + 1) & self._mask
+
+    def __contains__(self, vacancy_id):
+        return self.lookup(vacancy_id) is not None
+
+    def __len__(self):
+        return self.count
+
+    def close(self):
+        """Закрытие отображения и файла индекса"""
+        self._buffer.close()
+        self._file.close()
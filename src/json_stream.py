@@ -0,0 +1,142 @@
+import io
+import json
+
+CHUNK_SIZE = 1 << 16
+WHITESPACE = ' \t\n\r'
+
+_decoder = json.JSONDecoder()
+
+
+class _StreamReader:
+    """Буфер поверх файла для пошагового разбора JSON"""
+
+    def __init__(self, file, chunk_size):
+        self.file = file
+        self.chunk_size = chunk_size
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+        # Смещение в байтах UTF-8 для символа buffer[mark]
+        self.mark = 0
+        self.mark_bytes = 0
+
+    def _fill(self):
+        """Дочитывание следующего блока, прочитанная часть буфера отбрасывается"""
+        chunk = self.file.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.byte_position()
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        self.mark = 0
+        return True
+
+    def byte_position(self):
+        """Смещение текущей позиции от начала файла в байтах; каждый символ кодируется один раз"""
+        self.mark_bytes += len(self.buffer[self.mark:self.pos].encode('utf-8'))
+        self.mark = self.pos
+        return self.mark_bytes
+
+    def peek(self):
+        """Следующий значимый символ без его извлечения"""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                return ''
+
+    def expect(self, char):
+        """Извлечение ожидаемого символа структуры"""
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Ожидался символ {char!r}, получен {found!r}")
+        self.pos += 1
+
+    def value(self):
+        """Разбор следующего JSON-значения целиком"""
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # Число на границе буфера может продолжаться в следующем блоке
+            if end == len(self.buffer) and not self.eof and self._fill():
+                continue
+            self.pos = end
+            return value
+
+
+def _iter_array(reader, spans=False, resume=False):
+    """Поэлементный разбор массива; при spans элементы отдаются вместе с границами в байтах.
+
+    При resume разбор продолжается с позиции сразу после элемента массива.
+    """
+    if resume:
+        if reader.peek() != ',':
+            reader.expect(']')
+            return
+        reader.pos += 1
+    else:
+        reader.expect('[')
+        if reader.peek() == ']':
+            reader.pos += 1
+            return
+
+    while True:
+        if spans:
+            reader.peek()
+            start = reader.byte_position()
+            value = reader.value()
+            yield value, start, reader.byte_position() - start
+        else:
+            yield reader.value()
+        if reader.peek() == ',':
+            reader.pos += 1
+            continue
+        reader.expect(']')
+        return
+
+
+def iter_items(filename, key='items', chunk_size=CHUNK_SIZE, spans=False, start=None):
+    """Потоковое чтение элементов массива key из JSON-объекта в файле.
+
+    В памяти одновременно находится только текущий элемент и один блок файла.
+    При spans отдаются тройки (элемент, смещение, длина в байтах).
+    start - смещение конца ранее прочитанного элемента: чтение начинается
+    с этой позиции без разбора предыдущей части файла.
+    При нарушении структуры файла выбрасывается ValueError.
+    """
+    if start is not None:
+        with open(filename, 'rb') as raw:
+            raw.seek(start)
+            reader = _StreamReader(io.TextIOWrapper(raw, encoding='utf-8', newline=''), chunk_size)
+            reader.mark_bytes = start
+            yield from _iter_array(reader, spans, resume=True)
+        return
+
+    with open(filename, 'r', encoding='utf-8', newline='') as f:
+        reader = _StreamReader(f, chunk_size)
+        reader.expect('{')
+        if reader.peek() == '}':
+            return
+
+        while True:
+            name = reader.value()
+            reader.expect(':')
+            if name == key:
+                yield from _iter_array(reader, spans)
+                return
+
+            # Прочие поля верхнего уровня (found, pages и т.п.) пропускаются
+            reader.value()
+            if reader.peek() == ',':
+                reader.pos += 1
+                continue
+            reader.expect('}')
+            return
@@ -0,0 +1,258 @@
+"""Необязательные метрики времени и объема данных для горячих участков кода.
+
+Включаются переменной окружения VACANCIES_METRICS или флагами main.py:
+    VACANCIES_METRICS=1 python main.py
+    VACANCIES_METRICS=profile,memory python main.py
+    python main.py --metrics --profile --trace-memory
+
+При выключенных метриках measure() возвращает общий пустой контекст,
+а перехватчики методов из HOOKS не устанавливаются вовсе.
+"""
+import atexit
+import cProfile
+from functools import wraps
+import importlib
+import io
+import json
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+
+ENV_VAR = 'VACANCIES_METRICS'
+
+# Методы, которые оборачиваются при включении метрик: модуль, класс, атрибут, имя метрики
+HOOKS = [
+    ('src.hh_api', 'hh_API', '_load_page', 'hh_api.load_page'),
+    ('src.hh_api', 'hh_API', '_fetch_page', 'hh_api.fetch_page'),
+    ('src.vacancy', 'Vacancy', 'from_dict', 'vacancy.from_dict'),
+]
+
+
+class Metric:
+    """Число вызовов, суммарное, минимальное и максимальное время и объем данных"""
+
+    __slots__ = ('count', 'total', 'min', 'max', 'bytes')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = 0.0
+        self.bytes = 0
+
+    def add(self, elapsed, nbytes=0):
+        self.count += 1
+        self.total += elapsed
+        self.min = elapsed if self.min is None else min(self.min, elapsed)
+        self.max = max(self.max, elapsed)
+        self.bytes += nbytes
+
+    def to_dict(self):
+        return {
+            'count': self.count,
+            'total': self.total,
+            'mean': self.total / self.count if self.count else 0.0,
+            'min': self.min or 0.0,
+            'max': self.max,
+            'bytes': self.bytes
+        }
+
+
+class MetricsRegistry:
+    """Потокобезопасный реестр метрик по именам"""
+
+    def __init__(self):
+        self.enabled = False
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def record(self, name, elapsed, nbytes=0):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = Metric()
+            metric.add(elapsed, nbytes)
+
+    def snapshot(self):
+        """Метрики в виде словаря, упорядоченные по суммарному времени"""
+        with self._lock:
+            items = sorted(self._metrics.items(), key=lambda item: item[1].total, reverse=True)
+            return {name: metric.to_dict() for name, metric in items}
+
+    def reset(self):
+        with self._lock:
+            self._metrics.clear()
+
+    def summary(self):
+        """Таблица метрик для вывода"""
+        lines = [f"{'Метрика':<28} {'вызовов':>9} {'всего, с':>10} {'среднее, мс':>12} {'макс, мс':>10} {'байт':>12}"]
+        for name, metric in self.snapshot().items():
+            lines.append(f"{name:<28} {metric['count']:>9} {metric['total']:>10.3f} "
+                         f"{metric['mean'] * 1000:>12.3f} {metric['max'] * 1000:>10.3f} {metric['bytes']:>12}")
+        return '\n'.join(lines)
+
+
+registry = MetricsRegistry()
+
+
+class _Measurement:
+    """Замер одного участка; bytes можно задать внутри блока with"""
+
+    __slots__ = ('name', 'bytes', 'start')
+
+    def __init__(self, name):
+        self.name = name
+        self.bytes = 0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        registry.record(self.name, time.perf_counter() - self.start, self.bytes)
+        return False
+
+
+class _NullMeasurement:
+    """Пустой замер при выключенных метриках; ложен, чтобы не считать объем данных зря"""
+
+    __slots__ = ('bytes',)
+
+    def __bool__(self):
+        return False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL = _NullMeasurement()
+
+
+def measure(name):
+    """Контекстный менеджер замера участка кода: with measure('json.read') as m: m.bytes = ..."""
+    if not registry.enabled:
+        return _NULL
+    return _Measurement(name)
+
+
+def timed(name=None):
+    """Декоратор замера времени вызовов функции; без метрик вызов идет напрямую"""
+    def decorator(func):
+        metric_name = name or f'{func.__module__}.{func.__qualname__}'
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not registry.enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                registry.record(metric_name, time.perf_counter() - start)
+        return wrapper
+    return decorator
+
+
+class Session:
+    """Сеанс сбора метрик с необязательным cProfile и tracemalloc"""
+
+    def __init__(self, profile=False, memory=False, output=None, stream=None):
+        self.profile = profile
+        self.memory = memory
+        # Файл для метрик в JSON, дополнительно к выводу сводки
+        self.output = output
+        self.stream = stream
+        self._profiler = None
+        self._originals = []
+
+    def _install_hooks(self):
+        for module_name, class_name, attribute, metric_name in HOOKS:
+            owner = getattr(importlib.import_module(module_name), class_name)
+            original = owner.__dict__[attribute]
+            if isinstance(original, classmethod):
+                wrapped = classmethod(timed(metric_name)(original.__func__))
+            elif isinstance(original, staticmethod):
+                wrapped = staticmethod(timed(metric_name)(original.__func__))
+            else:
+                wrapped = timed(metric_name)(original)
+            self._originals.append((owner, attribute, original))
+            setattr(owner, attribute, wrapped)
+
+    def _remove_hooks(self):
+        for owner, attribute, original in reversed(self._originals):
+            setattr(owner, attribute, original)
+        self._originals.clear()
+
+    def start(self):
+        registry.reset()
+        registry.enabled = True
+        self._install_hooks()
+        if self.memory:
+            tracemalloc.start()
+        if self.profile:
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        return self
+
+    def stop(self):
+        """Остановка сбора и вывод сводки"""
+        if not registry.enabled:
+            return
+        if self._profiler is not None:
+            self._profiler.disable()
+        registry.enabled = False
+        self._remove_hooks()
+
+        stream = self.stream or sys.stderr
+        print("\n" + "=" * 50, file=stream)
+        print("МЕТРИКИ", file=stream)
+        print(registry.summary(), file=stream)
+
+        if self._profiler is not None:
+            buffer = io.StringIO()
+            pstats.Stats(self._profiler, stream=buffer).sort_stats('cumulative').print_stats(20)
+            print(buffer.getvalue(), file=stream)
+            self._profiler = None
+
+        memory = None
+        if self.memory and tracemalloc.is_tracing():
+            snapshot = tracemalloc.take_snapshot()
+            current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            memory = {'current': current, 'peak': peak}
+            print(f"Память: текущая {current / 1024:.1f} КБ, пиковая {peak / 1024:.1f} КБ", file=stream)
+            for stat in snapshot.statistics('lineno')[:10]:
+                print(stat, file=stream)
+
+        if self.output:
+            with open(self.output, 'w', encoding='utf-8') as f:
+                json.dump({'metrics': registry.snapshot(), 'memory': memory}, f, ensure_ascii=False, indent=2)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+        return False
+
+
+def enable(profile=False, memory=False, output=None):
+    """Включение метрик до завершения программы; сводка выводится при выходе"""
+    current = Session(profile, memory, output).start()
+    atexit.register(current.stop)
+    return current
+
+
+def enable_from_env(environ=None):
+    """Включение метрик по переменной окружения: 1, profile, memory или их список через запятую"""
+    value = (environ if environ is not None else os.environ).get(ENV_VAR, '').strip().lower()
+    if value in ('', '0', 'false', 'no'):
+        return None
+    options = {option.strip() for option in value.split(',')}
+    return enable(profile='profile' in options, memory='memory' in options)
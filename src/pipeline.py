@@ -0,0 +1,140 @@
+import queue
+import threading
+import time
+
+# Маркер конца потока страниц
+_DONE = object()
+
+
+class PipelineStats:
+    """Счетчики конвейера загрузки и сохранения"""
+
+    def __init__(self, queue_size):
+        self.queue_size = queue_size
+        self.fetched = 0
+        self.pages = 0
+        self.saved = 0
+        self.added = 0
+        self.batches = 0
+        self.producer_waits = 0
+        self.producer_wait_time = 0.0
+        self.write_time = 0.0
+        self.max_queue_depth = 0
+        self.started = time.perf_counter()
+        self.finished = None
+
+    @property
+    def elapsed(self):
+        end = self.finished if self.finished is not None else time.perf_counter()
+        return end - self.started
+
+    @property
+    def throughput(self):
+        """Сохраненных вакансий в секунду"""
+        return self.saved / self.elapsed if self.elapsed else 0.0
+
+    def __str__(self):
+        return (f"Загружено {self.fetched}, сохранено {self.saved} (новых {self.added}), "
+                f"{self.throughput:.0f} вак/с, очередь {self.max_queue_depth}/{self.queue_size}, "
+                f"ожиданий записи: {self.producer_waits} ({self.producer_wait_time:.2f} с)")
+
+
+class IngestPipeline:
+    """Конвейер: загрузка страниц из API и запись в хранилище в отдельном потоке.
+
+    Страницы передаются через ограниченную очередь, поэтому в памяти находится
+    не больше queue_size страниц. Поток записи объединяет страницы в пачки
+    по batch_size вакансий или сбрасывает неполную пачку, если новых страниц
+    нет дольше flush_interval секунд.
+    """
+
+    def __init__(self, job_api, file_handler, queue_size=8, batch_size=500, flush_interval=1.0, progress=None):
+        self.job_api = job_api
+        self.file_handler = file_handler
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.progress = progress
+
+    def run(self, keyword, amount):
+        """Загрузка и сохранение вакансий, возвращает статистику"""
+        pages = queue.Queue(maxsize=self.queue_size)
+        stats = PipelineStats(self.queue_size)
+        errors = []
+        writer = threading.Thread(target=self._write, args=(pages, stats, errors), daemon=True)
+        writer.start()
+
+        try:
+            for page_vacancies in self.job_api.iter_pages(keyword, amount):
+                stats.fetched += len(page_vacancies)
+                stats.pages += 1
+                if not self._put(pages, page_vacancies, stats, writer):
+                    break
+        finally:
+            self._put(pages, _DONE, stats, writer)
+            writer.join()
+            stats.finished = time.perf_counter()
+
+        if errors:
+            raise errors[0]
+        return stats
+
+    @staticmethod
+    def _put(pages, item, stats, writer):
+        """Передача страницы в очередь с учетом ожидания записи; False если поток записи завершился"""
+        try:
+            pages.put_nowait(item)
+            stats.max_queue_depth = max(stats.max_queue_depth, pages.qsize())
+            return True
+        except queue.Full:
+            pass
+
+        # Очередь заполнена: запись не успевает за загрузкой
+        stats.producer_waits += 1
+        start = time.perf_counter()
+        try:
+            while writer.is_alive():
+                try:
+                    pages.put(item, timeout=0.1)
+                    stats.max_queue_depth = max(stats.max_queue_depth, pages.qsize())
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        finally:
+            stats.producer_wait_time += time.perf_counter() - start
+
+    def _write(self, pages, stats, errors):
+        """Поток записи: пачки страниц сохраняются одним вызовом add_vacancies"""
+        batch = []
+        try:
+            while True:
+                try:
+                    item = pages.get(timeout=self.flush_interval)
+                except queue.Empty:
+                    self._flush(batch, stats)
+                    batch = []
+                    continue
+
+                if item is _DONE:
+                    self._flush(batch, stats)
+                    return
+                batch.extend(item)
+                if len(batch) >= self.batch_size:
+                    self._flush(batch, stats)
+                    batch = []
+        except Exception as e:
+            errors.append(e)
+
+    def _flush(self, batch, stats):
+        """Запись накопленной пачки в хранилище"""
+        if not batch:
+            return
+
+        start = time.perf_counter()
+        stats.added += self.file_handler.add_vacancies(batch)
+        stats.write_time += time.perf_counter() - start
+        stats.saved += len(batch)
+        stats.batches += 1
+        if self.progress is not None:
+            self.progress(stats)
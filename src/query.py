@@ -0,0 +1,371 @@
+from abc import ABC, abstractmethod
+import heapq
+from itertools import islice
+from operator import attrgetter
+
+# Поля вакансии, доступные в запросах, и функции получения их значений
+FIELDS = {
+    'id': attrgetter('id'),
+    'name': attrgetter('name'),
+    'city': attrgetter('city'),
+    'url': attrgetter('url'),
+    'currency': attrgetter('currency'),
+    'gross': attrgetter('gross'),
+    'salary_from': attrgetter('salary_from'),
+    'salary_to': attrgetter('salary_to'),
+    'salary_mid': lambda vacancy: vacancy.salary_value('mid'),
+}
+# Строковые поля сравниваются без преобразования str()
+STRING_FIELDS = {'id', 'name', 'city', 'url', 'currency'}
+
+
+def _getter(field):
+    """Функция получения значения поля, ValueError для неизвестного поля"""
+    getter = FIELDS.get(field)
+    if getter is None:
+        raise ValueError(f"Неизвестное поле запроса: {field}")
+    return getter
+
+
+class Condition(ABC):
+    """Условие запроса; условия объединяются операторами &, | и ~"""
+
+    def __and__(self, other):
+        return And(self, other)
+
+    def __or__(self, other):
+        return Or(self, other)
+
+    def __invert__(self):
+        return Not(self)
+
+    @abstractmethod
+    def compile(self):
+        """Функция-предикат от вакансии"""
+        pass
+
+    @abstractmethod
+    def to_sql(self, columns, text_columns):
+        """Выражение WHERE и параметры, None если условие не выражается в SQL"""
+        pass
+
+
+class Eq(Condition):
+    """Точное равенство значения поля"""
+
+    def __init__(self, field, value):
+        self.get = _getter(field)
+        self.field = field
+        self.value = value
+
+    def compile(self):
+        get, value = self.get, self.value
+        return lambda vacancy: get(vacancy) == value
+
+    def to_sql(self, columns, text_columns):
+        column = columns.get(self.field)
+        if column is None:
+            return None
+        if self.value is None:
+            return f'{column} IS NULL', []
+        return f'{column} = ?', [self.value]
+
+
+class Range(Condition):
+    """Значение поля в границах low..high включительно; пустые значения не подходят"""
+
+    def __init__(self, field, low=None, high=None):
+        self.get = _getter(field)
+        self.field = field
+        self.low = low
+        self.high = high
+
+    def compile(self):
+        get, low, high = self.get, self.low, self.high
+        if low is not None and high is not None:
+            return lambda vacancy: (value := get(vacancy)) is not None and low <= value <= high
+        if low is not None:
+            return lambda vacancy: (value := get(vacancy)) is not None and value >= low
+        if high is not None:
+            return lambda vacancy: (value := get(vacancy)) is not None and value <= high
+        return lambda vacancy: get(vacancy) is not None
+
+    def to_sql(self, columns, text_columns):
+        column = columns.get(self.field)
+        if column is None:
+            return None
+        conditions = [f'{column} IS NOT NULL']
+        params = []
+        if self.low is not None:
+            conditions.append(f'{column} >= ?')
+            params.append(self.low)
+        if self.high is not None:
+            conditions.append(f'{column} <= ?')
+            params.append(self.high)
+        return ' AND '.join(conditions), params
+
+
+class In(Condition):
+    """Значение поля из списка"""
+
+    def __init__(self, field, values):
+        self.get = _getter(field)
+        self.field = field
+        self.values = frozenset(values)
+
+    def compile(self):
+        get, values = self.get, self.values
+        return lambda vacancy: get(vacancy) in values
+
+    def to_sql(self, columns, text_columns):
+        column = columns.get(self.field)
+        if column is None or None in self.values:
+            return None
+        if not self.values:
+            return '0', []
+        return f"{column} IN ({', '.join('?' * len(self.values))})", list(self.values)
+
+
+class Contains(Condition):
+    """Подстрока в значении поля без учета регистра, как в get_vacancies(**criteria)"""
+
+    def __init__(self, field, text):
+        # Критерии get_vacancies допускают любой атрибут вакансии
+        self.get = FIELDS.get(field) or (lambda vacancy: getattr(vacancy, field, None))
+        self.field = field
+        self.text = str(text).lower()
+
+    def compile(self):
+        get, text = self.get, self.text
+        if self.field in STRING_FIELDS:
+            # ID из API может прийти числом, поэтому нестроковые значения приводятся к str
+            return lambda vacancy: (value := get(vacancy)) is not None and text in (
+                value.lower() if isinstance(value, str) else str(value).lower()
+            )
+        return lambda vacancy: (value := get(vacancy)) is not None and text in str(value).lower()
+
+    def to_sql(self, columns, text_columns):
+        column = text_columns.get(self.field)
+        if column is None:
+            return None
+        return f'instr({column}, ?) > 0', [self.text]
+
+
+class Prefix(Condition):
+    """Начало значения поля без учета регистра; в SQLite выполняется по индексу диапазоном"""
+
+    def __init__(self, field, text):
+        self.get = _getter(field)
+        self.field = field
+        self.text = str(text).lower()
+
+    def compile(self):
+        get, text = self.get, self.text
+        return lambda vacancy: (value := get(vacancy)) is not None and str(value).lower().startswith(text)
+
+    def to_sql(self, columns, text_columns):
+        column = text_columns.get(self.field)
+        if column is None or not self.text:
+            return None
+        # Строки с префиксом text лежат в диапазоне [text, text с увеличенным последним символом)
+        upper = self.text[:-1] + chr(ord(self.text[-1]) + 1)
+        return f'{column} >= ? AND {column} < ?', [self.text, upper]
+
+
+class And(Condition):
+    """Выполнение всех условий"""
+
+    def __init__(self, *conditions):
+        self.conditions = []
+        for condition in conditions:
+            # Вложенные And разворачиваются, чтобы планировщик видел все условия верхнего уровня
+            self.conditions.extend(condition.conditions if isinstance(condition, And) else [condition])
+
+    def compile(self):
+        predicates = [condition.compile() for condition in self.conditions]
+        if len(predicates) == 1:
+            return predicates[0]
+        return lambda vacancy: all(predicate(vacancy) for predicate in predicates)
+
+    def to_sql(self, columns, text_columns):
+        return _join_sql(self.conditions, ' AND ', '1', columns, text_columns)
+
+
+class Or(Condition):
+    """Выполнение хотя бы одного условия"""
+
+    def __init__(self, *conditions):
+        self.conditions = list(conditions)
+
+    def compile(self):
+        predicates = [condition.compile() for condition in self.conditions]
+        return lambda vacancy: any(predicate(vacancy) for predicate in predicates)
+
+    def to_sql(self, columns, text_columns):
+        return _join_sql(self.conditions, ' OR ', '0', columns, text_columns)
+
+
+class Not(Condition):
+    """Отрицание условия"""
+
+    def __init__(self, condition):
+        self.condition = condition
+
+    def compile(self):
+        predicate = self.condition.compile()
+        return lambda vacancy: not predicate(vacancy)
+
+    def to_sql(self, columns, text_columns):
+        compiled = self.condition.to_sql(columns, text_columns)
+        if compiled is None:
+            return None
+        # В SQL NOT от NULL дает NULL, поэтому отрицание приводится к истине или лжи явно
+        sql, params = compiled
+        return f'coalesce(NOT ({sql}), 1)', params
+
+
+def _join_sql(conditions, operator, empty, columns, text_columns):
+    """Объединение SQL-выражений условий, None если хотя бы одно не выражается в SQL"""
+    parts = []
+    params = []
+    for condition in conditions:
+        compiled = condition.to_sql(columns, text_columns)
+        if compiled is None:
+            return None
+        parts.append(f'({compiled[0]})')
+        params.extend(compiled[1])
+    return (operator.join(parts) if parts else empty), params
+
+
+def criteria_condition(criteria):
+    """Условие для критериев get_vacancies(**criteria), None если критериев нет"""
+    if not criteria:
+        return None
+    return And(*(Contains(key, value) for key, value in criteria.items()))
+
+
+class Query:
+    """Запрос к хранилищу: условие, сортировка, limit и offset.
+
+    Методы возвращают новый запрос, поэтому запросы можно дополнять:
+    Query().where(In('city', ['Москва'])).order_by('salary_from', descending=True).limit(10)
+    Условие компилируется в предикат один раз при первом выполнении.
+    """
+
+    def __init__(self, condition=None, order_field=None, descending=False, limit_count=None, offset_count=0):
+        if order_field is not None:
+            _getter(order_field)
+        if (limit_count is not None and limit_count < 0) or offset_count < 0:
+            raise ValueError("limit и offset не могут быть отрицательными")
+        self.condition = condition
+        self.order_field = order_field
+        self.descending = descending
+        self.limit_count = limit_count
+        self.offset_count = offset_count
+        self._predicate = None
+
+    def _replace(self, **changes):
+        params = {
+            'condition': self.condition,
+            'order_field': self.order_field,
+            'descending': self.descending,
+            'limit_count': self.limit_count,
+            'offset_count': self.offset_count
+        }
+        params.update(changes)
+        return Query(**params)
+
+    def where(self, *conditions):
+        """Запрос с дополнительными условиями, объединенными через AND"""
+        if self.condition is not None:
+            conditions = (self.condition,) + conditions
+        return self._replace(condition=conditions[0] if len(conditions) == 1 else And(*conditions))
+
+    def order_by(self, field, descending=False):
+        """Сортировка по полю; пустые значения всегда в конце"""
+        return self._replace(order_field=field, descending=descending)
+
+    def limit(self, count):
+        return self._replace(limit_count=count)
+
+    def offset(self, count):
+        return self._replace(offset_count=count)
+
+    def predicate(self):
+        """Скомпилированное условие или None, если условия нет"""
+        if self.condition is None:
+            return None
+        if self._predicate is None:
+            self._predicate = self.condition.compile()
+        return self._predicate
+
+    def planned_ids(self):
+        """ID, которыми ограничен результат по условию верхнего уровня, или None.
+
+        Хранилища с индексом ID читают только эти вакансии вместо полного обхода.
+        """
+        conditions = self.condition.conditions if isinstance(self.condition, And) else [self.condition]
+        ids = None
+        for condition in conditions:
+            if isinstance(condition, Eq) and condition.field == 'id':
+                values = {condition.value}
+            elif isinstance(condition, In) and condition.field == 'id':
+                values = set(condition.values)
+            else:
+                continue
+            ids = values if ids is None else ids & values
+        return ids
+
+    def run(self, vacancies):
+        """Выполнение запроса над итерируемым набором вакансий за один проход"""
+        predicate = self.predicate()
+        matched = vacancies if predicate is None else filter(predicate, vacancies)
+        start = self.offset_count
+        stop = None if self.limit_count is None else start + self.limit_count
+
+        if self.order_field is None:
+            # Без сортировки обход прекращается, как только набрано нужное число вакансий
+            return list(islice(matched, start, stop))
+
+        get = FIELDS[self.order_field]
+        if self.descending:
+            def key(vacancy):
+                value = get(vacancy)
+                return value is not None, value
+        else:
+            def key(vacancy):
+                value = get(vacancy)
+                return value is None, value
+
+        if stop is None:
+            ordered = sorted(matched, key=key, reverse=self.descending)
+        elif self.descending:
+            ordered = heapq.nlargest(stop, matched, key=key)
+        else:
+            ordered = heapq.nsmallest(stop, matched, key=key)
+        return ordered[start:stop]
+
+    def to_sql(self, columns, text_columns):
+        """Условие, сортировка и limit/offset в SQL или None, если запрос не выражается в SQL"""
+        where = self.condition.to_sql(columns, text_columns) if self.condition is not None else ('1', [])
+        if where is None:
+            return None
+        sql, params = where
+        params = list(params)
+
+        if self.order_field is not None:
+            column = columns.get(self.order_field)
+            if column is None:
+                return None
+            # SQLite считает NULL наименьшим значением: при сортировке по убыванию пустые значения и так в конце
+            if self.descending:
+                sql += f' ORDER BY {column} DESC, rowid'
+            else:
+                sql += f' ORDER BY {column} IS NULL, {column}, rowid'
+        else:
+            sql += ' ORDER BY rowid'
+
+        if self.limit_count is not None or self.offset_count:
+            sql += ' LIMIT ? OFFSET ?'
+            params.extend([-1 if self.limit_count is None else self.limit_count, self.offset_count])
+        return sql, params
@@ -0,0 +1,170 @@
+import json
+import os
+import time
+
+import requests
+
+# Доля зарплаты после вычета НДФЛ 13% для вакансий с зарплатой до вычета
+NET_RATIO = 0.87
+
+
+class HHRatesSource:
+    """Курсы валют из справочника HH API: сколько единиц валюты стоит один рубль"""
+
+    URL = 'https://api.hh.ru/dictionaries'
+
+    def __init__(self, session=None, url=None):
+        self.session = session or requests.Session()
+        self.url = url or self.URL
+
+    def fetch(self):
+        response = self.session.get(self.url, timeout=10)
+        response.raise_for_status()
+        return {currency['code']: currency['rate'] for currency in response.json().get('currency', [])}
+
+
+class StaticRatesSource:
+    """Фиксированные курсы вместо HH API, например в тестах или без сети"""
+
+    def __init__(self, rates):
+        self.rates = dict(rates)
+
+    def fetch(self):
+        return dict(self.rates)
+
+
+class RatesTable:
+    """Курсы валют с локальным кэшем в JSON-файле и сроком жизни ttl секунд.
+
+    Устаревший кэш используется, если источник недоступен.
+    """
+
+    def __init__(self, source=None, filename='./data/currency_rates.json', ttl=24 * 3600, clock=time.time):
+        self.source = source or HHRatesSource()
+        self.filename = filename
+        self.ttl = ttl
+        self._clock = clock
+        self._rates = None
+        self._fetched_at = None
+
+    def _read_cache(self):
+        """Курсы и время их получения из файла кэша"""
+        try:
+            with open(self.filename, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            return cached['rates'], cached['fetched_at']
+        except (OSError, ValueError, KeyError, TypeError):
+            return None, None
+
+    def _write_cache(self):
+        """Сохранение курсов через временный файл"""
+        os.makedirs(os.path.dirname(self.filename) or '.', exist_ok=True)
+        tmp_filename = self.filename + '.tmp'
+        with open(tmp_filename, 'w', encoding='utf-8') as f:
+            json.dump({'rates': self._rates, 'fetched_at': self._fetched_at}, f, ensure_ascii=False)
+        os.replace(tmp_filename, self.filename)
+
+    def _is_fresh(self):
+        return self._fetched_at is not None and self._clock() - self._fetched_at < self.ttl
+
+    def rates(self):
+        """Актуальные курсы: из памяти, из файла кэша или из источника"""
+        if self._is_fresh():
+            return self._rates
+
+        if self._rates is None:
+            self._rates, self._fetched_at = self._read_cache()
+            if self._is_fresh():
+                return self._rates
+
+        try:
+            rates = self.source.fetch()
+        except (requests.RequestException, ValueError, KeyError) as e:
+            print(f"Не удалось обновить курсы валют: {e}")
+            return self._rates or {}
+
+        self._rates = rates
+        self._fetched_at = self._clock()
+        self._write_cache()
+        return self._rates
+
+
+class SalaryNormalizer:
+    """Пересчет зарплат в базовую валюту для сравнения вакансий в разных валютах.
+
+    Зарплата до вычета налога (gross) приводится к сумме на руки, если net.
+    Результат сохраняется в vacancy.salary_base вместе с ключом курсов
+    в vacancy.salary_base_key и пересчитывается, только когда курсы меняются.
+    """
+
+    def __init__(self, rates_table=None, base='RUR', net=True, net_ratio=NET_RATIO):
+        self.rates_table = rates_table or RatesTable()
+        self.base = base
+        self.net = net
+        self.net_ratio = net_ratio
+
+    def _factor(self, currency, gross, rates):
+        """Множитель перевода суммы в базовую валюту, None если курс неизвестен"""
+        if currency == self.base:
+            factor = 1.0
+        else:
+            rate = rates.get(currency)
+            base_rate = rates.get(self.base, 1.0 if self.base == 'RUR' else None)
+            if not rate or not base_rate:
+                return None
+            factor = base_rate / rate
+        if self.net and gross:
+            factor *= self.net_ratio
+        return factor
+
+    def conversion(self):
+        """Ключ текущих курсов и настроек пересчета и функция множителя от валюты и признака gross.
+
+        Ключ меняется вместе с курсами, поэтому по нему хранилище определяет,
+        что сохраненные зарплаты в базовой валюте устарели.
+        """
+        rates = self.rates_table.rates()
+        key = json.dumps([self.base, self.net, self.net_ratio, rates], sort_keys=True)
+        factors = {}
+
+        def factor(currency, gross):
+            pair = (currency, bool(gross))
+            if pair not in factors:
+                factors[pair] = self._factor(currency, gross, rates)
+            return factors[pair]
+        return key, factor
+
+    def convert(self, amount, currency, gross=None):
+        """Сумма в базовой валюте или None"""
+        if amount is None:
+            return None
+        factor = self._factor(currency, gross, self.rates_table.rates())
+        return None if factor is None else round(amount * factor)
+
+    def normalize(self, vacancy, force=False):
+        """Заполнение vacancy.salary_base, возвращает вакансию"""
+        return self.normalize_all([vacancy], force)[0]
+
+    def normalize_all(self, vacancies, force=False):
+        """Пересчет зарплат списка вакансий с одним обращением к таблице курсов.
+
+        Вакансии, пересчитанные по текущим курсам, пропускаются; пересчитанные
+        по старым курсам (например, закэшированные хранилищем) обновляются.
+        """
+        key = factor = None
+        for vacancy in vacancies:
+            if vacancy.salary_from is None and vacancy.salary_to is None:
+                continue
+            if key is None:
+                key, factor = self.conversion()
+            if vacancy.salary_base_key == key and not force:
+                continue
+
+            rate = factor(vacancy.currency, vacancy.gross)
+            # Без курса валюты прежний пересчет тоже недействителен
+            vacancy.salary_base = None if rate is None else (
+                None if vacancy.salary_from is None else round(vacancy.salary_from * rate),
+                None if vacancy.salary_to is None else round(vacancy.salary_to * rate)
+            )
+            vacancy.salary_base_key = key
+        return vacancies
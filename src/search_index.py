@@ -0,0 +1,138 @@
+import json
+import os
+import re
+
+TOKEN_RE = re.compile(r'\w+')
+
+# Окончания для упрощенного стемминга, от длинных к коротким
+RUSSIAN_ENDINGS = (
+    'иями', 'ями', 'ами', 'ого', 'его', 'ому', 'ему', 'ыми', 'ими',
+    'ой', 'ей', 'ий', 'ый', 'ая', 'яя', 'ое', 'ее', 'ые', 'ие', 'ов', 'ев',
+    'ам', 'ям', 'ах', 'ях', 'ом', 'ем', 'а', 'я', 'о', 'е', 'ы', 'и', 'у', 'ю', 'ь'
+)
+MIN_STEM_LENGTH = 3
+
+
+def normalize(text):
+    """Приведение к нижнему регистру с заменой ё на е"""
+    return text.lower().replace('ё', 'е')
+
+
+def stem(token):
+    """Отбрасывание типового окончания русского слова"""
+    for ending in RUSSIAN_ENDINGS:
+        if token.endswith(ending) and len(token) - len(ending) >= MIN_STEM_LENGTH:
+            return token[:-len(ending)]
+    return token
+
+
+def tokenize(text, use_stemming=False):
+    """Разбиение текста на нормализованные токены"""
+    tokens = TOKEN_RE.findall(normalize(text or ''))
+    if use_stemming:
+        tokens = [stem(token) for token in tokens]
+    return tokens
+
+
+class SearchIndex:
+    """Инвертированный индекс по токенам названия и города вакансии"""
+
+    def __init__(self, use_stemming=False):
+        self.use_stemming = use_stemming
+        self.source_stat = None
+        self._postings = {}
+        self._documents = {}
+
+    def __len__(self):
+        return len(self._documents)
+
+    def _document_tokens(self, vacancy):
+        """Уникальные токены вакансии"""
+        text = f"{vacancy.name or ''} {vacancy.city or ''}"
+        return set(tokenize(text, self.use_stemming))
+
+    def add(self, vacancy):
+        """Добавление вакансии в индекс"""
+        self.remove(vacancy.id)
+        tokens = self._document_tokens(vacancy)
+        self._documents[vacancy.id] = tokens
+        for token in tokens:
+            self._postings.setdefault(token, set()).add(vacancy.id)
+
+    def remove(self, vacancy_id):
+        """Удаление вакансии из индекса"""
+        tokens = self._documents.pop(vacancy_id, None)
+        if not tokens:
+            return
+        for token in tokens:
+            ids = self._postings.get(token)
+            if ids is not None:
+                ids.discard(vacancy_id)
+                if not ids:
+                    del self._postings[token]
+
+    def clear(self):
+        """Очистка индекса"""
+        self._postings.clear()
+        self._documents.clear()
+
+    def search(self, query, mode='and'):
+        """Множество ID вакансий, содержащих все (and) или любые (or) слова запроса"""
+        if mode not in ('and', 'or'):
+            raise ValueError(f"Неизвестный режим поиска: {mode}")
+
+        tokens = set(tokenize(query, self.use_stemming))
+        if not tokens:
+            return set()
+
+        postings = [self._postings.get(token, set()) for token in tokens]
+        if mode == 'or':
+            return set().union(*postings)
+
+        # Пересечение начинаем с самого короткого списка
+        postings.sort(key=len)
+        result = set(postings[0])
+        for ids in postings[1:]:
+            result &= ids
+            if not result:
+                break
+        return result
+
+    @classmethod
+    def build(cls, vacancies, use_stemming=False):
+        """Построение индекса по списку вакансий"""
+        index = cls(use_stemming)
+        for vacancy in vacancies:
+            index.add(vacancy)
+        return index
+
+    def save(self, filename):
+        """Сохранение индекса в файл рядом с данными"""
+        data = {
+            'use_stemming': self.use_stemming,
+            'source_stat': self.source_stat,
+            'documents': {vacancy_id: sorted(tokens) for vacancy_id, tokens in self._documents.items()}
+        }
+        tmp_filename = filename + '.tmp'
+        with open(tmp_filename, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_filename, filename)
+
+    @classmethod
+    def load(cls, filename):
+        """Загрузка индекса из файла, None если файла нет или он поврежден"""
+        try:
+            with open(filename, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+        index = cls(data.get('use_stemming', False))
+        stat = data.get('source_stat')
+        index.source_stat = tuple(stat) if stat else None
+        for vacancy_id, tokens in data.get('documents', {}).items():
+            tokens = set(tokens)
+            index._documents[vacancy_id] = tokens
+            for token in tokens:
+                index._postings.setdefault(token, set()).add(vacancy_id)
+        return index
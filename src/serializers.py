@@ -0,0 +1,160 @@
+import argparse
+import gzip
+import json
+import marshal
+import os
+import zlib
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+GZIP_MAGIC = b'\x1f\x8b'
+ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+MARSHAL_MAGIC = b'VACM\x01'
+
+
+class SerializationError(ValueError):
+    """Поврежденные данные: ошибка распаковки или разбора любого из форматов"""
+
+
+class JSONSerializer:
+    """JSON с отступами (исходный формат) или компактный JSON без пробелов"""
+
+    def __init__(self, compact=False):
+        self.compact = compact
+        self.name = 'json-compact' if compact else 'json'
+
+    def dumps(self, data):
+        if self.compact:
+            text = json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+        else:
+            text = json.dumps(data, ensure_ascii=False, indent=2)
+        return text.encode('utf-8')
+
+    def loads(self, raw):
+        return json.loads(raw.decode('utf-8'))
+
+
+class MarshalSerializer:
+    """Двоичный формат marshal: самый быстрый разбор, но только для чтения этим же Python"""
+
+    name = 'marshal'
+
+    def dumps(self, data):
+        return MARSHAL_MAGIC + marshal.dumps(data)
+
+    def loads(self, raw):
+        if not raw.startswith(MARSHAL_MAGIC):
+            raise ValueError("Файл не в формате marshal")
+        return marshal.loads(raw[len(MARSHAL_MAGIC):])
+
+
+class CompressedSerializer:
+    """Сжатие gzip или zstd поверх другого формата"""
+
+    def __init__(self, inner, compression, level=None):
+        if compression == 'zstd' and zstandard is None:
+            raise ValueError("Для сжатия zstd установите пакет zstandard")
+        if compression not in ('gzip', 'zstd'):
+            raise ValueError(f"Неизвестное сжатие: {compression}")
+        self.inner = inner
+        self.compression = compression
+        self.level = level
+        self.name = f'{inner.name}+{compression}'
+
+    def dumps(self, data):
+        raw = self.inner.dumps(data)
+        if self.compression == 'gzip':
+            # Уровень 6 заметно быстрее 9 при почти том же размере
+            return gzip.compress(raw, compresslevel=self.level or 6, mtime=0)
+        return zstandard.ZstdCompressor(level=self.level or 3).compress(raw)
+
+    def loads(self, raw):
+        return self.inner.loads(decompress(raw))
+
+
+FORMATS = {
+    'json': lambda: JSONSerializer(),
+    'json-compact': lambda: JSONSerializer(compact=True),
+    'marshal': lambda: MarshalSerializer(),
+}
+
+
+def get_serializer(name='json'):
+    """Формат по имени: json, json-compact, marshal, с суффиксом +gzip или +zstd для сжатия"""
+    base, _, compression = name.partition('+')
+    factory = FORMATS.get(base)
+    if factory is None:
+        raise ValueError(f"Неизвестный формат: {name}")
+    serializer = factory()
+    return CompressedSerializer(serializer, compression) if compression else serializer
+
+
+def decompress(raw):
+    """Распаковка gzip или zstd; несжатые данные возвращаются как есть"""
+    if raw.startswith(GZIP_MAGIC):
+        try:
+            return gzip.decompress(raw)
+        except (OSError, EOFError, zlib.error) as e:
+            raise SerializationError(f"Поврежденные данные gzip: {e}") from e
+    if raw.startswith(ZSTD_MAGIC):
+        # Отсутствие пакета - не повреждение данных, поэтому это обычный ValueError
+        if zstandard is None:
+            raise ValueError("Файл сжат zstd, установите пакет zstandard")
+        try:
+            return zstandard.ZstdDecompressor().decompress(raw)
+        except zstandard.ZstdError as e:
+            raise SerializationError(f"Поврежденные данные zstd: {e}") from e
+    return raw
+
+
+def is_plain_json(head):
+    """Проверка первых байт файла: несжатый JSON можно читать потоково"""
+    return not head.startswith((GZIP_MAGIC, ZSTD_MAGIC, MARSHAL_MAGIC))
+
+
+def loads(raw):
+    """Разбор данных с определением формата по первым байтам; SerializationError для поврежденных данных"""
+    raw = decompress(raw)
+    try:
+        if raw.startswith(MARSHAL_MAGIC):
+            return MarshalSerializer().loads(raw)
+        return json.loads(raw.decode('utf-8'))
+    except (ValueError, EOFError, TypeError) as e:
+        raise SerializationError(f"Поврежденные данные: {e}") from e
+
+
+def migrate(source, target, serializer):
+    """Перезапись файла вакансий в другом формате; source и target могут совпадать"""
+    with open(source, 'rb') as f:
+        data = loads(f.read())
+    raw = serializer.dumps(data)
+    tmp_filename = target + '.tmp'
+    with open(tmp_filename, 'wb') as f:
+        f.write(raw)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_filename, target)
+    return len(data.get('items', [])), len(raw)
+
+
+def main(argv=None):
+    """Перенос файла вакансий в другой формат.
+
+    Запуск: python -m src.serializers data/vacancies.json data/vacancies.bin --format marshal+gzip
+    """
+    parser = argparse.ArgumentParser(description="Перенос файла вакансий в другой формат")
+    parser.add_argument('source')
+    parser.add_argument('target')
+    parser.add_argument('--format', default='json-compact',
+                        help="json, json-compact или marshal, сжатие: +gzip, +zstd")
+    args = parser.parse_args(argv)
+
+    count, size = migrate(args.source, args.target, get_serializer(args.format))
+    print(f"Записано вакансий: {count}, размер файла: {size} байт ({args.format})")
+
+
+if __name__ == '__main__':
+    main()
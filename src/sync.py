@@ -0,0 +1,126 @@
+import json
+import os
+from datetime import datetime, timedelta, timezone
+
+
+class SyncState:
+    """Время последней синхронизации для каждого запроса, хранимое в небольшом JSON-файле"""
+
+    def __init__(self, filename='./data/sync_state.json'):
+        self.filename = filename
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        self._queries = self._read()
+
+    def _read(self):
+        """Чтение состояния, поврежденный или отсутствующий файл дает пустое состояние"""
+        try:
+            with open(self.filename, 'r', encoding='utf-8') as f:
+                queries = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+        return queries if isinstance(queries, dict) else {}
+
+    @staticmethod
+    def make_key(keyword, filters=None):
+        """Ключ запроса по ключевому слову и фильтрам"""
+        return json.dumps([keyword.strip().lower(), sorted((filters or {}).items())], ensure_ascii=False)
+
+    def get(self, keyword, filters=None):
+        """Время последней синхронизации запроса или None"""
+        value = self._queries.get(self.make_key(keyword, filters))
+        if value is None:
+            return None
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            return None
+
+    def set(self, keyword, moment, filters=None):
+        """Запоминание времени синхронизации запроса"""
+        self._queries[self.make_key(keyword, filters)] = moment.isoformat(timespec='seconds')
+
+    def save(self):
+        """Запись состояния через временный файл"""
+        tmp_filename = self.filename + '.tmp'
+        with open(tmp_filename, 'w', encoding='utf-8') as f:
+            json.dump(self._queries, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_filename, self.filename)
+
+
+class SyncStats:
+    """Результат инкрементальной синхронизации"""
+
+    def __init__(self, since):
+        self.since = since
+        self.pages = 0
+        self.fetched = 0
+        self.inserted = 0
+        self.updated = 0
+        self.unchanged = 0
+
+    def __str__(self):
+        since = 'полная загрузка' if self.since is None else f"изменения с {self.since.isoformat(timespec='seconds')}"
+        return (f"Синхронизация ({since}): страниц {self.pages}, получено {self.fetched}, "
+                f"новых {self.inserted}, обновлено {self.updated}, без изменений {self.unchanged}")
+
+
+class VacancySync:
+    """Инкрементальная синхронизация хранилища с HH API.
+
+    Запрашиваются только вакансии, опубликованные после прошлой синхронизации
+    запроса, в порядке от новых к старым. Загрузка страниц прекращается на
+    первой странице с уже сохраненной и не изменившейся вакансией, новые и
+    измененные вакансии записываются одним вызовом upsert_vacancies.
+    """
+
+    # Перекрытие окна date_from: вакансии появляются в поиске с задержкой после публикации
+    OVERLAP = timedelta(minutes=10)
+
+    def __init__(self, hh_api, file_handler, state=None, clock=None):
+        self.hh_api = hh_api
+        self.file_handler = file_handler
+        self.state = state or SyncState()
+        self._clock = clock or (lambda: datetime.now(timezone.utc))
+
+    def sync(self, keyword, amount=2000, filters=None):
+        """Загрузка новых и измененных вакансий по запросу, возвращает статистику"""
+        started = self._clock()
+        since = self.state.get(keyword, filters)
+        stats = SyncStats(since)
+
+        params = dict(filters or {})
+        params['order_by'] = 'publication_time'
+        if since is not None:
+            params['date_from'] = (since - self.OVERLAP).isoformat(timespec='seconds')
+
+        changed = []
+        changed_ids = set()
+        # Без prefetch, чтобы после остановки не было лишнего запроса
+        for page_vacancies in self.hh_api.iter_pages(keyword, amount, prefetch=False, filters=params):
+            stats.pages += 1
+            stats.fetched += len(page_vacancies)
+            reached_known = False
+            for vacancy in page_vacancies:
+                # Повтор из-за сдвига страниц во время загрузки
+                if vacancy.id in changed_ids:
+                    continue
+                # Сохраненная вакансия ищется по ID, без чтения всего хранилища
+                stored = self.file_handler.get_by_id(vacancy.id)
+                if stored is None or stored.to_dict() != vacancy.to_dict():
+                    changed.append(vacancy)
+                    changed_ids.add(vacancy.id)
+                else:
+                    reached_known = True
+            # Дальше идут более старые вакансии, сохраненные в прошлые запуски
+            if reached_known:
+                break
+
+        if changed:
+            result = self.file_handler.upsert_vacancies(changed)
+            stats.inserted = result['inserted']
+            stats.updated = result['updated']
+        stats.unchanged = stats.fetched - len(changed)
+
+        self.state.set(keyword, started, filters)
+        self.state.save()
+        return stats
@@ -1,12 +1,23 @@
 from src.hh_api import hh_API
 from src.file_handler import FileHandlerJSON
+from src.pipeline import IngestPipeline
+from src.salary import SalaryNormalizer
+from src.sync import VacancySync
 from src.vacancy import Vacancy
 
 
 class UserInterface:
-    def __init__(self):
-        self.hh_api = hh_API()
-        self.file_handler = FileHandlerJSON()
+    # Размер пачки вакансий, сохраняемой за одну запись в файл
+    SAVE_BATCH_SIZE = 500
+    # Число вакансий на странице при просмотре файла
+    PAGE_SIZE = 20
+
+    def __init__(self, file_handler=None, hh_api=None):
+        self.hh_api = hh_api or hh_API()
+        # Подходит любая реализация FileHandler, например FileHandlerSQLite
+        self.file_handler = file_handler or FileHandlerJSON()
+        # Зарплаты в разных валютах сравниваются в рублях на руки
+        self.salary_normalizer = SalaryNormalizer()
 
     def show_menu(self):
         """Отображение главного меню"""
@@ -21,6 +32,7 @@ class UserInterface:
             print("5. Удалить вакансию из файла")
             print("6. Очистить все вакансии в файле")
             print("7. Показать все вакансии в файле")
+            print("8. Обновить вакансии в файле (только новые и измененные)")
             print("0. Выход")
             print("=" * 50)
 
@@ -40,6 +52,8 @@ class UserInterface:
                 self.clear_vacancies()
             elif choice == '7':
                 self.show_all_vacancies()
+            elif choice == '8':
+                self.sync_vacancies()
             elif choice == '0':
                 print("До свидания!")
                 break
@@ -63,12 +77,15 @@ class UserInterface:
             return
 
         print(f"\nПоиск вакансий по запросу '{keyword}'...")
-        vacancies = self.hh_api.get_vacancies(keyword, amount)
 
-        if vacancies:
-            print(f"\nНайдено вакансий: {len(vacancies)}")
-            for vacancy in vacancies:
-                print(vacancy)
+        # Вакансии выводятся по мере загрузки страниц
+        found_count = 0
+        for vacancy in self.hh_api.iter_vacancies(keyword, amount):
+            print(vacancy)
+            found_count += 1
+
+        if found_count:
+            print(f"Найдено вакансий: {found_count}")
         else:
             print("Вакансии не найдены.")
 
@@ -83,27 +100,15 @@ class UserInterface:
             print("Пожалуйста, введите число!")
             return
 
-        vacancies = self.file_handler.get_vacancies()
-
-        # Фильтруем вакансии с указанной зарплатой
-        vacancies_with_salary = [
-            vac for vac in vacancies
-            if vac.salary and vac.salary.get('from') is not None
-        ]
+        # Хранилище само выбирает топ без полной сортировки
+        top_vacancies = self.file_handler.top_by_salary(n, normalizer=self.salary_normalizer)
 
-        if not vacancies_with_salary:
+        if not top_vacancies:
             print("В файле нет вакансий с указанной зарплатой.")
             return
 
-        # Сортируем по зарплате (от большей к меньшей)
-        sorted_vacancies = sorted(
-            vacancies_with_salary,
-            key=lambda x: x.salary.get('from', 0) or 0,
-            reverse=True
-        )[:n]
-
         print(f"\nТоп-{n} вакансий по зарплате:")
-        for i, vacancy in enumerate(sorted_vacancies, 1):
+        for i, vacancy in enumerate(top_vacancies, 1):
             print(f"{i}. {vacancy}")
 
     def search_in_file(self):
@@ -113,7 +118,8 @@ class UserInterface:
             print("Ключевое слово не может быть пустым!")
             return
 
-        vacancies = self.file_handler.get_vacancies(name=keyword)
+        # Ищутся вакансии, содержащие все слова запроса в названии или городе
+        vacancies = self.file_handler.search(keyword)
 
         if vacancies:
             print(f"\nНайдено вакансий в файле: {len(vacancies)}")
@@ -139,14 +145,32 @@ class UserInterface:
             return
 
         print(f"\nПоиск и сохранение вакансий...")
-        vacancies = self.hh_api.get_vacancies(keyword, amount)
 
-        if vacancies:
-            added_count = self.file_handler.add_vacancies(vacancies)
-            print(f"Успешно сохранено {added_count} вакансий.")
+        # Загрузка и запись идут параллельно, прогресс выводится после каждой пачки
+        pipeline = IngestPipeline(
+            self.hh_api,
+            self.file_handler,
+            batch_size=self.SAVE_BATCH_SIZE,
+            progress=print
+        )
+        stats = pipeline.run(keyword, amount)
+
+        if stats.fetched:
+            print(f"Успешно сохранено {stats.added} вакансий.")
         else:
             print("Вакансии не найдены.")
 
+    def sync_vacancies(self):
+        """Инкрементальное обновление сохраненных вакансий по запросу"""
+        keyword = input("Введите поисковый запрос для обновления: ").strip()
+        if not keyword:
+            print("Запрос не может быть пустым!")
+            return
+
+        print(f"\nОбновление вакансий по запросу '{keyword}'...")
+        stats = VacancySync(self.hh_api, self.file_handler).sync(keyword)
+        print(stats)
+
     def delete_vacancy(self):
         """Удаление вакансии из файла"""
         vacancy_id = input("Введите ID вакансии для удаления: ").strip()
@@ -170,11 +194,33 @@ class UserInterface:
 
     def show_all_vacancies(self):
         """Показать все вакансии в файле"""
-        vacancies = self.file_handler.get_vacancies()
+        total = self.file_handler.count_vacancies()
+        if not total:
+            print("В файле нет вакансий.")
+            return
 
-        if vacancies:
-            print(f"\nВсего вакансий в файле: {len(vacancies)}")
+        print(f"\nВсего вакансий в файле: {total}")
+        pages = (total + self.PAGE_SIZE - 1) // self.PAGE_SIZE
+        # Курсоры начала просмотренных страниц для возврата назад
+        cursors = [None]
+        while True:
+            # Из хранилища загружается только показываемая страница
+            vacancies, next_cursor = self.file_handler.get_page(cursors[-1], self.PAGE_SIZE)
+            print(f"\nСтраница {len(cursors)} из {pages}")
             for vacancy in vacancies:
                 print(vacancy)
-        else:
-            print("В файле нет вакансий.")
\ No newline at end of file
+
+            if next_cursor is None and len(cursors) == 1:
+                return
+
+            while True:
+                choice = input("n - следующая страница, p - предыдущая, q - в меню: ").strip().lower()
+                if choice == 'n' and next_cursor is not None:
+                    cursors.append(next_cursor)
+                    break
+                if choice == 'p' and len(cursors) > 1:
+                    cursors.pop()
+                    break
+                if choice == 'q':
+                    return
+                print("Неверный выбор. Попробуйте снова.")
\ No newline at end of file
@@ -1,4 +1,21 @@
+def _to_int(value):
+    """Приведение границы зарплаты к int, None если значение не задано или некорректно"""
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
 class Vacancy:
+    # Без __dict__ объект занимает в несколько раз меньше памяти, а зарплата
+    # хранится в числовых полях вместо отдельного словаря
+    __slots__ = ('name', 'city', 'url', 'id', 'salary_from', 'salary_to', 'currency', 'gross', 'salary_base',
+                 'salary_base_key')
+
+    SALARY_FIELDS = ('from', 'to', 'mid')
+
     def __init__(self, name, city, url, salary, vacancy_id):
         self.name = name
         self.city = city
@@ -6,6 +23,51 @@ class Vacancy:
         self.salary = salary
         self.id = vacancy_id
 
+    @property
+    def salary(self):
+        """Зарплата в формате словаря HH API"""
+        if self.salary_from is None and self.salary_to is None and self.currency is None:
+            return None
+
+        salary = {'from': self.salary_from, 'to': self.salary_to, 'currency': self.currency}
+        if self.gross is not None:
+            salary['gross'] = self.gross
+        return salary
+
+    @salary.setter
+    def salary(self, salary):
+        salary = salary or {}
+        self.salary_from = _to_int(salary.get('from'))
+        self.salary_to = _to_int(salary.get('to'))
+        self.currency = salary.get('currency')
+        gross = salary.get('gross')
+        self.gross = None if gross is None else bool(gross)
+        # Границы в базовой валюте заполняет SalaryNormalizer; при смене зарплаты они устаревают
+        self.salary_base = None
+        self.salary_base_key = None
+
+    def salary_value(self, field='from', normalized=False):
+        """Значение зарплаты для сравнения: нижняя граница, верхняя или середина вилки.
+
+        При normalized берутся границы, пересчитанные в базовую валюту.
+        """
+        if field not in self.SALARY_FIELDS:
+            raise ValueError(f"Неизвестное поле зарплаты: {field}")
+        if normalized:
+            if self.salary_base is None:
+                return None
+            salary_from, salary_to = self.salary_base
+        else:
+            salary_from, salary_to = self.salary_from, self.salary_to
+
+        if field == 'from':
+            return salary_from
+        if field == 'to':
+            return salary_to
+        if salary_from is None or salary_to is None:
+            return salary_from if salary_to is None else salary_to
+        return (salary_from + salary_to) / 2
+
     def __str__(self):
         salary_str = self._format_salary()
         return f"""
@@ -18,12 +80,9 @@ ID: {self.id}
 """
 
     def _format_salary(self):
-        if not self.salary:
-            return "Зарплата не указана"
-
-        salary_from = self.salary.get('from', 'Не указано')
-        salary_to = self.salary.get('to', 'Не указано')
-        currency = self.salary.get('currency', '')
+        salary_from = self.salary_from
+        salary_to = self.salary_to
+        currency = self.currency or ''
 
         if salary_from and salary_to:
             return f"{salary_from} - {salary_to} {currency}"
@@ -51,4 +110,4 @@ ID: {self.id}
             url=data.get('url'),
             salary=data.get('salary'),
             vacancy_id=data.get('id')
-        )
\ No newline at end of file
+        )
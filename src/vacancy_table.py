@@ -0,0 +1,248 @@
+from array import array
+from bisect import bisect_left, bisect_right
+
+from src.vacancy import Vacancy
+
+# Маркер отсутствующей границы зарплаты в числовых колонках
+MISSING = -1
+# Поля зарплаты в базовой валюте, заполняемые SalaryNormalizer
+BASE_FIELDS = {'base_from': 'from', 'base_to': 'to', 'base_mid': 'mid'}
+
+
+class VacancyTable:
+    """Колоночное представление сохраненных вакансий для аналитики по зарплатам.
+
+    Числовые поля хранятся в массивах модуля array, город и валюта кодируются
+    номерами в справочниках. Для каждого поля зарплаты один раз строится
+    отсортированный порядок строк, поэтому диапазоны ищутся бинарным поиском,
+    а топ и процентили читаются из готового порядка. Строки каждого города
+    и каждой валюты также собираются в массивы один раз.
+    """
+
+    def __init__(self):
+        self.ids = []
+        self.names = []
+        self.urls = []
+        self.salary_from = array('q')
+        self.salary_to = array('q')
+        self.base_from = array('q')
+        self.base_to = array('q')
+        self.gross = array('b')
+        self.currency_codes = array('H')
+        self.city_codes = array('I')
+        self.currencies = []
+        self.cities = []
+        self._currency_lookup = {}
+        self._city_lookup = {}
+        self._orders = {}
+        self._columns = {}
+        self._groups = {}
+
+    def __len__(self):
+        return len(self.ids)
+
+    @classmethod
+    def from_handler(cls, file_handler, normalizer=None, **criteria):
+        """Загрузка таблицы из хранилища за один проход.
+
+        С normalizer заполняются колонки зарплаты в базовой валюте (поля base_*).
+        """
+        table = cls()
+        for vacancy in file_handler.iter_vacancies(**criteria):
+            if normalizer is not None:
+                normalizer.normalize(vacancy)
+            table.append(vacancy)
+        return table
+
+    @staticmethod
+    def _encode(value, values, lookup):
+        """Номер значения в справочнике, новое значение добавляется в конец"""
+        code = lookup.get(value)
+        if code is None:
+            code = lookup[value] = len(values)
+            values.append(value)
+        return code
+
+    def append(self, vacancy):
+        """Добавление вакансии в таблицу"""
+        self.ids.append(vacancy.id)
+        self.names.append(vacancy.name)
+        self.urls.append(vacancy.url)
+        self.salary_from.append(MISSING if vacancy.salary_from is None else vacancy.salary_from)
+        self.salary_to.append(MISSING if vacancy.salary_to is None else vacancy.salary_to)
+        base_from, base_to = vacancy.salary_base or (None, None)
+        self.base_from.append(MISSING if base_from is None else base_from)
+        self.base_to.append(MISSING if base_to is None else base_to)
+        self.gross.append(MISSING if vacancy.gross is None else int(vacancy.gross))
+        self.currency_codes.append(self._encode(vacancy.currency, self.currencies, self._currency_lookup))
+        self.city_codes.append(self._encode(vacancy.city, self.cities, self._city_lookup))
+        self._orders.clear()
+        self._columns.clear()
+        self._groups.clear()
+
+    def value(self, row, field='from'):
+        """Значение зарплаты в строке, None если оно не указано"""
+        if field in BASE_FIELDS:
+            salary_from = self.base_from[row]
+            salary_to = self.base_to[row]
+            field = BASE_FIELDS[field]
+        else:
+            salary_from = self.salary_from[row]
+            salary_to = self.salary_to[row]
+        if field == 'from':
+            return None if salary_from == MISSING else salary_from
+        if field == 'to':
+            return None if salary_to == MISSING else salary_to
+        if field != 'mid':
+            raise ValueError(f"Неизвестное поле зарплаты: {field}")
+
+        if salary_from == MISSING or salary_to == MISSING:
+            value = salary_from if salary_to == MISSING else salary_to
+            return None if value == MISSING else value
+        return (salary_from + salary_to) / 2
+
+    def _column(self, field):
+        """Значения зарплаты всех строк списком, None для неуказанных"""
+        if field not in self._columns:
+            if field in BASE_FIELDS:
+                lows, highs, kind = self.base_from, self.base_to, BASE_FIELDS[field]
+            else:
+                lows, highs, kind = self.salary_from, self.salary_to, field
+            if kind == 'from':
+                column = [None if low == MISSING else low for low in lows]
+            elif kind == 'to':
+                column = [None if high == MISSING else high for high in highs]
+            elif kind == 'mid':
+                column = [
+                    (low + high) / 2 if low != MISSING and high != MISSING
+                    else low if low != MISSING
+                    else high if high != MISSING
+                    else None
+                    for low, high in zip(lows, highs)
+                ]
+            else:
+                raise ValueError(f"Неизвестное поле зарплаты: {field}")
+            self._columns[field] = column
+        return self._columns[field]
+
+    def _order(self, field):
+        """Строки с указанной зарплатой, отсортированные по возрастанию, и их значения"""
+        if field not in self._orders:
+            column = self._column(field)
+            rows = [row for row, value in enumerate(column) if value is not None]
+            rows.sort(key=column.__getitem__)
+            values = array('d', map(column.__getitem__, rows))
+            self._orders[field] = (array('I', rows), values)
+        return self._orders[field]
+
+    def _rows_by_code(self, kind):
+        """Номера строк для каждого кода города или валюты, по возрастанию"""
+        if kind not in self._groups:
+            if kind == 'city':
+                codes, values = self.city_codes, self.cities
+            else:
+                codes, values = self.currency_codes, self.currencies
+            groups = [array('I') for _ in values]
+            for row, code in enumerate(codes):
+                groups[code].append(row)
+            self._groups[kind] = groups
+        return self._groups[kind]
+
+    def _rows_with(self, kind, value):
+        """Номера строк с указанным городом или валютой"""
+        lookup = self._city_lookup if kind == 'city' else self._currency_lookup
+        code = lookup.get(value)
+        return array('I') if code is None else self._rows_by_code(kind)[code]
+
+    def filter(self, salary_min=None, salary_max=None, city=None, currency=None, field='from'):
+        """Номера строк, подходящих под диапазон зарплаты, город и валюту"""
+        if salary_min is None and salary_max is None:
+            rows = range(len(self))
+        else:
+            order, values = self._order(field)
+            start = 0 if salary_min is None else bisect_left(values, salary_min)
+            end = len(values) if salary_max is None else bisect_right(values, salary_max)
+            rows = sorted(order[start:end])
+
+        for kind, value in (('city', city), ('currency', currency)):
+            if value is None:
+                continue
+            matched = self._rows_with(kind, value)
+            # Полный диапазон строк заменяется готовым массивом, иначе пересечение считается множествами
+            rows = matched if isinstance(rows, range) else sorted(set(matched).intersection(rows))
+        return array('I', rows)
+
+    def top(self, n, field='from', currency=None):
+        """Номера N строк с наибольшей зарплатой"""
+        order, _ = self._order(field)
+        if currency is None:
+            return array('I', reversed(order[-n:])) if n > 0 else array('I')
+
+        allowed = set(self._rows_with('currency', currency))
+        rows = array('I')
+        for row in reversed(order):
+            if len(rows) >= n:
+                break
+            if row in allowed:
+                rows.append(row)
+        return rows
+
+    def percentile(self, q, field='from', currency=None):
+        """Процентиль зарплаты с линейной интерполяцией, None если данных нет"""
+        if not 0 <= q <= 100:
+            raise ValueError("Процентиль должен быть в диапазоне от 0 до 100")
+
+        order, values = self._order(field)
+        if currency is not None:
+            allowed = set(self._rows_with('currency', currency))
+            values = [value for row, value in zip(order, values) if row in allowed]
+        if not values:
+            return None
+
+        position = (len(values) - 1) * q / 100
+        lower = int(position)
+        upper = min(lower + 1, len(values) - 1)
+        return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+    def group_by_city(self, field='from', currency=None):
+        """Количество, минимум, максимум и среднее зарплаты по городам"""
+        column = self._column(field)
+        allowed = None if currency is None else set(self._rows_with('currency', currency))
+        stats = {}
+        for code, rows in enumerate(self._rows_by_code('city')):
+            if allowed is not None:
+                rows = sorted(allowed.intersection(rows))
+            values = [value for value in map(column.__getitem__, rows) if value is not None]
+            if values:
+                stats[self.cities[code]] = {
+                    'count': len(values),
+                    'min': min(values),
+                    'max': max(values),
+                    'mean': sum(values) / len(values)
+                }
+        return stats
+
+    def vacancy(self, row):
+        """Восстановление объекта Vacancy для строки таблицы"""
+        salary_from = self.value(row, 'from')
+        salary_to = self.value(row, 'to')
+        currency = self.currencies[self.currency_codes[row]]
+        salary = None
+        if salary_from is not None or salary_to is not None or currency is not None:
+            salary = {'from': salary_from, 'to': salary_to, 'currency': currency}
+            if self.gross[row] != MISSING:
+                salary['gross'] = bool(self.gross[row])
+        vacancy = Vacancy(
+            name=self.names[row],
+            city=self.cities[self.city_codes[row]],
+            url=self.urls[row],
+            salary=salary,
+            vacancy_id=self.ids[row]
+        )
+        if self.base_from[row] != MISSING or self.base_to[row] != MISSING:
+            vacancy.salary_base = (self.value(row, 'base_from'), self.value(row, 'base_to'))
+        return vacancy
+
+    def vacancies(self, rows):
+        """Объекты Vacancy только для выбранных строк"""
+        return [self.vacancy(row) for row in rows]
@@ -0,0 +1,120 @@
+import hashlib
+import json
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+
+def make_item(index):
+    """Формирование тестовой вакансии в формате HH API"""
+    return {
+        'id': str(index + 1),
+        'name': f'Vacancy {index + 1}',
+        'area': {'id': str(index % 10), 'name': f'City {index % 10}'},
+        'url': f'https://hh.ru/vacancy/{index + 1}',
+        'salary': {'from': 50000 + index * 10, 'to': 100000 + index * 10, 'currency': 'RUR', 'gross': False},
+        'published_at': '2024-02-16T14:58:28+0300'
+    }
+
+
+def parse_date(value):
+    """Разбор даты в формате HH API"""
+    return datetime.strptime(value, '%Y-%m-%dT%H:%M:%S%z')
+
+
+class StubHHServer:
+    """Локальный HTTP-сервер, имитирующий /vacancies из HH API"""
+
+    def __init__(self, found=2000, delay=0.0, items=None):
+        self.found = found
+        self.delay = delay
+        # Явный список вакансий от новых к старым; поддерживает фильтр date_from
+        self.items = items
+        self.last_params = None
+        self.requests_count = 0
+        self.connections_count = 0
+        self.not_modified_count = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address
+        return f'http://{host}:{port}/vacancies'
+
+    def _make_handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # Keep-alive, чтобы клиенты могли переиспользовать соединения
+            protocol_version = 'HTTP/1.1'
+            disable_nagle_algorithm = True
+
+            def setup(self):
+                super().setup()
+                with stub._lock:
+                    stub.connections_count += 1
+
+            def do_GET(self):
+                with stub._lock:
+                    stub.requests_count += 1
+                if stub.delay:
+                    time.sleep(stub.delay)
+
+                params = parse_qs(urlparse(self.path).query)
+                stub.last_params = params
+                page = int(params.get('page', ['0'])[0])
+                per_page = int(params.get('per_page', ['20'])[0])
+                start = page * per_page
+                if stub.items is None:
+                    found = stub.found
+                    page_items = [make_item(i) for i in range(start, min(start + per_page, found))]
+                else:
+                    items = stub.items
+                    if 'date_from' in params:
+                        date_from = parse_date(params['date_from'][0])
+                        items = [item for item in items if parse_date(item['published_at']) >= date_from]
+                    found = len(items)
+                    page_items = items[start:start + per_page]
+                body = json.dumps({
+                    'items': page_items,
+                    'found': found,
+                    'pages': (found + per_page - 1) // per_page,
+                    'page': page,
+                    'per_page': per_page
+                }).encode('utf-8')
+
+                etag = '"' + hashlib.md5(body).hexdigest() + '"'
+                if self.headers.get('If-None-Match') == etag:
+                    with stub._lock:
+                        stub.not_modified_count += 1
+                    self.send_response(304)
+                    self.send_header('ETag', etag)
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+
+                self.send_response(200)
+                self.send_header('ETag', etag)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._server.shutdown()
+        self._server.server_close()
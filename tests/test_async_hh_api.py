@@ -0,0 +1,133 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock
+import pytest
+from src.async_hh_api import AsyncConnectionPool, AsyncHhAPI, SyncHhAPI, read_response
+from tests.stub_server import StubHHServer
+
+
+def read(raw):
+    """Разбор ответа из готовых байтов"""
+    async def run():
+        reader = asyncio.StreamReader()
+        reader.feed_data(raw)
+        reader.feed_eof()
+        return await read_response(reader)
+    return asyncio.run(run())
+
+
+class TestReadResponse:
+    def test_content_length(self):
+        """Тест ответа с Content-Length"""
+        response, keep_alive = read(b'HTTP/1.1 200 OK\r\nContent-Length: 2\r\nETag: "x"\r\n\r\n{}')
+
+        assert response.status_code == 200
+        assert response.json() == {}
+        assert response.headers['etag'] == '"x"'
+        assert keep_alive is True
+
+    def test_chunked(self):
+        """Тест ответа с передачей частями"""
+        raw = b'HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n4\r\n{"a"\r\n3\r\n: 1\r\n1\r\n}\r\n0\r\n\r\n'
+
+        response, keep_alive = read(raw)
+
+        assert response.json() == {'a': 1}
+        assert keep_alive is True
+
+    def test_connection_close(self):
+        """Тест ответа без длины, который читается до закрытия соединения"""
+        response, keep_alive = read(b'HTTP/1.0 200 OK\r\n\r\n[1, 2]')
+
+        assert response.json() == [1, 2]
+        assert keep_alive is False
+
+
+class TestAsyncConnectionPool:
+    def test_bad_response_closes_connection(self):
+        """Тест закрытия соединения при ошибке, не связанной с сетью"""
+        writer = Mock(drain=AsyncMock())
+
+        async def run():
+            reader = asyncio.StreamReader()
+            reader.feed_data(b'garbage\r\n\r\n')
+            reader.feed_eof()
+            pool = AsyncConnectionPool()
+            pool._acquire = AsyncMock(return_value=((reader, writer), False))
+            with pytest.raises(ValueError):
+                await pool.request('http://127.0.0.1:1/vacancies')
+            return pool
+
+        pool = asyncio.run(run())
+
+        writer.close.assert_called_once()
+        assert not any(pool._idle.values())
+
+
+class TestAsyncHhAPI:
+    def test_get_vacancies(self):
+        """Тест асинхронной загрузки с сохранением порядка страниц"""
+        async def run(api):
+            try:
+                return await api.get_vacancies("Python", 450)
+            finally:
+                await api.close()
+
+        with StubHHServer(found=500) as server:
+            vacancies = asyncio.run(run(AsyncHhAPI(base_url=server.url, rate=1000)))
+
+        assert [vac.id for vac in vacancies] == [str(i) for i in range(1, 451)]
+        assert server.requests_count == 5
+
+    def test_search_many_reuses_connections(self):
+        """Тест множества поисков в одном цикле событий через пул соединений"""
+        keywords = [f"keyword {i}" for i in range(10)]
+
+        async def run(api):
+            try:
+                return await api.search_many(keywords, 300)
+            finally:
+                await api.close()
+
+        with StubHHServer(found=300) as server:
+            api = AsyncHhAPI(base_url=server.url, limit_per_host=4, rate=1000)
+            results = asyncio.run(run(api))
+
+        assert list(results) == keywords
+        assert all(len(vacancies) == 300 for vacancies in results.values())
+        assert server.requests_count == 30
+        assert server.connections_count <= 4
+
+    def test_connection_error(self):
+        """Тест пустого результата, когда сервер недоступен"""
+        api = AsyncHhAPI(base_url='http://127.0.0.1:1/vacancies', max_retries=0, timeout=1)
+
+        vacancies = SyncHhAPI(api).get_vacancies("Python", 10)
+
+        assert vacancies == []
+
+    def test_sync_wrapper(self):
+        """Тест синхронной обертки для UserInterface"""
+        with StubHHServer(found=120) as server:
+            api = SyncHhAPI(AsyncHhAPI(base_url=server.url, rate=1000))
+            first = api.get_vacancies("Python", 120)
+            second = api.get_vacancies("Java", 20)
+            # Синхронный генератор JobAPI работает через обертку
+            streamed = [vacancy.id for vacancy in api.iter_vacancies("Go", 30)]
+
+        assert len(first) == 120
+        assert len(second) == 20
+        assert streamed == [str(i) for i in range(1, 31)]
+
+    def test_aiter_vacancies(self):
+        """Тест асинхронного генератора вакансий"""
+        async def run(api):
+            try:
+                return [vacancy.id async for vacancy in api.aiter_vacancies("Python", 150)]
+            finally:
+                await api.close()
+
+        with StubHHServer(found=200) as server:
+            ids = asyncio.run(run(AsyncHhAPI(base_url=server.url, rate=1000)))
+
+        assert ids == [str(i) for i in range(1, 151)]
+        assert server.requests_count == 2
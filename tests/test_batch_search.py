@@ -0,0 +1,75 @@
+import time
+import pytest
+from unittest.mock import Mock
+import requests
+from src.batch_search import BatchSearch, QuerySpec
+from src.hh_api import RequestScheduler, hh_API
+from tests.stub_server import StubHHServer, make_item
+
+
+class TestBatchSearch:
+    @pytest.fixture
+    def api(self):
+        """Фикстура с клиентом, отвечающим по региону из параметров"""
+        def get_json(params):
+            offset = 1000 if params.get('area') == '2' else 0
+            start = params['page'] * params['per_page']
+            return {'items': [make_item(offset + i) for i in range(start, start + params['per_page'])], 'pages': 2}
+
+        api = Mock()
+        api._get_json.side_effect = get_json
+        return api
+
+    def test_dedup_across_queries(self):
+        """Тест удаления дубликатов между одновременными запросами"""
+        with StubHHServer(found=250, delay=0.01) as server:
+            api = hh_API(max_workers=4, base_url=server.url, scheduler=RequestScheduler(rate=1000))
+            result = BatchSearch(api, max_workers=4).run([("Python", "1"), ("Python", "2"), ("Java",)], 250)
+
+        assert len(result.vacancies) == 250
+        assert len({vacancy.id for vacancy in result.vacancies}) == 250
+        assert result.duplicates == 500
+        assert [query_stats.pages for query_stats in result.stats] == [3, 3, 3]
+        assert [query_stats.items for query_stats in result.stats] == [250, 250, 250]
+        assert sum(query_stats.unique for query_stats in result.stats) == 250
+        assert all(query_stats.latency > 0 for query_stats in result.stats)
+
+    def test_area_and_filters(self, api):
+        """Тест передачи региона и фильтров в параметры запроса"""
+        specs = [QuerySpec("Python", area='1', filters={'experience': 'noExperience'}), QuerySpec("Python", area='2')]
+        result = BatchSearch(api, max_workers=2).run(specs, 150)
+
+        assert len(result.vacancies) == 300
+        assert result.duplicates == 0
+        params = [call.args[0] for call in api._get_json.call_args_list]
+        assert {(p['area'], p.get('experience'), p['page']) for p in params} == {
+            ('1', 'noExperience', 0), ('1', 'noExperience', 1), ('2', None, 0), ('2', None, 1)
+        }
+
+    def test_shared_rate_limit(self):
+        """Тест общего лимита частоты для всех запросов"""
+        with StubHHServer(found=100) as server:
+            api = hh_API(max_workers=8, base_url=server.url, scheduler=RequestScheduler(rate=20, burst=1))
+            start = time.perf_counter()
+            BatchSearch(api, max_workers=8).run([(f"query {i}",) for i in range(8)], 100)
+            elapsed = time.perf_counter() - start
+
+        assert server.requests_count == 8
+        assert elapsed >= 7 / 20 * 0.9
+
+    def test_query_error(self, api):
+        """Тест ошибки одного запроса без остановки остальных"""
+        get_json = api._get_json.side_effect
+
+        def failing(params):
+            if params.get('area') == '2':
+                raise requests.ConnectionError("нет соединения")
+            return get_json(params)
+
+        api._get_json.side_effect = failing
+        result = BatchSearch(api).run([("Python", "1"), ("Python", "2")], 100)
+
+        assert len(result.vacancies) == 100
+        assert result.stats[0].error is None
+        assert result.stats[1].error == "нет соединения"
+        assert result.stats[1].pages == 0
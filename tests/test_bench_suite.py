@@ -0,0 +1,60 @@
+from contextlib import ExitStack
+import json
+from unittest.mock import patch
+import pytest
+from benchmarks.suite import BENCHMARKS, compare, main, make_vacancies, percentile, run
+
+
+class TestBenchSuite:
+    def test_percentile(self):
+        """Тест процентилей с интерполяцией"""
+        values = [1.0, 2.0, 3.0, 4.0, 5.0]
+        assert percentile(values, 50) == 3.0
+        assert percentile(values, 90) == pytest.approx(4.6)
+        assert percentile([7.0], 99) == 7.0
+        assert percentile([], 50) is None
+
+    def test_synthetic_data_is_reproducible(self):
+        """Тест воспроизводимости синтетических вакансий"""
+        first = [vacancy.to_dict() for vacancy in make_vacancies(50, start=10)]
+        assert first == [vacancy.to_dict() for vacancy in make_vacancies(50, start=10)]
+        assert [vacancy['id'] for vacancy in first[:2]] == ['10', '11']
+
+    def test_compare(self):
+        """Тест поиска ухудшений относительно базовой линии"""
+        baseline = {'results': {'a[10]': {'p50': 1.0, 'peak_memory': 1000}, 'b[10]': {'p50': 1.0, 'peak_memory': 0}}}
+        report = {'results': {
+            'a[10]': {'p50': 1.2, 'peak_memory': 2000},
+            'b[10]': {'p50': 2.0, 'peak_memory': 10},
+            'c[10]': {'p50': 9.0, 'peak_memory': 10}
+        }}
+
+        regressions = compare(report, baseline, threshold=0.25)
+
+        assert [(item['benchmark'], item['metric']) for item in regressions] == [
+            ('a[10]', 'peak_memory'), ('b[10]', 'p50')
+        ]
+
+    def test_data_prepared_before_timing(self, tmp_path):
+        """Тест подготовки данных для всех запусков до измеряемой операции"""
+        setup, _ = BENCHMARKS['json.add_vacancies']
+        with ExitStack() as stack:
+            operation = setup(100, str(tmp_path), stack, 2)
+            with patch('benchmarks.suite.make_vacancies') as mock_make:
+                assert operation() == 1000
+                assert operation() == 1000
+            mock_make.assert_not_called()
+
+    def test_run_and_baseline(self, tmp_path):
+        """Тест запуска бенчмарков, сохранения базовой линии и сравнения"""
+        report = run([100], 'sqlite.top', repeat=2, progress=None)
+        result = report['results']['sqlite.top_by_salary[100]']
+        assert result['repeat'] == 2 and result['min'] <= result['p50'] <= result['max']
+
+        baseline = str(tmp_path / 'baseline.json')
+        output = str(tmp_path / 'results.json')
+        args = ['--sizes', '100', '--filter', 'json.delete', '--repeat', '2', '--baseline', baseline]
+        assert main(args + ['--save-baseline']) == 0
+        assert main(args + ['--output', output, '--threshold', '1000']) == 0
+        with open(output, encoding='utf-8') as f:
+            assert 'json.delete_vacancy[100]' in json.load(f)['results']
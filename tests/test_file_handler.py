@@ -2,7 +2,10 @@ import pytest
 import json
 import os
 import tempfile
-from src.file_handler import FileHandlerJSON
+import threading
+from unittest.mock import patch
+from src.file_handler import FileHandlerJSON, FileHandlerJSONL, FileHandlerSQLite
+from src.serializers import loads
 from src.vacancy import Vacancy
 
 
@@ -16,9 +19,10 @@ class TestFileHandlerJSON:
 
         yield temp_filename
 
-        # Удаляем временный файл после теста
-        if os.path.exists(temp_filename):
-            os.unlink(temp_filename)
+        # Удаляем временный файл и файл блокировки после теста
+        for filename in (temp_filename, temp_filename + '.lock'):
+            if os.path.exists(filename):
+                os.unlink(filename)
 
     @pytest.fixture
     def sample_vacancies(self):
@@ -166,5 +170,578 @@ class TestFileHandlerJSON:
             # Должен вернуть пустой список при ошибке чтения
             assert vacancies == []
         finally:
-            if os.path.exists(temp_filename):
-                os.unlink(temp_filename)
\ No newline at end of file
+            for filename in (temp_filename, temp_filename + '.corrupt', temp_filename + '.lock'):
+                if os.path.exists(filename):
+                    os.unlink(filename)
+
+    @pytest.mark.parametrize('serializer, damage', [
+        ('json', lambda raw: raw[:len(raw) // 2]),
+        ('json+gzip', lambda raw: raw[:len(raw) // 2]),
+        # Неверная контрольная сумма gzip: BadGzipFile, наследник OSError
+        ('json+gzip', lambda raw: raw[:-8] + bytes(8)),
+        ('marshal+gzip', lambda raw: raw[:len(raw) // 2]),
+    ])
+    def test_corrupted_file_is_not_overwritten(self, tmp_path, sample_vacancies, serializer, damage):
+        """Тест сохранения поврежденного файла перед следующей записью"""
+        filename = str(tmp_path / 'vacancies.json')
+        FileHandlerJSON(filename, serializer=serializer).add_vacancies(sample_vacancies)
+        with open(filename, 'rb') as f:
+            damaged = damage(f.read())
+        with open(filename, 'wb') as f:
+            f.write(damaged)
+
+        handler = FileHandlerJSON(filename)
+        assert handler.get_vacancies() == []
+        handler.add_vacancy(Vacancy("C++ Developer", "Казань", "url", None, "3"))
+
+        with open(filename + '.corrupt', 'rb') as f:
+            assert f.read() == damaged
+        assert [vac.id for vac in FileHandlerJSON(filename).get_vacancies()] == ["3"]
+
+    def test_repeated_reads_use_cache(self, temp_file, sample_vacancies):
+        """Тест повторного чтения неизмененного файла без разбора JSON"""
+        handler = FileHandlerJSON(temp_file)
+        handler.add_vacancies(sample_vacancies)
+
+        with patch.object(handler, '_read_file', wraps=handler._read_file) as read_file, \
+                patch('src.file_handler.loads', wraps=loads) as mock_loads:
+            first = handler.get_vacancies()
+            second = handler.get_vacancies(city="Москва")
+
+        read_file.assert_not_called()
+        mock_loads.assert_not_called()
+        assert len(first) == 3
+        assert len(second) == 2
+
+    def test_cache_reloads_after_external_change(self, temp_file, sample_vacancies):
+        """Тест перечитывания файла после изменения другим процессом"""
+        handler = FileHandlerJSON(temp_file)
+        handler.add_vacancies(sample_vacancies)
+        assert len(handler.get_vacancies()) == 3
+
+        other = FileHandlerJSON(temp_file)
+        other.delete_vacancy("1")
+
+        vacancies = handler.get_vacancies()
+        assert [vac.id for vac in vacancies] == ["2", "3"]
+
+    def test_cache_not_modified_by_caller(self, temp_file, sample_vacancies):
+        """Тест защиты кэша от изменения возвращенного списка"""
+        handler = FileHandlerJSON(temp_file)
+        handler.add_vacancies(sample_vacancies)
+
+        handler.get_vacancies().clear()
+
+        assert len(handler.get_vacancies()) == 3
+
+    def test_top_by_salary(self, temp_file, sample_vacancies):
+        """Тест выбора топ вакансий по зарплате"""
+        handler = FileHandlerJSON(temp_file)
+        handler.add_vacancies(sample_vacancies)
+
+        assert [vac.id for vac in handler.top_by_salary(5)] == ["2", "1"]
+        assert [vac.id for vac in handler.top_by_salary(1, field='to')] == ["2"]
+        assert handler.top_by_salary(5, currency='USD') == []
+
+    def test_top_by_salary_mid_with_open_range(self, temp_file):
+        """Тест середины вилки, когда указана только одна граница"""
+        handler = FileHandlerJSON(temp_file)
+        handler.add_vacancies([
+            Vacancy("A", "Москва", "a", {"from": 100000, "to": 300000, "currency": "RUR"}, "1"),
+            Vacancy("B", "Москва", "b", {"from": None, "to": 250000, "currency": "RUR"}, "2"),
+            Vacancy("C", "Москва", "c", {"from": 150000, "to": None, "currency": "RUR"}, "3")
+        ])
+
+        assert [vac.id for vac in handler.top_by_salary(3, field='mid')] == ["2", "1", "3"]
+
+    def test_top_by_salary_invalid_field(self, temp_file):
+        """Тест ошибки при неизвестном поле зарплаты"""
+        handler = FileHandlerJSON(temp_file)
+
+        with pytest.raises(ValueError):
+            handler.top_by_salary(3, field='avg')
+
+    def test_search_uses_persisted_index(self, tmp_path, sample_vacancies):
+        """Тест поиска по индексу, сохраненному рядом с файлом"""
+        filename = str(tmp_path / 'vacancies.json')
+        handler = FileHandlerJSON(filename)
+        handler.add_vacancies(sample_vacancies)
+
+        assert [vac.id for vac in handler.search("москва")] == ["1", "3"]
+        assert os.path.exists(str(tmp_path / 'vacancies.index.json'))
+
+        handler.add_vacancy(Vacancy("Python Team Lead", "Казань", "4", None, "4"))
+        handler.delete_vacancy("1")
+        assert [vac.id for vac in handler.search("python")] == ["4"]
+
+        reopened = FileHandlerJSON(filename)
+        with patch('src.file_handler.SearchIndex.build') as mock_build:
+            assert [vac.id for vac in reopened.search("python казань", mode="or")] == ["4"]
+        mock_build.assert_not_called()
+
+    def test_search_rebuilds_stale_index(self, tmp_path, sample_vacancies):
+        """Тест перестроения индекса после изменения файла без индекса"""
+        filename = str(tmp_path / 'vacancies.json')
+        handler = FileHandlerJSON(filename)
+        handler.add_vacancies(sample_vacancies)
+        handler.search("python")
+
+        FileHandlerJSON(filename).delete_vacancy("1")
+
+        assert handler.search("python") == []
+        assert [vac.id for vac in FileHandlerJSON(filename).search("developer")] == ["2"]
+
+    def test_iter_vacancies_streams_file(self, temp_file, sample_vacancies):
+        """Тест потокового чтения без разбора всего файла"""
+        FileHandlerJSON(temp_file).add_vacancies(sample_vacancies)
+        handler = FileHandlerJSON(temp_file)
+
+        with patch.object(handler, '_read_file', wraps=handler._read_file) as read_file, \
+                patch('src.file_handler.loads', wraps=loads) as mock_loads:
+            vacancies = list(handler.iter_vacancies(city="Москва"))
+
+        # Файл разбирается потоково, без чтения и разбора целиком
+        read_file.assert_not_called()
+        mock_loads.assert_not_called()
+        assert [vac.id for vac in vacancies] == ["1", "3"]
+
+    def test_iter_vacancies_raw_hh_format(self):
+        """Тест чтения файла в исходном формате HH API"""
+        data_file = os.path.join(os.path.dirname(__file__), '..', 'data', 'vacancies.json')
+        handler = FileHandlerJSON(data_file)
+
+        vacancies = list(handler.iter_vacancies())
+
+        assert vacancies
+        assert vacancies[0].id == "93353083"
+        assert vacancies[0].city == "Воронеж"
+
+    def test_delete_vacancies(self, temp_file, sample_vacancies):
+        """Тест удаления списка вакансий одной перезаписью файла"""
+        handler = FileHandlerJSON(temp_file)
+        handler.add_vacancies(sample_vacancies)
+        handler.search("developer")
+
+        with patch.object(handler, '_write_file', wraps=handler._write_file) as write_file:
+            result = handler.delete_vacancies(["1", "3", "999"])
+
+        assert result == {'removed': 2}
+        write_file.assert_called_once()
+        assert [vac.id for vac in handler.get_vacancies()] == ["2"]
+        assert [vac.id for vac in handler.search("developer")] == ["2"]
+        assert [vac.id for vac in FileHandlerJSON(temp_file).get_vacancies()] == ["2"]
+        assert handler.delete_vacancies(["1"]) == {'removed': 0}
+
+    def test_retain(self, temp_file, sample_vacancies):
+        """Тест удаления вакансий, не подходящих под условие"""
+        handler = FileHandlerJSON(temp_file)
+        handler.add_vacancies(sample_vacancies)
+
+        result = handler.retain(lambda vacancy: vacancy.salary_from is not None)
+
+        assert result == {'removed': 1}
+        assert [vac.id for vac in FileHandlerJSON(temp_file).get_vacancies()] == ["1", "2"]
+
+    def test_upsert_vacancies(self, temp_file, sample_vacancies):
+        """Тест добавления новых и обновления измененных вакансий одной записью"""
+        handler = FileHandlerJSON(temp_file)
+        handler.add_vacancy(sample_vacancies[0])
+        handler.search("python")
+
+        changed = Vacancy("Senior Python Developer", "Москва", "https://hh.ru/vacancy/1",
+                          {"from": 200000, "to": None, "currency": "RUR"}, "1")
+        result = handler.upsert_vacancies([changed, sample_vacancies[1]])
+
+        assert result == {'inserted': 1, 'updated': 1}
+        vacancies = handler.get_vacancies()
+        assert [vac.id for vac in vacancies] == ["1", "2"]
+        assert vacancies[0].name == "Senior Python Developer"
+        assert [vac.id for vac in handler.search("senior")] == ["1"]
+        assert [vac.id for vac in FileHandlerJSON(temp_file).get_vacancies()] == ["1", "2"]
+
+        assert handler.upsert_vacancies([changed]) == {'inserted': 0, 'updated': 0}
+
+    def test_write_is_atomic(self, tmp_path, sample_vacancies):
+        """Тест сохранности файла при сбое во время записи"""
+        filename = str(tmp_path / 'vacancies.json')
+        handler = FileHandlerJSON(filename)
+        handler.add_vacancies(sample_vacancies[:2])
+
+        with patch('src.file_handler.os.replace', side_effect=OSError("нет места на диске")):
+            with pytest.raises(OSError):
+                handler.add_vacancy(sample_vacancies[2])
+
+        assert [vac.id for vac in FileHandlerJSON(filename).get_vacancies()] == ["1", "2"]
+        assert sorted(os.listdir(tmp_path)) == ['vacancies.json', 'vacancies.json.lock']
+
+    def test_recover_from_journal(self, tmp_path, sample_vacancies):
+        """Тест повтора операций из журнала после аварийного завершения"""
+        filename = str(tmp_path / 'vacancies.json')
+        FileHandlerJSON(filename).add_vacancies(sample_vacancies[:2])
+        changed = dict(sample_vacancies[0].to_dict(), name="Senior Python Developer")
+        with open(filename + '.journal', 'w', encoding='utf-8') as f:
+            f.write(json.dumps({'op': 'add', 'data': [sample_vacancies[2].to_dict()]}) + '\n')
+            f.write(json.dumps({'op': 'upsert', 'data': [changed]}) + '\n')
+            f.write(json.dumps({'op': 'delete', 'data': ["2"]}) + '\n')
+            f.write('{"op": "clear", "da')
+
+        vacancies = FileHandlerJSON(filename).get_vacancies()
+
+        assert [(vac.id, vac.name) for vac in vacancies] == [("1", "Senior Python Developer"), ("3", "Data Scientist")]
+        assert not os.path.exists(filename + '.journal')
+
+    def test_recover_journal_of_other_process(self, tmp_path, sample_vacancies):
+        """Тест повтора чужого журнала перед следующей записью"""
+        filename = str(tmp_path / 'vacancies.json')
+        handler = FileHandlerJSON(filename)
+        handler.add_vacancy(sample_vacancies[0])
+        with open(filename + '.journal', 'w', encoding='utf-8') as f:
+            f.write(json.dumps({'op': 'add', 'data': [sample_vacancies[1].to_dict()]}) + '\n')
+
+        handler.add_vacancy(sample_vacancies[2])
+
+        assert [vac.id for vac in FileHandlerJSON(filename).get_vacancies()] == ["1", "2", "3"]
+
+    def test_concurrent_writers(self, tmp_path):
+        """Тест одновременной записи несколькими обработчиками одного файла"""
+        filename = str(tmp_path / 'vacancies.json')
+
+        def write(worker):
+            handler = FileHandlerJSON(filename)
+            for i in range(20):
+                handler.add_vacancy(Vacancy("Developer", "Москва", "url", None, f"{worker}-{i}"))
+
+        threads = [threading.Thread(target=write, args=(worker,)) for worker in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(FileHandlerJSON(filename).get_vacancies()) == 80
+
+    def test_iter_vacancies_corrupted_file(self):
+        """Тест потокового чтения поврежденного файла"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            f.write('{"items": [{"id": "1"}, {"corrupted": data}]}')
+            temp_filename = f.name
+
+        try:
+            vacancies = list(FileHandlerJSON(temp_filename).iter_vacancies())
+            assert [vac.id for vac in vacancies] == ["1"]
+        finally:
+            os.unlink(temp_filename)
+
+
+class TestFileHandlerJSONL:
+    @pytest.fixture
+    def temp_file(self, tmp_path):
+        """Фикстура с путем к журналу во временной директории"""
+        return str(tmp_path / 'vacancies.jsonl')
+
+    @pytest.fixture
+    def sample_vacancies(self):
+        """Фикстура для создания тестовых вакансий"""
+        return [
+            Vacancy(
+                name="Python Developer",
+                city="Москва",
+                url="https://hh.ru/vacancy/1",
+                salary={"from": 100000, "to": 150000, "currency": "RUR"},
+                vacancy_id="1"
+            ),
+            Vacancy(
+                name="Java Developer",
+                city="Санкт-Петербург",
+                url="https://hh.ru/vacancy/2",
+                salary={"from": 120000, "to": 180000, "currency": "RUR"},
+                vacancy_id="2"
+            ),
+            Vacancy(
+                name="Data Scientist",
+                city="Москва",
+                url="https://hh.ru/vacancy/3",
+                salary=None,
+                vacancy_id="3"
+            )
+        ]
+
+    def test_add_appends_lines(self, temp_file, sample_vacancies):
+        """Тест дописывания одной строки на каждую вакансию"""
+        handler = FileHandlerJSONL(temp_file)
+        assert handler.add_vacancy(sample_vacancies[0]) is True
+        assert handler.add_vacancy(sample_vacancies[0]) is False
+        assert handler.add_vacancies(sample_vacancies) == 2
+
+        with open(temp_file, encoding='utf-8') as f:
+            assert len(f.readlines()) == 3
+
+    def test_get_vacancies_with_filter(self, temp_file, sample_vacancies):
+        """Тест получения вакансий с фильтрацией"""
+        handler = FileHandlerJSONL(temp_file)
+        handler.add_vacancies(sample_vacancies)
+
+        assert len(handler.get_vacancies(city="Москва")) == 2
+        assert handler.get_vacancies(name="Python")[0].id == "1"
+
+    def test_delete_writes_tombstone(self, temp_file, sample_vacancies):
+        """Тест удаления вакансии через надгробие"""
+        handler = FileHandlerJSONL(temp_file)
+        handler.add_vacancies(sample_vacancies)
+
+        assert handler.delete_vacancy("1") is True
+        assert handler.delete_vacancy("1") is False
+        assert [vac.id for vac in handler.get_vacancies()] == ["2", "3"]
+
+        with open(temp_file, encoding='utf-8') as f:
+            assert json.loads(f.readlines()[-1]) == {'id': '1', 'deleted': True}
+
+    def test_ids_restored_on_open(self, temp_file, sample_vacancies):
+        """Тест восстановления множества ID при повторном открытии"""
+        handler = FileHandlerJSONL(temp_file)
+        handler.add_vacancies(sample_vacancies)
+        handler.delete_vacancy("2")
+
+        reopened = FileHandlerJSONL(temp_file)
+        assert reopened.add_vacancy(sample_vacancies[0]) is False
+        assert reopened.add_vacancy(sample_vacancies[1]) is True
+
+    def test_compaction(self, temp_file, sample_vacancies):
+        """Тест сжатия журнала после удалений"""
+        handler = FileHandlerJSONL(temp_file, compact_min_garbage=4)
+        handler.add_vacancies(sample_vacancies)
+        handler.delete_vacancy("1")
+        handler.delete_vacancy("2")
+
+        with open(temp_file, encoding='utf-8') as f:
+            lines = f.readlines()
+        assert len(lines) == 1
+        assert json.loads(lines[0])['id'] == "3"
+
+    def test_exists_and_get_by_id(self, temp_file, sample_vacancies):
+        """Тест поиска вакансии по ID в журнале"""
+        handler = FileHandlerJSONL(temp_file)
+        handler.add_vacancies(sample_vacancies)
+        handler.delete_vacancy("2")
+
+        assert handler.exists("1") and not handler.exists("2")
+        assert handler.get_by_id("3").name == "Data Scientist"
+        assert handler.get_by_id("2") is None
+
+    def test_delete_vacancies(self, temp_file, sample_vacancies):
+        """Тест удаления списка вакансий одним дописыванием надгробий"""
+        handler = FileHandlerJSONL(temp_file)
+        handler.add_vacancies(sample_vacancies)
+
+        assert handler.delete_vacancies(["1", "2", "999"]) == {'removed': 2}
+        assert [vac.id for vac in FileHandlerJSONL(temp_file).get_vacancies()] == ["3"]
+        assert handler.retain(lambda vacancy: False) == {'removed': 1}
+        assert handler.get_vacancies() == []
+
+    def test_upsert_vacancies(self, temp_file, sample_vacancies):
+        """Тест обновления вакансий дописыванием новой записи"""
+        handler = FileHandlerJSONL(temp_file)
+        handler.add_vacancy(sample_vacancies[0])
+
+        changed = Vacancy("Senior Python Developer", "Москва", "url", None, "1")
+        result = handler.upsert_vacancies([changed, sample_vacancies[1]])
+
+        assert result == {'inserted': 1, 'updated': 1}
+        vacancies = FileHandlerJSONL(temp_file).get_vacancies()
+        assert [(vac.id, vac.name) for vac in vacancies] == [("1", "Senior Python Developer"), ("2", "Java Developer")]
+
+        # Повторная синхронизация без изменений не дописывает строки
+        with open(temp_file, encoding='utf-8') as f:
+            lines = f.readlines()
+        assert handler.upsert_vacancies([changed, sample_vacancies[1]]) == {'inserted': 0, 'updated': 0}
+        with open(temp_file, encoding='utf-8') as f:
+            assert f.readlines() == lines
+
+    def test_clear_all(self, temp_file, sample_vacancies):
+        """Тест очистки всех вакансий"""
+        handler = FileHandlerJSONL(temp_file)
+        handler.add_vacancies(sample_vacancies)
+        handler.clear_all()
+
+        assert handler.get_vacancies() == []
+        assert handler.add_vacancy(sample_vacancies[0]) is True
+
+
+class TestFileHandlerSQLite:
+    @pytest.fixture
+    def handler(self, tmp_path):
+        """Фикстура с базой во временной директории"""
+        handler = FileHandlerSQLite(str(tmp_path / 'vacancies.db'))
+        yield handler
+        handler.close()
+
+    @pytest.fixture
+    def sample_vacancies(self):
+        """Фикстура для создания тестовых вакансий"""
+        return [
+            Vacancy(
+                name="Python Developer",
+                city="Москва",
+                url="https://hh.ru/vacancy/1",
+                salary={"from": 100000, "to": 150000, "currency": "RUR"},
+                vacancy_id="1"
+            ),
+            Vacancy(
+                name="Java Developer",
+                city="Санкт-Петербург",
+                url="https://hh.ru/vacancy/2",
+                salary={"from": 120000, "to": 180000, "currency": "RUR"},
+                vacancy_id="2"
+            ),
+            Vacancy(
+                name="Data Scientist",
+                city="Москва",
+                url="https://hh.ru/vacancy/3",
+                salary=None,
+                vacancy_id="3"
+            )
+        ]
+
+    def test_add_and_duplicates(self, handler, sample_vacancies):
+        """Тест добавления вакансий с проверкой дубликатов"""
+        assert handler.add_vacancy(sample_vacancies[0]) is True
+        assert handler.add_vacancy(sample_vacancies[0]) is False
+        assert handler.add_vacancies(sample_vacancies) == 2
+
+        vacancies = handler.get_vacancies()
+        assert [vac.id for vac in vacancies] == ["1", "2", "3"]
+        assert vacancies[0].salary == {"from": 100000, "to": 150000, "currency": "RUR"}
+        assert vacancies[2].salary is None
+
+    def test_get_vacancies_with_filter(self, handler, sample_vacancies):
+        """Тест фильтрации без учета регистра, в том числе кириллицы"""
+        handler.add_vacancies(sample_vacancies)
+
+        assert len(handler.get_vacancies(city="москва")) == 2
+        assert [vac.id for vac in handler.get_vacancies(name="python")] == ["1"]
+        assert handler.get_vacancies(name="developer", city="петербург")[0].id == "2"
+
+    def test_delete_and_clear(self, handler, sample_vacancies):
+        """Тест удаления и очистки"""
+        handler.add_vacancies(sample_vacancies)
+
+        assert handler.delete_vacancy("1") is True
+        assert handler.delete_vacancy("1") is False
+        assert len(handler.get_vacancies()) == 2
+
+        handler.clear_all()
+        assert handler.get_vacancies() == []
+
+    def test_top_by_salary(self, handler, sample_vacancies):
+        """Тест выбора топ вакансий по индексу зарплаты"""
+        handler.add_vacancies(sample_vacancies)
+        handler.add_vacancy(Vacancy("C", "Москва", "c", {"from": None, "to": 400000, "currency": "RUR"}, "4"))
+
+        assert [vac.id for vac in handler.top_by_salary(5)] == ["2", "1"]
+        assert [vac.id for vac in handler.top_by_salary(2, field='mid')] == ["4", "2"]
+        assert handler.top_by_salary(5, currency='USD') == []
+
+    def test_search(self, handler, sample_vacancies):
+        """Тест поиска по словам для хранилища без собственного индекса"""
+        handler.add_vacancies(sample_vacancies)
+
+        assert [vac.id for vac in handler.search("developer москва")] == ["1"]
+        assert [vac.id for vac in handler.search("java data", mode='or')] == ["2", "3"]
+
+    def test_iter_vacancies(self, handler, sample_vacancies):
+        """Тест генератора вакансий из курсора"""
+        handler.add_vacancies(sample_vacancies)
+
+        vacancies = handler.iter_vacancies(city="москва")
+
+        assert next(vacancies).id == "1"
+        assert [vac.id for vac in vacancies] == ["3"]
+
+    def test_upsert_vacancies(self, handler, sample_vacancies):
+        """Тест обновления только измененных строк"""
+        handler.add_vacancies(sample_vacancies[:2])
+
+        changed = Vacancy("Python Developer", "Москва", "https://hh.ru/vacancy/1",
+                          {"from": 300000, "to": None, "currency": "RUR"}, "1")
+        result = handler.upsert_vacancies([changed, sample_vacancies[1], sample_vacancies[2]])
+
+        assert result == {'inserted': 1, 'updated': 1}
+        assert [vac.id for vac in handler.top_by_salary(1)] == ["1"]
+        assert len(handler.get_vacancies()) == 3
+
+    def test_delete_vacancies_and_retain(self, handler, sample_vacancies):
+        """Тест удаления списка вакансий и фильтрации хранилища"""
+        handler.add_vacancies(sample_vacancies)
+
+        assert handler.delete_vacancies(["2", "999"]) == {'removed': 1}
+        removed = handler.retain(lambda vacancy: vacancy.city == "Москва" and vacancy.salary is not None)
+        assert removed == {'removed': 1}
+        assert [vac.id for vac in handler.get_vacancies()] == ["1"]
+
+    def test_exists_and_get_by_id(self, handler, sample_vacancies):
+        """Тест поиска вакансии по первичному ключу"""
+        handler.add_vacancies(sample_vacancies)
+
+        assert handler.exists("2") and not handler.exists("4")
+        assert handler.get_by_id("2").name == "Java Developer"
+        assert handler.get_by_id("4") is None
+
+
+class TestPagination:
+    @pytest.fixture(params=['json', 'json-marshal', 'jsonl', 'sqlite'])
+    def handler(self, request, tmp_path):
+        """Фикстура с хранилищем каждого типа, заполненным 7 вакансиями"""
+        if request.param == 'json':
+            handler = FileHandlerJSON(str(tmp_path / 'vacancies.json'), serializer='json')
+        elif request.param == 'json-marshal':
+            handler = FileHandlerJSON(str(tmp_path / 'vacancies.bin'), serializer='marshal')
+        elif request.param == 'jsonl':
+            handler = FileHandlerJSONL(str(tmp_path / 'vacancies.jsonl'))
+        else:
+            handler = FileHandlerSQLite(str(tmp_path / 'vacancies.db'))
+        handler.add_vacancies([
+            Vacancy(f"Вакансия {i}", "Москва" if i % 2 else "Казань", f"url{i}", None, str(i)) for i in range(7)
+        ])
+        yield handler
+        if request.param == 'sqlite':
+            handler.close()
+
+    def test_limit_offset(self, handler):
+        """Тест выбора части вакансий по limit и offset"""
+        assert [vac.id for vac in handler.get_vacancies(limit=3, offset=2)] == ["2", "3", "4"]
+        assert [vac.id for vac in handler.get_vacancies(offset=5)] == ["5", "6"]
+        assert [vac.id for vac in handler.get_vacancies(limit=2, offset=1, city="москва")] == ["3", "5"]
+        assert handler.count_vacancies() == 7
+        assert handler.count_vacancies(city="казань") == 4
+
+    def test_cursor_pages(self, handler):
+        """Тест обхода всех вакансий страницами по курсору"""
+        pages = []
+        cursor = None
+        while True:
+            vacancies, cursor = handler.get_page(cursor, limit=3)
+            pages.append([vac.id for vac in vacancies])
+            if cursor is None:
+                break
+
+        assert pages == [["0", "1", "2"], ["3", "4", "5"], ["6"]]
+        vacancies, cursor = handler.get_page(limit=2, city="казань")
+        assert [vac.id for vac in vacancies] == ["0", "2"]
+        assert [vac.id for vac in handler.get_page(cursor, limit=2, city="казань")[0]] == ["4", "6"]
+
+    def test_json_page_without_full_load(self, tmp_path):
+        """Тест чтения страниц JSON-файла без загрузки всех вакансий в кэш"""
+        filename = str(tmp_path / 'vacancies.json')
+        FileHandlerJSON(filename, serializer='json').add_vacancies(
+            [Vacancy(f"Вакансия {i}", "Москва", "url", None, str(i)) for i in range(5)]
+        )
+        handler = FileHandlerJSON(filename)
+
+        first, cursor = handler.get_page(limit=2)
+        second, _ = handler.get_page(cursor, limit=2)
+        assert [vac.id for vac in first + second] == ["0", "1", "2", "3"]
+        assert handler.count_vacancies() == 5
+        assert handler._cache_vacancies is None
+
+        # После изменения файла курсор продолжает чтение по номеру вакансии
+        handler.delete_vacancy("0")
+        assert [vac.id for vac in handler.get_page(cursor, limit=2)[0]] == ["3", "4"]
@@ -1,8 +1,9 @@
 import pytest
 import requests
 from unittest.mock import Mock, patch
-from src.hh_api import hh_API
+from src.hh_api import RequestScheduler, TokenBucket, hh_API
 from src.vacancy import Vacancy
+from tests.stub_server import StubHHServer
 
 
 class TestHHAPI:
@@ -155,4 +156,220 @@ class TestHHAPI:
         assert len(vacancies) == 3
         assert vacancies[0].name == "Python Developer"
         assert vacancies[1].name == "Java Developer"
-        assert vacancies[2].name == "Data Scientist"
\ No newline at end of file
+        assert vacancies[2].name == "Data Scientist"
+
+
+class TestHHAPIParallel:
+    @staticmethod
+    def make_response(page, per_page, found):
+        """Ответ API для заданной страницы"""
+        start = page * per_page
+        response = Mock()
+        response.raise_for_status.return_value = None
+        response.json.return_value = {
+            'items': [
+                {
+                    'name': f'Vacancy {i}',
+                    'area': {'name': 'Москва'},
+                    'url': f'https://hh.ru/vacancy/{i}',
+                    'salary': {'from': 100000, 'to': 150000, 'currency': 'RUR'},
+                    'id': str(i)
+                }
+                for i in range(start, min(start + per_page, found))
+            ],
+            'found': found,
+            'pages': (found + per_page - 1) // per_page
+        }
+        return response
+
+    @patch('requests.Session.get')
+    def test_parallel_keeps_page_order(self, mock_get):
+        """Тест сохранения порядка страниц при параллельной загрузке"""
+        mock_get.side_effect = lambda url, params, timeout: self.make_response(
+            params['page'], params['per_page'], 500
+        )
+        api = hh_API(max_workers=4)
+
+        vacancies = api.get_vacancies("Python", 450)
+
+        assert len(vacancies) == 450
+        assert [vac.id for vac in vacancies] == [str(i) for i in range(450)]
+        assert mock_get.call_count == 5
+
+    @patch('requests.Session.get')
+    def test_parallel_limited_by_found(self, mock_get):
+        """Тест остановки на последней доступной странице"""
+        mock_get.side_effect = lambda url, params, timeout: self.make_response(
+            params['page'], params['per_page'], 150
+        )
+        api = hh_API(max_workers=4)
+
+        vacancies = api.get_vacancies("Python", 1000)
+
+        assert len(vacancies) == 150
+        assert mock_get.call_count == 2
+
+    def test_parallel_with_stub_server(self):
+        """Тест параллельной загрузки с локального сервера"""
+        with StubHHServer(found=300) as server:
+            api = hh_API(max_workers=3, base_url=server.url)
+            vacancies = api.get_vacancies("Python", 250)
+
+        assert len(vacancies) == 250
+        assert vacancies[-1].id == '250'
+        assert server.requests_count == 3
+
+
+class FakeClock:
+    """Управляемые часы, sleep сдвигает время без ожидания"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestRequestScheduler:
+    @staticmethod
+    def make_response(status_code, headers=None):
+        """Ответ с заданным кодом и заголовками"""
+        response = Mock()
+        response.status_code = status_code
+        response.headers = headers or {}
+        return response
+
+    def test_token_bucket_limits_rate(self):
+        """Тест ограничения частоты запросов"""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2, capacity=2, clock=clock, sleep=clock.sleep)
+
+        for _ in range(6):
+            bucket.acquire()
+
+        assert clock.now == pytest.approx(2.0)
+
+    def test_retry_after_header(self):
+        """Тест ожидания по заголовку Retry-After"""
+        clock = FakeClock()
+        scheduler = RequestScheduler(rate=100, clock=clock, sleep=clock.sleep)
+        responses = [self.make_response(429, {'Retry-After': '3'}), self.make_response(200)]
+
+        response = scheduler.request(lambda: responses.pop(0))
+
+        assert response.status_code == 200
+        assert 3 in clock.sleeps
+        assert scheduler.retries == 1
+        assert scheduler.throttled == 1
+
+    def test_backoff_on_server_error(self):
+        """Тест экспоненциальной задержки при ошибке сервера"""
+        clock = FakeClock()
+        scheduler = RequestScheduler(rate=100, backoff_base=1, clock=clock, sleep=clock.sleep)
+        responses = [self.make_response(503), self.make_response(503), self.make_response(200)]
+
+        with patch('src.hh_api.random.uniform', side_effect=lambda low, high: high):
+            response = scheduler.request(lambda: responses.pop(0))
+
+        assert response.status_code == 200
+        assert clock.sleeps == [1, 2]
+
+    def test_retries_exhausted(self):
+        """Тест возврата последнего ответа после исчерпания попыток"""
+        clock = FakeClock()
+        scheduler = RequestScheduler(rate=100, max_retries=2, clock=clock, sleep=clock.sleep)
+
+        response = scheduler.request(lambda: self.make_response(503))
+
+        assert response.status_code == 503
+        assert scheduler.retries == 2
+
+    def test_connection_error_retried(self):
+        """Тест повтора при сетевой ошибке"""
+        clock = FakeClock()
+        scheduler = RequestScheduler(rate=100, clock=clock, sleep=clock.sleep)
+        outcomes = [requests.ConnectionError("reset"), self.make_response(200)]
+
+        def send():
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        assert scheduler.request(send).status_code == 200
+
+    def test_rate_halved_on_429_and_restored(self):
+        """Тест снижения частоты при 429 и ее восстановления"""
+        clock = FakeClock()
+        scheduler = RequestScheduler(rate=20, clock=clock, sleep=clock.sleep)
+        responses = [self.make_response(429, {'Retry-After': '0'}), self.make_response(200)]
+
+        scheduler.request(lambda: responses.pop(0))
+        assert scheduler.bucket.rate == 11
+
+        for _ in range(20):
+            scheduler.request(lambda: self.make_response(200))
+        assert scheduler.bucket.rate == 20
+
+    @patch('requests.Session.get')
+    def test_hh_api_retries_throttled_page(self, mock_get):
+        """Тест загрузки страницы после ответа 429"""
+        clock = FakeClock()
+        ok = self.make_response(200)
+        ok.raise_for_status.return_value = None
+        ok.json.return_value = {
+            'items': [{
+                'name': 'Python Developer',
+                'area': {'name': 'Москва'},
+                'url': 'https://hh.ru/vacancy/1',
+                'salary': None,
+                'id': '1'
+            }]
+        }
+        mock_get.side_effect = [self.make_response(429, {'Retry-After': '1'}), ok]
+        api = hh_API(scheduler=RequestScheduler(clock=clock, sleep=clock.sleep))
+
+        vacancies = api.get_vacancies("Python", 1)
+
+        assert [vac.id for vac in vacancies] == ["1"]
+        assert clock.sleeps == [1]
+
+
+class TestHHAPIIterVacancies:
+    def test_iter_vacancies_streams_pages(self):
+        """Тест выдачи вакансий по мере загрузки страниц"""
+        with StubHHServer(found=250) as server:
+            api = hh_API(base_url=server.url)
+            vacancies = api.iter_vacancies("Python", 230)
+
+            first = next(vacancies)
+            assert first.id == '1'
+            rest = list(vacancies)
+
+        assert len(rest) == 229
+        assert rest[-1].id == '230'
+        assert server.requests_count == 3
+
+    def test_iter_vacancies_without_prefetch(self):
+        """Тест последовательной загрузки без упреждения"""
+        with StubHHServer(found=150) as server:
+            api = hh_API(base_url=server.url)
+            vacancies = api.iter_vacancies("Python", 1000, prefetch=False)
+
+            next(vacancies)
+            assert server.requests_count == 1
+            assert len(list(vacancies)) == 149
+
+        assert server.requests_count == 2
+
+    @patch('requests.Session.get')
+    def test_iter_vacancies_stops_on_error(self, mock_get):
+        """Тест остановки при ошибке запроса"""
+        mock_get.side_effect = requests.RequestException("Connection error")
+
+        assert list(hh_API().iter_vacancies("Python", 10)) == []
@@ -0,0 +1,87 @@
+import time
+import pytest
+from src.hh_api import hh_API
+from src.http_cache import ResponseCache
+from tests.stub_server import StubHHServer
+
+
+class TestResponseCache:
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """Фикстура с кэшем во временной директории"""
+        cache = ResponseCache(str(tmp_path / 'cache.db'), ttl=60, max_entries=3)
+        yield cache
+        cache.close()
+
+    def test_make_key(self):
+        """Тест зависимости ключа от параметров, но не от их порядка"""
+        key = ResponseCache.make_key('url', {'text': 'python', 'page': 0})
+
+        assert key == ResponseCache.make_key('url', {'page': 0, 'text': 'python'})
+        assert key != ResponseCache.make_key('url', {'text': 'python', 'page': 1})
+
+    def test_put_and_get(self, cache):
+        """Тест сохранения ответа и счетчиков"""
+        assert cache.get('a') is None
+        cache.put('a', {'items': [1]}, etag='"1"')
+
+        entry = cache.get('a')
+        assert entry.fresh is True
+        assert entry.data == {'items': [1]}
+        assert entry.etag == '"1"'
+        assert cache.stats() == {'hits': 1, 'misses': 1, 'revalidated': 0, 'entries': 1}
+
+    def test_ttl_expired(self, cache):
+        """Тест устаревания ответа по TTL"""
+        cache.ttl = 0
+        cache.put('a', {'items': []})
+
+        assert cache.get('a').fresh is False
+        assert cache.misses == 1
+
+    def test_lru_eviction(self, cache):
+        """Тест вытеснения давно не использованных записей"""
+        for key in ('a', 'b', 'c'):
+            cache.put(key, {})
+            time.sleep(0.01)
+        cache.get('a')
+        cache.put('d', {})
+
+        assert len(cache) == 3
+        assert cache.get('b') is None
+        assert cache.get('a') is not None
+
+    def test_persistent_between_instances(self, tmp_path):
+        """Тест сохранения кэша на диске"""
+        filename = str(tmp_path / 'cache.db')
+        ResponseCache(filename).put('a', {'items': [1]})
+
+        assert ResponseCache(filename).get('a').data == {'items': [1]}
+
+
+class TestHHAPIWithCache:
+    def test_repeated_search_served_from_cache(self, tmp_path):
+        """Тест повторного поиска без обращения к серверу"""
+        cache = ResponseCache(str(tmp_path / 'cache.db'))
+        with StubHHServer(found=250) as server:
+            api = hh_API(base_url=server.url, cache=cache)
+            first = api.get_vacancies("Python", 250)
+            second = api.get_vacancies("Python", 250)
+
+        assert [vac.id for vac in first] == [vac.id for vac in second]
+        assert server.requests_count == 3
+        assert cache.hits == 3
+        assert cache.misses == 3
+
+    def test_conditional_request_after_ttl(self, tmp_path):
+        """Тест подтверждения устаревшего ответа через ETag"""
+        cache = ResponseCache(str(tmp_path / 'cache.db'), ttl=0)
+        with StubHHServer(found=50) as server:
+            api = hh_API(base_url=server.url, cache=cache)
+            api.get_vacancies("Python", 50)
+            vacancies = api.get_vacancies("Python", 50)
+
+        assert len(vacancies) == 50
+        assert server.requests_count == 2
+        assert server.not_modified_count == 1
+        assert cache.revalidated == 1
@@ -0,0 +1,113 @@
+import json
+import os
+import pytest
+from unittest.mock import patch
+from src.file_handler import FileHandlerJSON
+from src.id_index import IdIndex
+from src.vacancy import Vacancy
+
+
+class TestIdIndex:
+    def test_build_and_lookup(self, tmp_path):
+        """Тест поиска смещений по ID в отображенном файле"""
+        filename = str(tmp_path / 'vacancies.idx')
+        IdIndex.build(filename, ((str(i), i * 100, 50 + i) for i in range(1000)), (1, 2, 3))
+
+        index = IdIndex.open(filename, (1, 2, 3))
+        try:
+            assert len(index) == 1000
+            assert index.lookup("0") == (0, 50)
+            assert index.lookup("999") == (99900, 1049)
+            assert "500" in index
+            assert "1000" not in index
+        finally:
+            index.close()
+
+    def test_stale_or_broken_index(self, tmp_path):
+        """Тест отказа от индекса другого файла данных или поврежденного индекса"""
+        filename = str(tmp_path / 'vacancies.idx')
+        IdIndex.build(filename, [("1", 0, 10)], (1, 2, 3))
+
+        assert IdIndex.open(filename, (1, 2, 4)) is None
+        assert IdIndex.open(str(tmp_path / 'missing.idx'), (1, 2, 3)) is None
+        with open(filename, 'r+b') as f:
+            f.truncate(10)
+        assert IdIndex.open(filename, (1, 2, 3)) is None
+
+
+class TestFileHandlerGetById:
+    @pytest.fixture
+    def filename(self, tmp_path):
+        """Фикстура с файлом из 100 вакансий"""
+        filename = str(tmp_path / 'vacancies.json')
+        FileHandlerJSON(filename).add_vacancies(
+            [Vacancy(f"Разработчик {i}", "Москва", f"url {i}", {"from": i, "to": None, "currency": "RUR"}, str(i))
+             for i in range(100)]
+        )
+        return filename
+
+    def test_get_by_id_without_loading_file(self, filename):
+        """Тест чтения одной вакансии по смещению из индекса"""
+        handler = FileHandlerJSON(filename)
+
+        vacancy = handler.get_by_id("42")
+
+        assert (vacancy.name, vacancy.salary_from) == ("Разработчик 42", 42)
+        assert handler.get_by_id("100") is None
+        assert handler.exists("99") and not handler.exists("missing")
+        # Файл данных целиком не разбирался
+        assert handler._cache_data is None
+        assert os.path.exists(filename + '.idx')
+
+    def test_index_rebuilt_after_change(self, filename):
+        """Тест перестроения индекса после изменения файла данных"""
+        handler = FileHandlerJSON(filename)
+        assert handler.exists("5")
+
+        FileHandlerJSON(filename).delete_vacancies(["5"])
+        with open(filename, encoding='utf-8') as f:
+            data = json.load(f)
+        data['items'].insert(0, {'id': 'new', 'name': 'Новая', 'city': 'Казань', 'url': 'url', 'salary': None})
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=4)
+
+        reopened = FileHandlerJSON(filename)
+        assert not reopened.exists("5")
+        assert reopened.get_by_id("new").city == "Казань"
+        assert reopened.get_by_id("77").name == "Разработчик 77"
+
+    def test_add_vacancy_duplicate_check(self, filename):
+        """Тест проверки дубликата при добавлении: по готовому индексу, без построения нового"""
+        assert FileHandlerJSON(filename).add_vacancy(Vacancy("Дубликат", "Москва", "url", None, "3")) is False
+        assert not os.path.exists(filename + '.idx')
+
+        FileHandlerJSON(filename).get_by_id("3")
+        handler = FileHandlerJSON(filename)
+        assert handler.add_vacancy(Vacancy("Дубликат", "Москва", "url", None, "3")) is False
+        assert handler._cache_data is None
+        assert handler.add_vacancy(Vacancy("Новая", "Москва", "url", None, "100")) is True
+        assert handler.get_by_id("100").name == "Новая"
+
+    def test_hash_collision(self, filename):
+        """Тест совпадения хэшей разных ID: новая вакансия не считается дубликатом"""
+        with patch('src.id_index.id_hash', return_value=1):
+            FileHandlerJSON(filename).get_by_id("3")
+            handler = FileHandlerJSON(filename)
+            assert not handler.exists("100")
+
+            handler = FileHandlerJSON(filename)
+            assert handler.add_vacancy(Vacancy("Новая", "Москва", "url", None, "100")) is True
+            assert handler.add_vacancy(Vacancy("Дубликат", "Москва", "url", None, "7")) is False
+
+        assert FileHandlerJSON(filename).get_by_id("100").name == "Новая"
+
+    def test_binary_format_without_index(self, tmp_path):
+        """Тест поиска по ID в двоичном формате через полный разбор"""
+        filename = str(tmp_path / 'vacancies.bin')
+        handler = FileHandlerJSON(filename, serializer='marshal+gzip')
+        handler.add_vacancy(Vacancy("A", "Москва", "url", None, "1"))
+
+        reopened = FileHandlerJSON(filename)
+        assert reopened.get_by_id("1").name == "A"
+        assert not reopened.exists("2")
+        assert not os.path.exists(filename + '.idx')
@@ -0,0 +1,70 @@
+import json
+import os
+import pytest
+from src.json_stream import iter_items
+
+DATA_FILE = os.path.join(os.path.dirname(__file__), '..', 'data', 'vacancies.json')
+
+
+class TestIterItems:
+    @pytest.fixture
+    def write_json(self, tmp_path):
+        """Фикстура для записи JSON во временный файл"""
+        def write(text):
+            filename = tmp_path / 'data.json'
+            filename.write_text(text, encoding='utf-8')
+            return str(filename)
+        return write
+
+    @pytest.mark.parametrize('chunk_size', [1, 3, 7, 1 << 16])
+    def test_matches_json_load(self, chunk_size):
+        """Тест совпадения результата с json.load при любом размере блока"""
+        with open(DATA_FILE, encoding='utf-8') as f:
+            expected = json.load(f)['items']
+
+        assert list(iter_items(DATA_FILE, chunk_size=chunk_size)) == expected
+
+    def test_skips_other_fields(self, write_json):
+        """Тест пропуска полей перед массивом items"""
+        filename = write_json('{"found": 12345, "meta": {"a": [1, 2]}, "items": [{"id": "1"}, {"id": "2"}]}')
+
+        assert list(iter_items(filename, chunk_size=2)) == [{'id': '1'}, {'id': '2'}]
+
+    def test_number_on_chunk_boundary(self, write_json):
+        """Тест числа, разрезанного границей блока"""
+        filename = write_json('{"items": [123456789, 42]}')
+
+        assert list(iter_items(filename, chunk_size=13)) == [123456789, 42]
+
+    def test_empty_and_missing_items(self, write_json):
+        """Тест пустого массива и объекта без items"""
+        assert list(iter_items(write_json('{"items": []}'))) == []
+        assert list(iter_items(write_json('{}'))) == []
+        assert list(iter_items(write_json('{"pages": 1}'))) == []
+
+    def test_malformed_file(self, write_json):
+        """Тест ошибки при поврежденном файле"""
+        filename = write_json('{"items": [{"id": "1"}, {"id": ')
+
+        with pytest.raises(ValueError):
+            list(iter_items(filename))
+
+    @pytest.mark.parametrize('chunk_size', [1, 7, 1 << 16])
+    def test_spans(self, chunk_size):
+        """Тест границ элементов в байтах для файла с кириллицей"""
+        with open(DATA_FILE, 'rb') as f:
+            raw = f.read()
+
+        for item, offset, length in iter_items(DATA_FILE, chunk_size=chunk_size, spans=True):
+            assert json.loads(raw[offset:offset + length]) == item
+
+    @pytest.mark.parametrize('chunk_size', [5, 1 << 16])
+    def test_resume_from_offset(self, chunk_size):
+        """Тест продолжения чтения с конца ранее прочитанного элемента"""
+        items = list(iter_items(DATA_FILE, spans=True))
+        _, offset, length = items[1]
+
+        resumed = list(iter_items(DATA_FILE, chunk_size=chunk_size, start=offset + length, spans=True))
+
+        assert resumed == items[2:]
+        assert list(iter_items(DATA_FILE, start=items[-1][1] + items[-1][2])) == []
@@ -0,0 +1,89 @@
+import io
+import json
+import pytest
+from unittest.mock import patch
+from src import metrics
+from src.file_handler import FileHandlerJSON
+from src.hh_api import RequestScheduler, hh_API
+from src.vacancy import Vacancy
+from tests.stub_server import StubHHServer
+
+
+class TestMetrics:
+    @pytest.fixture(autouse=True)
+    def clean_registry(self):
+        """Фикстура, сбрасывающая реестр метрик после теста"""
+        yield
+        metrics.registry.enabled = False
+        metrics.registry.reset()
+
+    def test_disabled_by_default(self):
+        """Тест отсутствия замеров при выключенных метриках"""
+        with metrics.measure('block') as m:
+            m.bytes = 10
+        assert not m
+        assert metrics.timed('call')(lambda: 42)() == 42
+        assert metrics.registry.snapshot() == {}
+
+    def test_measure_and_timed(self):
+        """Тест контекстного менеджера и декоратора"""
+        metrics.registry.enabled = True
+
+        @metrics.timed('square')
+        def square(x):
+            return x * x
+
+        assert square(3) == 9 and square(4) == 16
+        with metrics.measure('block') as m:
+            m.bytes = 100
+
+        snapshot = metrics.registry.snapshot()
+        assert snapshot['square']['count'] == 2
+        assert snapshot['block']['bytes'] == 100
+
+    def test_session_hooks(self, tmp_path):
+        """Тест замеров чтения, записи и разбора файла и восстановления методов после сеанса"""
+        original = Vacancy.__dict__['from_dict']
+        filename = str(tmp_path / 'vacancies.json')
+        FileHandlerJSON(filename).add_vacancies([Vacancy("A", "Москва", "url", None, str(i)) for i in range(3)])
+        stream = io.StringIO()
+        output = str(tmp_path / 'metrics.json')
+
+        with metrics.Session(profile=True, memory=True, output=output, stream=stream):
+            handler = FileHandlerJSON(filename)
+            assert len(handler.get_vacancies()) == 3
+            handler.add_vacancy(Vacancy("B", "Москва", "url", None, "9"))
+
+        assert Vacancy.__dict__['from_dict'] is original
+        with open(output, encoding='utf-8') as f:
+            snapshot = json.load(f)['metrics']
+        assert snapshot['vacancy.from_dict']['count'] >= 3
+        assert snapshot['file_json.read']['bytes'] > 0
+        assert snapshot['file_json.parse']['count'] == 1
+        assert snapshot['file_json.write']['bytes'] == snapshot['file_json.serialize']['bytes']
+        assert "МЕТРИКИ" in stream.getvalue() and "Память" in stream.getvalue()
+
+    def test_hh_api_load_page(self):
+        """Тест замеров загрузки страниц HH API"""
+        with StubHHServer(found=150) as server, metrics.Session(stream=io.StringIO()):
+            api = hh_API(base_url=server.url, scheduler=RequestScheduler(rate=1000))
+            assert len(api.get_vacancies('python', 150)) == 150
+            snapshot = metrics.registry.snapshot()
+
+        assert snapshot['hh_api.load_page']['count'] == 2
+        assert snapshot['hh_api.parse']['bytes'] > 0
+
+    def test_enable_from_env(self):
+        """Тест включения метрик переменной окружения"""
+        assert metrics.enable_from_env({}) is None
+        assert metrics.enable_from_env({metrics.ENV_VAR: '0'}) is None
+
+        with patch('src.metrics.atexit.register') as register:
+            session = metrics.enable_from_env({metrics.ENV_VAR: 'profile'})
+        try:
+            assert metrics.registry.enabled and session.profile and not session.memory
+            register.assert_called_once_with(session.stop)
+        finally:
+            session.stream = io.StringIO()
+            session.stop()
+        assert not metrics.registry.enabled
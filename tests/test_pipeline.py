@@ -0,0 +1,92 @@
+import time
+import pytest
+from unittest.mock import Mock
+from src.file_handler import FileHandlerJSON, FileHandlerSQLite
+from src.hh_api import RequestScheduler, hh_API
+from src.pipeline import IngestPipeline
+from src.vacancy import Vacancy
+from tests.stub_server import StubHHServer
+
+
+def make_pages(count, per_page):
+    """Страницы тестовых вакансий"""
+    return [
+        [Vacancy(f"Vacancy {i}", "Москва", f"url {i}", None, str(i))
+         for i in range(page * per_page, (page + 1) * per_page)]
+        for page in range(count)
+    ]
+
+
+class TestIngestPipeline:
+    def test_ingest_from_stub_server(self, tmp_path):
+        """Тест загрузки и сохранения с локального сервера"""
+        handler = FileHandlerJSON(str(tmp_path / 'vacancies.json'))
+        progress = []
+
+        with StubHHServer(found=1000) as server:
+            api = hh_API(base_url=server.url, scheduler=RequestScheduler(rate=1000))
+            stats = IngestPipeline(api, handler, batch_size=300, progress=progress.append).run("Python", 1000)
+
+        assert stats.fetched == 1000
+        assert stats.saved == 1000
+        assert stats.added == 1000
+        assert stats.pages == 10
+        assert stats.batches == 4
+        assert len(progress) == 4
+        assert len(handler.get_vacancies()) == 1000
+
+    def test_ingest_into_sqlite(self, tmp_path):
+        """Тест записи в SQLite из потока конвейера, отличного от создавшего соединение"""
+        handler = FileHandlerSQLite(str(tmp_path / 'vacancies.db'))
+        try:
+            with StubHHServer(found=250) as server:
+                api = hh_API(base_url=server.url, scheduler=RequestScheduler(rate=1000))
+                stats = IngestPipeline(api, handler, batch_size=100).run("Python", 250)
+
+            assert stats.added == 250
+            assert handler.count_vacancies() == 250
+        finally:
+            handler.close()
+
+    def test_backpressure(self):
+        """Тест ожидания загрузчика, когда запись не успевает"""
+        api = Mock()
+        api.iter_pages.return_value = iter(make_pages(5, 10))
+        handler = Mock()
+        handler.add_vacancies.side_effect = lambda batch: time.sleep(0.05) or len(batch)
+
+        stats = IngestPipeline(api, handler, queue_size=1, batch_size=10).run("Python", 50)
+
+        assert stats.saved == 50
+        assert stats.producer_waits > 0
+        assert stats.producer_wait_time > 0
+        assert stats.max_queue_depth == 1
+
+    def test_partial_batch_flushed_on_idle(self):
+        """Тест записи неполной пачки, если новые страницы задерживаются"""
+        pages = make_pages(2, 5)
+        handler = Mock()
+        handler.add_vacancies.side_effect = len
+
+        def slow_pages(keyword, amount):
+            yield pages[0]
+            time.sleep(0.2)
+            yield pages[1]
+
+        api = Mock()
+        api.iter_pages.side_effect = slow_pages
+
+        stats = IngestPipeline(api, handler, batch_size=100, flush_interval=0.05).run("Python", 10)
+
+        assert stats.batches == 2
+        assert handler.add_vacancies.call_args_list[0].args[0] == pages[0]
+
+    def test_writer_error_propagates(self):
+        """Тест передачи ошибки записи вызывающему коду"""
+        api = Mock()
+        api.iter_pages.return_value = iter(make_pages(20, 10))
+        handler = Mock()
+        handler.add_vacancies.side_effect = OSError("disk full")
+
+        with pytest.raises(OSError):
+            IngestPipeline(api, handler, queue_size=1, batch_size=10).run("Python", 200)
@@ -0,0 +1,124 @@
+import pytest
+from src.file_handler import FileHandlerJSON, FileHandlerJSONL, FileHandlerSQLite
+from src.query import Condition, Contains, Eq, In, Not, Prefix, Query, Range
+from src.vacancy import Vacancy
+
+VACANCIES = [
+    Vacancy("Python Developer", "Москва", "url1", {"from": 100000, "to": 150000, "currency": "RUR"}, "1"),
+    Vacancy("Java Developer", "Санкт-Петербург", "url2", {"from": 120000, "to": None, "currency": "RUR"}, "2"),
+    Vacancy("Python Junior", "Казань", "url3", None, "3"),
+    Vacancy("Senior Python", "Москва", "url4", {"from": 3000, "to": 5000, "currency": "USD", "gross": True}, "4"),
+    Vacancy("Team Lead", "Москва", "url5", {"from": 120000, "to": 200000, "currency": "RUR"}, "5"),
+]
+
+
+def ids(vacancies):
+    return [vacancy.id for vacancy in vacancies]
+
+
+class TestQuery:
+    def test_conditions(self):
+        """Тест равенства, диапазона, списка и подстроки"""
+        assert ids(Query(Eq('city', 'Москва')).run(VACANCIES)) == ["1", "4", "5"]
+        assert ids(Query(Range('salary_from', 100000, 120000)).run(VACANCIES)) == ["1", "2", "5"]
+        assert ids(Query(Range('salary_to', low=160000)).run(VACANCIES)) == ["5"]
+        assert ids(Query(In('city', ['Казань', 'Санкт-Петербург'])).run(VACANCIES)) == ["2", "3"]
+        assert ids(Query(Contains('name', 'python')).run(VACANCIES)) == ["1", "3", "4"]
+
+    def test_boolean_operators(self):
+        """Тест AND, OR и NOT"""
+        condition = (Eq('city', 'Москва') & Contains('name', 'python')) | ~Range('salary_from')
+        assert ids(Query(condition).run(VACANCIES)) == ["1", "3", "4"]
+        assert ids(Query().where(Eq('city', 'Москва'), Not(Eq('currency', 'USD'))).run(VACANCIES)) == ["1", "5"]
+
+    def test_order_limit_offset(self):
+        """Тест сортировки с пустыми значениями в конце и постраничной выборки"""
+        query = Query().order_by('salary_from', descending=True)
+        assert ids(query.run(VACANCIES)) == ["2", "5", "1", "4", "3"]
+        assert ids(query.limit(2).offset(1).run(VACANCIES)) == ["5", "1"]
+        assert ids(Query().order_by('salary_to').run(VACANCIES)) == ["4", "1", "5", "2", "3"]
+        assert ids(Query().offset(3).run(VACANCIES)) == ["4", "5"]
+
+    def test_planned_ids(self):
+        """Тест выделения условий на ID для планировщика"""
+        assert Query(Eq('id', '1') & In('id', ['1', '2'])).planned_ids() == {'1'}
+        assert Query(Eq('id', '1') | Eq('id', '2')).planned_ids() is None
+        assert Query().planned_ids() is None
+
+    def test_invalid_query(self):
+        """Тест неизвестного поля и отрицательного limit"""
+        with pytest.raises(ValueError):
+            Eq('salary', 1)
+        with pytest.raises(ValueError):
+            Query().order_by('salary')
+        with pytest.raises(ValueError):
+            Query().limit(-1)
+
+    def test_condition_requires_compile_and_sql(self):
+        """Тест абстрактного условия: подкласс без compile и to_sql не создается"""
+        class Incomplete(Condition):
+            def compile(self):
+                return lambda vacancy: True
+
+        with pytest.raises(TypeError):
+            Incomplete()
+
+    def test_contains_non_string_value(self):
+        """Тест подстроки в строковом поле с числовым значением"""
+        vacancy = Vacancy("Python Developer", "Москва", "url", None, 12345)
+        assert Query(Contains('id', '234')).run([vacancy]) == [vacancy]
+        assert Query(Contains('id', '9')).run([vacancy]) == []
+
+
+class TestSelect:
+    @pytest.fixture(params=['json', 'jsonl', 'sqlite'])
+    def handler(self, request, tmp_path):
+        """Фикстура с заполненным хранилищем каждого типа"""
+        if request.param == 'json':
+            handler = FileHandlerJSON(str(tmp_path / 'vacancies.json'))
+        elif request.param == 'jsonl':
+            handler = FileHandlerJSONL(str(tmp_path / 'vacancies.jsonl'))
+        else:
+            handler = FileHandlerSQLite(str(tmp_path / 'vacancies.db'))
+        handler.add_vacancies(VACANCIES)
+        yield handler
+        if request.param == 'sqlite':
+            handler.close()
+
+    @pytest.mark.parametrize('query', [
+        Query(In('city', ['Москва', 'Казань']) & ~Eq('currency', 'USD')).order_by('salary_mid', descending=True),
+        Query(Contains('name', 'developer') | Range('salary_to', high=5000)).order_by('name').limit(2),
+        Query(Range('salary_mid', 100000)).order_by('salary_to').offset(1),
+        Query(Eq('gross', True) | Eq('id', '3')),
+        Query(Not(Eq('city', 'Москва') | Range('salary_from', 120000))),
+        Query(In('id', ['5', '1', '9'])).limit(5),
+        Query(Prefix('city', 'МОС') | Prefix('name', 'java')).order_by('salary_from'),
+    ])
+    def test_backends_match_in_memory(self, handler, query):
+        """Тест совпадения результатов хранилищ с выполнением запроса в памяти"""
+        assert ids(handler.select(query)) == ids(query.run(VACANCIES))
+
+    def test_json_select_by_id_uses_index(self, tmp_path):
+        """Тест выборки по ID через индекс без загрузки всего файла"""
+        filename = str(tmp_path / 'vacancies.json')
+        FileHandlerJSON(filename, serializer='json').add_vacancies(VACANCIES)
+
+        handler = FileHandlerJSON(filename)
+        assert ids(handler.select(Query(In('id', ['4', '2', '7'])))) == ["2", "4"]
+        assert handler._cache_vacancies is None
+
+    def test_criteria_filter(self, handler):
+        """Тест фильтрации get_vacancies по подстроке через скомпилированное условие"""
+        assert ids(handler.get_vacancies(name='PYTHON', city='моск')) == ["1", "4"]
+        assert ids(handler.iter_vacancies(salary='usd')) == ["4"]
+
+    def test_sqlite_prefix_uses_city_index(self, tmp_path):
+        """Тест выборки по началу названия города через индекс idx_vacancies_city"""
+        handler = FileHandlerSQLite(str(tmp_path / 'vacancies.db'))
+        handler.add_vacancies(VACANCIES)
+        sql, params = Query(Prefix('city', 'моск')).to_sql(handler.QUERY_COLUMNS, handler.SQL_FIELDS)
+        plan = handler._fetch_all(f'EXPLAIN QUERY PLAN SELECT id FROM vacancies WHERE {sql}', params)
+
+        assert 'idx_vacancies_city' in str(plan)
+        assert ids(handler.select(Query(Prefix('city', 'моск')))) == ["1", "4", "5"]
+        handler.close()
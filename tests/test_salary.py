@@ -0,0 +1,160 @@
+import pytest
+from unittest.mock import Mock
+import requests
+from src.file_handler import FileHandlerJSON, FileHandlerSQLite
+from src.salary import HHRatesSource, RatesTable, SalaryNormalizer, StaticRatesSource
+from src.vacancy import Vacancy
+from src.vacancy_table import VacancyTable
+
+RATES = {'RUR': 1.0, 'USD': 0.01, 'EUR': 0.008}
+
+
+class TestRatesTable:
+    def test_cache_with_ttl(self, tmp_path):
+        """Тест кэширования курсов в файле на время ttl"""
+        source = Mock()
+        source.fetch.return_value = RATES
+        now = [1000.0]
+        filename = str(tmp_path / 'rates.json')
+
+        table = RatesTable(source, filename, ttl=60, clock=lambda: now[0])
+        assert table.rates() == RATES
+        assert RatesTable(source, filename, ttl=60, clock=lambda: now[0]).rates() == RATES
+        assert source.fetch.call_count == 1
+
+        now[0] += 61
+        table.rates()
+        assert source.fetch.call_count == 2
+
+    def test_stale_cache_when_source_fails(self, tmp_path, capsys):
+        """Тест использования устаревшего кэша при недоступном источнике"""
+        filename = str(tmp_path / 'rates.json')
+        RatesTable(StaticRatesSource(RATES), filename, clock=lambda: 0).rates()
+
+        source = Mock()
+        source.fetch.side_effect = requests.ConnectionError("нет сети")
+        table = RatesTable(source, filename, ttl=60, clock=lambda: 1000)
+
+        assert table.rates() == RATES
+        assert "Не удалось обновить курсы валют" in capsys.readouterr().out
+
+    def test_hh_source(self):
+        """Тест разбора справочника валют HH API"""
+        session = Mock()
+        session.get.return_value.json.return_value = {
+            'currency': [{'code': 'RUR', 'rate': 1.0}, {'code': 'USD', 'rate': 0.0109}]
+        }
+
+        assert HHRatesSource(session).fetch() == {'RUR': 1.0, 'USD': 0.0109}
+
+
+class TestSalaryNormalizer:
+    @pytest.fixture
+    def normalizer(self, tmp_path):
+        """Фикстура с фиксированными курсами"""
+        return SalaryNormalizer(RatesTable(StaticRatesSource(RATES), str(tmp_path / 'rates.json')))
+
+    def test_convert(self, normalizer):
+        """Тест пересчета в рубли и вычета налога"""
+        assert normalizer.convert(5000, 'USD') == 500000
+        assert normalizer.convert(100000, 'RUR', gross=True) == 87000
+        assert normalizer.convert(100, 'XXX') is None
+        assert SalaryNormalizer(normalizer.rates_table, base='USD').convert(100000, 'RUR') == 1000
+
+    def test_normalize_once(self, normalizer):
+        """Тест однократного пересчета с сохранением в вакансии"""
+        vacancy = Vacancy("A", "Москва", "url", {"from": 1000, "to": 2000, "currency": "EUR", "gross": False}, "1")
+        normalizer.normalize(vacancy)
+        assert vacancy.salary_base == (125000, 250000)
+        assert vacancy.salary_value('mid', normalized=True) == 187500
+
+        vacancy.salary_base = (1, 2)
+        normalizer.normalize(vacancy)
+        assert vacancy.salary_base == (1, 2)
+        vacancy.salary = {"from": 10, "to": None, "currency": "USD"}
+        assert vacancy.salary_base is None
+
+    def test_top_by_salary_across_currencies(self, tmp_path, normalizer):
+        """Тест ранжирования вакансий в разных валютах"""
+        handler = FileHandlerJSON(str(tmp_path / 'vacancies.json'))
+        handler.add_vacancies([
+            Vacancy("Рубли", "Москва", "url", {"from": 300000, "to": None, "currency": "RUR", "gross": True}, "1"),
+            Vacancy("Доллары", "Москва", "url", {"from": 5000, "to": None, "currency": "USD"}, "2"),
+            Vacancy("Евро", "Берлин", "url", {"from": 2000, "to": None, "currency": "EUR"}, "3"),
+        ])
+
+        assert [vac.id for vac in handler.top_by_salary(3)] == ["1", "2", "3"]
+        assert [vac.id for vac in handler.top_by_salary(3, normalizer=normalizer)] == ["2", "1", "3"]
+
+        table = VacancyTable.from_handler(handler, normalizer=normalizer)
+        assert list(table.top(2, field='base_from')) == [1, 0]
+        assert list(table.filter(salary_min=260000, field='base_from')) == [0, 1]
+        assert table.vacancy(2).salary_base == (250000, None)
+
+    def test_cached_vacancies_follow_new_rates(self, tmp_path):
+        """Тест пересчета закэшированных вакансий после обновления устаревших курсов"""
+        source = Mock()
+        source.fetch.return_value = RATES
+        now = [1000.0]
+        normalizer = SalaryNormalizer(RatesTable(source, str(tmp_path / 'rates.json'), ttl=60, clock=lambda: now[0]))
+        handler = FileHandlerJSON(str(tmp_path / 'vacancies.json'))
+        handler.add_vacancies([
+            Vacancy("Рубли", "Москва", "url", {"from": 300000, "to": None, "currency": "RUR"}, "1"),
+            Vacancy("Доллары", "Москва", "url", {"from": 2000, "to": None, "currency": "USD"}, "2"),
+        ])
+        assert [vac.id for vac in handler.top_by_salary(2, normalizer=normalizer)] == ["1", "2"]
+
+        now[0] += 61
+        source.fetch.return_value = {'RUR': 1.0, 'USD': 0.005}
+        top = handler.top_by_salary(2, normalizer=normalizer)
+
+        assert [vac.id for vac in top] == ["2", "1"]
+        assert top[0].salary_base == (400000, None)
+
+    @pytest.mark.parametrize('backend', ['json', 'sqlite'])
+    def test_top_by_salary_without_rates(self, tmp_path, capsys, backend):
+        """Тест вакансий без курса валюты: они идут после пересчитанных, а не пропадают"""
+        if backend == 'json':
+            handler = FileHandlerJSON(str(tmp_path / 'vacancies.json'))
+        else:
+            handler = FileHandlerSQLite(str(tmp_path / 'vacancies.db'))
+        handler.add_vacancies([
+            Vacancy("Рубли", "Москва", "url", {"from": 100000, "to": None, "currency": "RUR"}, "1"),
+            Vacancy("Доллары", "Москва", "url", {"from": 5000, "to": None, "currency": "USD"}, "2"),
+            Vacancy("Евро", "Берлин", "url", {"from": 7000, "to": None, "currency": "EUR"}, "3"),
+        ])
+        offline = SalaryNormalizer(RatesTable(StaticRatesSource({}), str(tmp_path / 'rates.json')))
+
+        top = handler.top_by_salary(3, normalizer=offline)
+        assert [vac.id for vac in top] == ["1", "3", "2"]
+        assert top[0].salary_base == (100000, None)
+        assert "Нет курса для валют: EUR, USD" in capsys.readouterr().out
+        if backend == 'sqlite':
+            handler.close()
+
+    def test_sqlite_top_by_salary_uses_base_columns(self, tmp_path, normalizer):
+        """Тест топа SQLite по сохраненным зарплатам в базовой валюте и их пересчета при смене курсов"""
+        handler = FileHandlerSQLite(str(tmp_path / 'vacancies.db'))
+        handler.add_vacancies([
+            Vacancy("Рубли", "Москва", "url", {"from": 300000, "to": None, "currency": "RUR", "gross": True}, "1"),
+            Vacancy("Доллары", "Москва", "url", {"from": 5000, "to": 6000, "currency": "USD"}, "2"),
+            Vacancy("Евро", "Берлин", "url", {"from": 2000, "to": None, "currency": "EUR"}, "3"),
+            Vacancy("Без зарплаты", "Берлин", "url", None, "4"),
+        ])
+
+        assert [vac.id for vac in handler.top_by_salary(3, normalizer=normalizer)] == ["2", "1", "3"]
+        assert [vac.id for vac in handler.top_by_salary(1, field='mid', normalizer=normalizer)] == ["2"]
+        plan = handler._fetch_all(
+            'EXPLAIN QUERY PLAN SELECT id FROM vacancies WHERE base_from IS NOT NULL ORDER BY base_from DESC LIMIT 1'
+        )
+        assert 'idx_vacancies_base_from' in str(plan)
+
+        handler.add_vacancy(Vacancy("Новая", "Москва", "url", {"from": 400000, "to": None, "currency": "RUR"}, "5"))
+        assert [vac.id for vac in handler.top_by_salary(2, normalizer=normalizer)] == ["2", "5"]
+
+        cheap_dollar = SalaryNormalizer(RatesTable(StaticRatesSource({'RUR': 1.0, 'USD': 0.1, 'EUR': 0.008}),
+                                                   str(tmp_path / 'cheap.json')))
+        top = handler.top_by_salary(2, normalizer=cheap_dollar)
+        assert [vac.id for vac in top] == ["5", "1"]
+        assert top[0].salary_base == (400000, None)
+        handler.close()
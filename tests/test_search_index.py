@@ -0,0 +1,70 @@
+import pytest
+from src.search_index import SearchIndex, normalize, stem, tokenize
+from src.vacancy import Vacancy
+
+
+class TestSearchIndex:
+    @pytest.fixture
+    def sample_vacancies(self):
+        """Фикстура для создания тестовых вакансий"""
+        return [
+            Vacancy("Python Developer", "Москва", "https://hh.ru/vacancy/1", None, "1"),
+            Vacancy("Ведущий разработчик Python", "Санкт-Петербург", "https://hh.ru/vacancy/2", None, "2"),
+            Vacancy("Java разработчики", "Королёв", "https://hh.ru/vacancy/3", None, "3")
+        ]
+
+    def test_normalize(self):
+        """Тест нормализации регистра и буквы ё"""
+        assert normalize("Королёв ЁЖ") == "королев еж"
+
+    def test_tokenize_with_stemming(self):
+        """Тест разбиения на токены со стеммингом"""
+        assert tokenize("Разработчики Python") == ["разработчики", "python"]
+        assert tokenize("Разработчики Python", use_stemming=True) == ["разработчик", "python"]
+        assert stem("ит") == "ит"
+
+    def test_search_and_or(self, sample_vacancies):
+        """Тест поиска по всем и по любым словам"""
+        index = SearchIndex.build(sample_vacancies)
+
+        assert index.search("python") == {"1", "2"}
+        assert index.search("python москва") == {"1"}
+        assert index.search("java москва", mode='or') == {"1", "3"}
+        assert index.search("королев") == {"3"}
+        assert index.search("") == set()
+
+    def test_search_with_stemming(self, sample_vacancies):
+        """Тест поиска с учетом окончаний"""
+        index = SearchIndex.build(sample_vacancies, use_stemming=True)
+
+        assert index.search("разработчик") == {"2", "3"}
+
+    def test_remove(self, sample_vacancies):
+        """Тест инкрементального удаления"""
+        index = SearchIndex.build(sample_vacancies)
+        index.remove("1")
+
+        assert index.search("python") == {"2"}
+        assert index.search("developer") == set()
+        assert len(index) == 2
+
+    def test_save_and_load(self, tmp_path, sample_vacancies):
+        """Тест сохранения и загрузки индекса"""
+        filename = str(tmp_path / 'vacancies.index.json')
+        index = SearchIndex.build(sample_vacancies, use_stemming=True)
+        index.source_stat = (1, 2)
+        index.save(filename)
+
+        loaded = SearchIndex.load(filename)
+        assert loaded.use_stemming is True
+        assert loaded.source_stat == (1, 2)
+        assert loaded.search("разработчик python") == {"2"}
+
+    def test_load_missing_file(self, tmp_path):
+        """Тест загрузки отсутствующего индекса"""
+        assert SearchIndex.load(str(tmp_path / 'missing.json')) is None
+
+    def test_invalid_mode(self, sample_vacancies):
+        """Тест ошибки при неизвестном режиме поиска"""
+        with pytest.raises(ValueError):
+            SearchIndex.build(sample_vacancies).search("python", mode='xor')
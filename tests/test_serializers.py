@@ -0,0 +1,78 @@
+import pytest
+from src.file_handler import FileHandlerJSON
+from src.serializers import SerializationError, get_serializer, loads, main, migrate
+from src.vacancy import Vacancy
+
+DATA = {'items': [{'id': '1', 'name': 'Python разработчик', 'city': 'Москва', 'url': 'url',
+                   'salary': {'from': 100000, 'to': None, 'currency': 'RUR', 'gross': True}}]}
+
+
+class TestSerializers:
+    @pytest.mark.parametrize('name', ['json', 'json-compact', 'marshal', 'json-compact+gzip', 'marshal+gzip'])
+    def test_roundtrip_with_autodetect(self, name):
+        """Тест записи в каждом формате и чтения с определением формата"""
+        serializer = get_serializer(name)
+        raw = serializer.dumps(DATA)
+
+        assert serializer.loads(raw) == DATA
+        assert loads(raw) == DATA
+
+    @pytest.mark.parametrize('name', ['json', 'marshal', 'json-compact+gzip', 'marshal+gzip'])
+    def test_corrupted_data(self, name):
+        """Тест единой ошибки SerializationError для поврежденных данных любого формата"""
+        raw = get_serializer(name).dumps(DATA)
+
+        with pytest.raises(SerializationError):
+            loads(raw[:len(raw) // 2])
+        with pytest.raises(SerializationError):
+            loads(raw[:-8] + bytes(8))
+
+    def test_compact_json_is_smaller(self):
+        """Тест размера компактного JSON"""
+        assert len(get_serializer('json-compact').dumps(DATA)) < len(get_serializer('json').dumps(DATA))
+
+    def test_unknown_format(self):
+        """Тест неизвестного формата"""
+        with pytest.raises(ValueError):
+            get_serializer('xml')
+        with pytest.raises(ValueError):
+            get_serializer('json+lzma')
+
+    def test_migrate(self, tmp_path, capsys):
+        """Тест переноса файла в другой формат"""
+        source = str(tmp_path / 'vacancies.json')
+        target = str(tmp_path / 'vacancies.bin')
+        with open(source, 'wb') as f:
+            f.write(get_serializer('json').dumps(DATA))
+
+        assert migrate(source, target, get_serializer('marshal+gzip'))[0] == 1
+        main([target, target, '--format', 'json-compact'])
+
+        with open(target, 'rb') as f:
+            assert loads(f.read()) == DATA
+        assert "Записано вакансий: 1" in capsys.readouterr().out
+
+
+class TestFileHandlerFormats:
+    @pytest.mark.parametrize('name', ['json', 'marshal', 'marshal+gzip'])
+    def test_handler_roundtrip(self, tmp_path, name):
+        """Тест хранилища в двоичном и сжатом формате"""
+        filename = str(tmp_path / 'vacancies.db')
+        handler = FileHandlerJSON(filename, serializer=name)
+        handler.add_vacancies([Vacancy("Python", "Москва", "url", None, str(i)) for i in range(3)])
+
+        reopened = FileHandlerJSON(filename)
+        assert [vac.id for vac in reopened.get_vacancies()] == ["0", "1", "2"]
+        assert [vac.id for vac in FileHandlerJSON(filename).iter_vacancies()] == ["0", "1", "2"]
+
+    def test_format_changes_on_next_write(self, tmp_path):
+        """Тест чтения файла в старом формате и записи в новом"""
+        filename = str(tmp_path / 'vacancies.json')
+        FileHandlerJSON(filename, serializer='json').add_vacancy(Vacancy("A", "Москва", "url", None, "1"))
+
+        handler = FileHandlerJSON(filename, serializer='marshal+gzip')
+        handler.add_vacancy(Vacancy("B", "Москва", "url", None, "2"))
+
+        with open(filename, 'rb') as f:
+            assert f.read(2) == b'\x1f\x8b'
+        assert [vac.id for vac in FileHandlerJSON(filename).get_vacancies()] == ["1", "2"]
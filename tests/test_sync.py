@@ -0,0 +1,95 @@
+from datetime import datetime, timedelta, timezone
+import pytest
+from unittest.mock import patch
+from src.file_handler import FileHandlerJSON
+from src.hh_api import RequestScheduler, hh_API
+from src.sync import SyncState, VacancySync
+from tests.stub_server import StubHHServer, make_item
+
+
+def make_items(start, count, published_at):
+    """Вакансии в формате HH API от новых к старым"""
+    items = [make_item(i) for i in reversed(range(start, start + count))]
+    for item in items:
+        item['published_at'] = published_at
+    return items
+
+
+class TestSyncState:
+    def test_save_and_load(self, tmp_path):
+        """Тест сохранения времени синхронизации по запросам"""
+        filename = str(tmp_path / 'sync_state.json')
+        moment = datetime(2024, 2, 16, 12, 0, tzinfo=timezone.utc)
+        state = SyncState(filename)
+        state.set("Python", moment)
+        state.save()
+
+        loaded = SyncState(filename)
+        assert loaded.get(" python ") == moment
+        assert loaded.get("Java") is None
+        assert loaded.get("Python", {'area': '1'}) is None
+
+    def test_corrupted_file(self, tmp_path):
+        """Тест поврежденного файла состояния"""
+        filename = tmp_path / 'sync_state.json'
+        filename.write_text('{broken', encoding='utf-8')
+
+        assert SyncState(str(filename)).get("Python") is None
+
+
+class TestVacancySync:
+    @pytest.fixture
+    def handler(self, tmp_path):
+        """Фикстура с файлом вакансий во временной директории"""
+        return FileHandlerJSON(str(tmp_path / 'vacancies.json'))
+
+    @pytest.fixture
+    def state(self, tmp_path):
+        """Фикстура с файлом состояния во временной директории"""
+        return SyncState(str(tmp_path / 'sync_state.json'))
+
+    def test_incremental_sync(self, handler, state):
+        """Тест повторной синхронизации: запрашиваются только новые и измененные вакансии"""
+        now = datetime(2024, 2, 16, 12, 0, tzinfo=timezone.utc)
+        items = make_items(0, 250, '2024-02-16T10:00:00+0300')
+
+        with StubHHServer(items=items) as server:
+            api = hh_API(base_url=server.url, scheduler=RequestScheduler(rate=1000))
+            sync = VacancySync(api, handler, state, clock=lambda: now)
+
+            stats = sync.sync("Python")
+            assert (stats.pages, stats.inserted, stats.updated) == (3, 250, 0)
+            assert 'date_from' not in server.last_params
+            assert server.last_params['order_by'] == ['publication_time']
+
+            # Новые вакансии и изменение одной из недавних
+            server.items = make_items(250, 30, '2024-02-16T16:00:00+0300') + items
+            server.items[30]['salary'] = {'from': 1, 'to': 2, 'currency': 'RUR', 'gross': False}
+            server.items[30]['published_at'] = '2024-02-16T16:00:00+0300'
+            requests_before = server.requests_count
+            stats = VacancySync(api, handler, SyncState(state.filename), clock=lambda: now).sync("Python")
+
+        assert server.requests_count - requests_before == 1
+        assert server.last_params['date_from'] == [(now - VacancySync.OVERLAP).isoformat(timespec='seconds')]
+        assert (stats.inserted, stats.updated) == (30, 1)
+        assert (stats.fetched, stats.unchanged) == (31, 0)
+        vacancies = handler.get_vacancies()
+        assert len(vacancies) == 280
+        assert next(vac for vac in vacancies if vac.id == items[0]['id']).salary_from == 1
+
+    def test_stops_on_known_page(self, handler, state):
+        """Тест остановки на первой странице с уже сохраненными вакансиями"""
+        items = make_items(0, 500, '2024-02-16T10:00:00+0300')
+        handler.add_vacancies(hh_API._parse_vacancies({'items': items[150:]}))
+
+        with StubHHServer(items=items) as server:
+            api = hh_API(base_url=server.url, scheduler=RequestScheduler(rate=1000))
+            with patch.object(handler, 'get_by_id', wraps=handler.get_by_id) as get_by_id:
+                stats = VacancySync(api, handler, state).sync("Python")
+
+        # Сохраненные вакансии ищутся только по ID загруженных
+        assert get_by_id.call_count == 200
+        assert server.requests_count == 2
+        assert (stats.pages, stats.inserted) == (2, 150)
+        assert state.get("Python") is not None
+        assert state.get("Python") > datetime.now(timezone.utc) - timedelta(minutes=1)
@@ -67,11 +67,11 @@ class TestUserInterface:
     def test_search_vacancies_success(self, mock_print, mock_input, ui, sample_vacancies):
         """Тест успешного поиска вакансий"""
         mock_input.side_effect = ['Python', '2']
-        ui.hh_api.get_vacancies.return_value = sample_vacancies
+        ui.hh_api.iter_vacancies.return_value = iter(sample_vacancies)
 
         ui.search_vacancies()
 
-        ui.hh_api.get_vacancies.assert_called_once_with("Python", 2)
+        ui.hh_api.iter_vacancies.assert_called_once_with("Python", 2)
         mock_print.assert_any_call("Найдено вакансий: 2")
         assert mock_print.call_count >= 3  # Должны быть вызовы печати
 
@@ -84,7 +84,7 @@ class TestUserInterface:
         ui.search_vacancies()
 
         mock_print.assert_any_call("Запрос не может быть пустым!")
-        ui.hh_api.get_vacancies.assert_not_called()
+        ui.hh_api.iter_vacancies.assert_not_called()
 
     @patch('builtins.input')
     @patch('builtins.print')
@@ -95,7 +95,7 @@ class TestUserInterface:
         ui.search_vacancies()
 
         mock_print.assert_any_call("Пожалуйста, введите число!")
-        ui.hh_api.get_vacancies.assert_not_called()
+        ui.hh_api.iter_vacancies.assert_not_called()
 
     @patch('builtins.input')
     @patch('builtins.print')
@@ -106,14 +106,14 @@ class TestUserInterface:
         ui.search_vacancies()
 
         mock_print.assert_any_call("Количество должно быть положительным числом!")
-        ui.hh_api.get_vacancies.assert_not_called()
+        ui.hh_api.iter_vacancies.assert_not_called()
 
     @patch('builtins.input')
     @patch('builtins.print')
     def test_search_vacancies_no_results(self, mock_print, mock_input, ui):
         """Тест поиска без результатов"""
         mock_input.side_effect = ['Python', '2']
-        ui.hh_api.get_vacancies.return_value = []  # Пустой результат
+        ui.hh_api.iter_vacancies.return_value = iter([])  # Пустой результат
 
         ui.search_vacancies()
 
@@ -124,29 +124,20 @@ class TestUserInterface:
     def test_show_top_vacancies_success(self, mock_print, mock_input, ui, sample_vacancies):
         """Тест показа топ вакансий"""
         mock_input.side_effect = ['2']
-        ui.file_handler.get_vacancies.return_value = sample_vacancies
+        ui.file_handler.top_by_salary.return_value = sample_vacancies[::-1]
 
         ui.show_top_vacancies()
 
-        ui.file_handler.get_vacancies.assert_called_once()
-        mock_print.assert_any_call("Топ-2 вакансий по зарплате:")
+        ui.file_handler.top_by_salary.assert_called_once_with(2, normalizer=ui.salary_normalizer)
+        mock_print.assert_any_call("\nТоп-2 вакансий по зарплате:")
 
     @patch('builtins.input')
     @patch('builtins.print')
     def test_show_top_vacancies_no_salary(self, mock_print, mock_input, ui):
         """Тест показа топ вакансий без зарплаты"""
         mock_input.side_effect = ['2']
-        # Вакансии без зарплаты
-        vacancies_no_salary = [
-            Vacancy(
-                name="Python Developer",
-                city="Москва",
-                url="https://hh.ru/vacancy/1",
-                salary=None,
-                vacancy_id="1"
-            )
-        ]
-        ui.file_handler.get_vacancies.return_value = vacancies_no_salary
+        # Хранилище не нашло вакансий с зарплатой
+        ui.file_handler.top_by_salary.return_value = []
 
         ui.show_top_vacancies()
 
@@ -161,19 +152,19 @@ class TestUserInterface:
         ui.show_top_vacancies()
 
         mock_print.assert_any_call("Пожалуйста, введите число!")
-        ui.file_handler.get_vacancies.assert_not_called()
+        ui.file_handler.top_by_salary.assert_not_called()
 
     @patch('builtins.input')
     @patch('builtins.print')
     def test_search_in_file_success(self, mock_print, mock_input, ui, sample_vacancies):
         """Тест поиска в файле с результатами"""
         mock_input.side_effect = ['Python']
-        ui.file_handler.get_vacancies.return_value = sample_vacancies[:1]  # Только Python разработчик
+        ui.file_handler.search.return_value = sample_vacancies[:1]  # Только Python разработчик
 
         ui.search_in_file()
 
-        ui.file_handler.get_vacancies.assert_called_once_with(name='Python')
-        mock_print.assert_any_call("Найдено вакансий в файле: 1")
+        ui.file_handler.search.assert_called_once_with('Python')
+        mock_print.assert_any_call("\nНайдено вакансий в файле: 1")
 
     @patch('builtins.input')
     @patch('builtins.print')
@@ -184,14 +175,14 @@ class TestUserInterface:
         ui.search_in_file()
 
         mock_print.assert_any_call("Ключевое слово не может быть пустым!")
-        ui.file_handler.get_vacancies.assert_not_called()
+        ui.file_handler.search.assert_not_called()
 
     @patch('builtins.input')
     @patch('builtins.print')
     def test_search_in_file_no_results(self, mock_print, mock_input, ui):
         """Тест поиска в файле без результатов"""
         mock_input.side_effect = ['Python']
-        ui.file_handler.get_vacancies.return_value = []  # Пустой результат
+        ui.file_handler.search.return_value = []  # Пустой результат
 
         ui.search_in_file()
 
@@ -202,21 +193,37 @@ class TestUserInterface:
     def test_save_to_file_success(self, mock_print, mock_input, ui, sample_vacancies):
         """Тест сохранения вакансий в файл"""
         mock_input.side_effect = ['Python', '2']
-        ui.hh_api.get_vacancies.return_value = sample_vacancies
+        ui.hh_api.iter_pages.return_value = iter([sample_vacancies])
         ui.file_handler.add_vacancies.return_value = 2  # Успешно добавлено 2 вакансии
 
         ui.save_to_file()
 
-        ui.hh_api.get_vacancies.assert_called_once_with("Python", 2)
+        ui.hh_api.iter_pages.assert_called_once_with("Python", 2)
         ui.file_handler.add_vacancies.assert_called_once_with(sample_vacancies)
         mock_print.assert_any_call("Успешно сохранено 2 вакансий.")
 
+    @patch('builtins.input')
+    @patch('builtins.print')
+    def test_save_to_file_in_batches(self, mock_print, mock_input, ui, sample_vacancies):
+        """Тест сохранения пачками по мере загрузки"""
+        mock_input.side_effect = ['Python', '3']
+        ui.SAVE_BATCH_SIZE = 2
+        last_page = [Vacancy("Go Developer", "Казань", "https://hh.ru/vacancy/3", None, "3")]
+        ui.hh_api.iter_pages.return_value = iter([sample_vacancies, last_page])
+        ui.file_handler.add_vacancies.side_effect = lambda batch: len(batch)
+
+        ui.save_to_file()
+
+        assert ui.file_handler.add_vacancies.call_count == 2
+        ui.file_handler.add_vacancies.assert_called_with(last_page)
+        mock_print.assert_any_call("Успешно сохранено 3 вакансий.")
+
     @patch('builtins.input')
     @patch('builtins.print')
     def test_save_to_file_no_results(self, mock_print, mock_input, ui):
         """Тест сохранения без результатов"""
         mock_input.side_effect = ['Python', '2']
-        ui.hh_api.get_vacancies.return_value = []  # Пустой результат
+        ui.hh_api.iter_pages.return_value = iter([])  # Пустой результат
 
         ui.save_to_file()
 
@@ -246,6 +253,20 @@ class TestUserInterface:
 
         mock_print.assert_any_call("Вакансия с таким ID не найдена.")
 
+    @patch('src.user_interface.VacancySync')
+    @patch('builtins.input')
+    @patch('builtins.print')
+    def test_sync_vacancies(self, mock_print, mock_input, mock_sync, ui):
+        """Тест инкрементального обновления вакансий"""
+        mock_input.side_effect = ['Python']
+        mock_sync.return_value.sync.return_value = "stats"
+
+        ui.sync_vacancies()
+
+        mock_sync.assert_called_once_with(ui.hh_api, ui.file_handler)
+        mock_sync.return_value.sync.assert_called_once_with('Python')
+        mock_print.assert_any_call("stats")
+
     @patch('builtins.input')
     @patch('builtins.print')
     def test_delete_vacancy_empty_id(self, mock_print, mock_input, ui):
@@ -283,19 +304,38 @@ class TestUserInterface:
     @patch('builtins.print')
     def test_show_all_vacancies_with_data(self, mock_print, mock_input, ui, sample_vacancies):
         """Тест показа всех вакансий с данными"""
-        ui.file_handler.get_vacancies.return_value = sample_vacancies
+        ui.file_handler.count_vacancies.return_value = 2
+        ui.file_handler.get_page.return_value = (sample_vacancies, None)
 
         ui.show_all_vacancies()
 
-        ui.file_handler.get_vacancies.assert_called_once()
-        mock_print.assert_any_call("Всего вакансий в файле: 2")
+        ui.file_handler.get_page.assert_called_once_with(None, ui.PAGE_SIZE)
+        mock_print.assert_any_call("\nВсего вакансий в файле: 2")
 
     @patch('builtins.input')
     @patch('builtins.print')
     def test_show_all_vacancies_empty(self, mock_print, mock_input, ui):
         """Тест показа всех вакансий без данных"""
-        ui.file_handler.get_vacancies.return_value = []  # Пустой файл
+        ui.file_handler.count_vacancies.return_value = 0  # Пустой файл
+
+        ui.show_all_vacancies()
+
+        mock_print.assert_any_call("В файле нет вакансий.")
+        ui.file_handler.get_page.assert_not_called()
+
+    @patch('builtins.input')
+    @patch('builtins.print')
+    def test_show_all_vacancies_paging(self, mock_print, mock_input, ui, sample_vacancies):
+        """Тест перехода по страницам вперед и назад"""
+        ui.PAGE_SIZE = 1
+        ui.file_handler.count_vacancies.return_value = 2
+        ui.file_handler.get_page.side_effect = [
+            ([sample_vacancies[0]], 'c1'), ([sample_vacancies[1]], None), ([sample_vacancies[0]], 'c1')
+        ]
+        mock_input.side_effect = ['n', 'n', 'p', 'q']
 
         ui.show_all_vacancies()
 
-        mock_print.assert_any_call("В файле нет вакансий.")
\ No newline at end of file
+        assert [call.args for call in ui.file_handler.get_page.call_args_list] == [(None, 1), ('c1', 1), (None, 1)]
+        mock_print.assert_any_call("\nСтраница 2 из 2")
+        mock_print.assert_any_call("Неверный выбор. Попробуйте снова.")
\ No newline at end of file
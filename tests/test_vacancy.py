@@ -135,4 +135,61 @@ class TestVacancy:
         assert "Москва" in result
         assert "100000 - 150000 RUR" in result
         assert "https://hh.ru/vacancy/123" in result
-        assert "123" in result
\ No newline at end of file
+        assert "123" in result
+
+    def test_slots_without_dict(self):
+        """Тест отсутствия __dict__ у объекта вакансии"""
+        vacancy = Vacancy("Test", "Test", "test", None, "123")
+
+        assert not hasattr(vacancy, '__dict__')
+        with pytest.raises(AttributeError):
+            vacancy.extra = 1
+
+    def test_normalized_salary_fields(self):
+        """Тест числовых полей зарплаты"""
+        vacancy = Vacancy(
+            name="Test",
+            city="Test",
+            url="test",
+            salary={"from": "100000", "to": None, "currency": "USD", "gross": True},
+            vacancy_id="123"
+        )
+
+        assert vacancy.salary_from == 100000
+        assert vacancy.salary_to is None
+        assert vacancy.currency == "USD"
+        assert vacancy.gross is True
+        assert vacancy.salary == {"from": 100000, "to": None, "currency": "USD", "gross": True}
+
+    def test_salary_fields_without_salary(self):
+        """Тест числовых полей при отсутствии зарплаты"""
+        vacancy = Vacancy("Test", "Test", "test", None, "123")
+
+        assert vacancy.salary_from is None
+        assert vacancy.salary_to is None
+        assert vacancy.currency is None
+        assert vacancy.gross is None
+
+    def test_salary_value(self):
+        """Тест значения зарплаты для сравнения"""
+        vacancy = Vacancy("Test", "Test", "test", {"from": 100000, "to": 200000, "currency": "RUR"}, "123")
+        only_to = Vacancy("Test", "Test", "test", {"to": 200000, "currency": "RUR"}, "124")
+
+        assert vacancy.salary_value() == 100000
+        assert vacancy.salary_value('to') == 200000
+        assert vacancy.salary_value('mid') == 150000
+        assert only_to.salary_value('mid') == 200000
+        with pytest.raises(ValueError):
+            vacancy.salary_value('avg')
+
+    def test_to_dict_from_dict_roundtrip(self):
+        """Тест обратимости to_dict и from_dict"""
+        data = {
+            'name': 'Python Developer',
+            'city': 'Москва',
+            'url': 'https://hh.ru/vacancy/123',
+            'salary': {'from': 100000, 'to': 150000, 'currency': 'RUR', 'gross': False},
+            'id': '123'
+        }
+
+        assert Vacancy.from_dict(data).to_dict() == data
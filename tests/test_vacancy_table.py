@@ -0,0 +1,86 @@
+import pytest
+from src.file_handler import FileHandlerJSON
+from src.vacancy import Vacancy
+from src.vacancy_table import VacancyTable
+
+
+class TestVacancyTable:
+    @pytest.fixture
+    def sample_vacancies(self):
+        """Фикстура для создания тестовых вакансий"""
+        return [
+            Vacancy("Python Developer", "Москва", "https://hh.ru/vacancy/1",
+                    {"from": 100000, "to": 150000, "currency": "RUR"}, "1"),
+            Vacancy("Java Developer", "Санкт-Петербург", "https://hh.ru/vacancy/2",
+                    {"from": 120000, "to": 180000, "currency": "RUR", "gross": True}, "2"),
+            Vacancy("Go Developer", "Москва", "https://hh.ru/vacancy/3",
+                    {"from": 3000, "to": None, "currency": "USD"}, "3"),
+            Vacancy("Data Scientist", "Москва", "https://hh.ru/vacancy/4", None, "4"),
+            Vacancy("QA Engineer", "Казань", "https://hh.ru/vacancy/5",
+                    {"from": None, "to": 90000, "currency": "RUR"}, "5")
+        ]
+
+    @pytest.fixture
+    def table(self, tmp_path, sample_vacancies):
+        """Фикстура с таблицей, загруженной из хранилища"""
+        handler = FileHandlerJSON(str(tmp_path / 'vacancies.json'))
+        handler.add_vacancies(sample_vacancies)
+        return VacancyTable.from_handler(handler)
+
+    def test_columns(self, table):
+        """Тест заполнения колонок и справочников"""
+        assert len(table) == 5
+        assert table.ids == ["1", "2", "3", "4", "5"]
+        assert table.cities == ["Москва", "Санкт-Петербург", "Казань"]
+        assert list(table.city_codes) == [0, 1, 0, 0, 2]
+
+    def test_filter(self, table):
+        """Тест фильтрации по диапазону, городу и валюте"""
+        assert list(table.filter(salary_min=100000)) == [0, 1]
+        assert list(table.filter(salary_min=100000, salary_max=110000)) == [0]
+        assert list(table.filter(city="Москва")) == [0, 2, 3]
+        assert list(table.filter(currency="RUR", field='to', salary_max=150000)) == [0, 4]
+        assert list(table.filter(city="Омск")) == []
+        assert list(table.filter(city="Москва", currency="USD")) == [2]
+        assert list(table.filter(salary_min=3000, city="Москва", currency="RUR")) == [0]
+
+    def test_append_resets_groups(self, table):
+        """Тест обновления строк городов и колонок после добавления вакансии"""
+        assert list(table.filter(city="Казань")) == [4]
+        table.append(Vacancy("DevOps", "Казань", "url", {"from": 200000, "to": None, "currency": "RUR"}, "6"))
+
+        assert list(table.filter(city="Казань")) == [4, 5]
+        assert list(table.top(1)) == [5]
+        assert table.group_by_city()["Казань"] == {'count': 1, 'min': 200000, 'max': 200000, 'mean': 200000}
+
+    def test_top(self, table):
+        """Тест выбора строк с наибольшей зарплатой"""
+        assert list(table.top(2)) == [1, 0]
+        assert list(table.top(5, field='mid')) == [1, 0, 4, 2]
+        assert list(table.top(1, currency="USD")) == [2]
+        assert list(table.top(0)) == []
+
+    def test_percentile(self, table):
+        """Тест процентилей зарплаты"""
+        assert table.percentile(0) == 3000
+        assert table.percentile(100) == 120000
+        assert table.percentile(50, currency="RUR") == 110000
+        assert table.percentile(50, currency="EUR") is None
+        with pytest.raises(ValueError):
+            table.percentile(101)
+
+    def test_group_by_city(self, table):
+        """Тест агрегатов по городам"""
+        stats = table.group_by_city(field='to', currency="RUR")
+
+        assert stats == {
+            "Москва": {'count': 1, 'min': 150000, 'max': 150000, 'mean': 150000},
+            "Санкт-Петербург": {'count': 1, 'min': 180000, 'max': 180000, 'mean': 180000},
+            "Казань": {'count': 1, 'min': 90000, 'max': 90000, 'mean': 90000}
+        }
+
+    def test_vacancies_roundtrip(self, table, sample_vacancies):
+        """Тест восстановления вакансий для выбранных строк"""
+        vacancies = table.vacancies(range(len(table)))
+
+        assert [vac.to_dict() for vac in vacancies] == [vac.to_dict() for vac in sample_vacancies]